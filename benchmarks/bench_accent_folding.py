@@ -0,0 +1,87 @@
+"""
+Benchmark de la normalización sin acentos (`fold_text` en src/utils/text_normalizer.py).
+
+Compara la implementación anterior (NFD del texto completo y un generador que
+descarta las marcas diacríticas carácter a carácter) con la tabla de
+traducción precalculada, sobre data/result.txt: llamada por oración (como la
+usa el clasificador por reglas) y sobre el texto completo repetido 100 veces.
+Comprueba además que ambas producen el mismo resultado.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_accent_folding.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.classifier.rule_based import iter_sentence_spans  # noqa: E402
+from src.utils.text_normalizer import fold_text  # noqa: E402
+
+SAMPLE_PATH = ROOT / "data" / "result.txt"
+
+
+def _legacy_fold(text: str) -> str:
+    """Normalización anterior de `_normalize` en rule_based.py."""
+    text = text.lower()
+    text = unicodedata.normalize("NFD", text)
+    return "".join(ch for ch in text if unicodedata.category(ch) != "Mn")
+
+
+def _rate(func, texts: list, repeat: int) -> dict:
+    size_mb = sum(len(t.encode("utf-8")) for t in texts) / (1024 * 1024)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": round(best, 6), "mb_per_s": round(size_mb / best, 2) if best else None}
+
+
+def run(repeat: int = 5) -> dict:
+    base = SAMPLE_PATH.read_text(encoding="utf-8")
+    inputs = {
+        "oraciones": [base[a:b] for a, b in iter_sentence_spans(base)],
+        "texto_100x": [" ".join([base] * 100)],
+    }
+    report = {}
+    for label, texts in inputs.items():
+        before = _rate(_legacy_fold, texts, repeat)
+        after = _rate(fold_text, texts, repeat)
+        report[label] = {
+            "calls": len(texts),
+            "bytes": sum(len(t.encode("utf-8")) for t in texts),
+            "same_output": all(_legacy_fold(t) == fold_text(t) for t in texts),
+            "before": before,
+            "after": after,
+            "speedup": round(before["seconds"] / after["seconds"], 2) if after["seconds"] else None,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones por medición (se toma la mejor)")
+    parser.add_argument("--json", action="store_true", help="imprime el resultado como JSON")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for label, data in report.items():
+        print(f"== {label} ({data['calls']} llamadas, {data['bytes'] / 1024:.1f} KiB,"
+              f" mismo resultado: {data['same_output']}) ==")
+        print(f"  antes    {data['before']['mb_per_s']:>9} MB/s")
+        print(f"  después  {data['after']['mb_per_s']:>9} MB/s  (x{data['speedup']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Benchmark de extracción por etapas de PDFTextExtractor / PDFTextExtractorEasyOCR.
+
+Ejecuta por separado cada etapa del extractor (metadatos, capa de texto con
+fitz, OCR, tablas, normalización y formateo de tablas) y la extracción completa
+sobre data/PLIEGO-LICO-V-2023-001.pdf y sobre PDFs sintéticos de cientos de
+páginas generados en memoria. Por etapa reporta tiempo de pared, páginas/s y
+pico de memoria residente (RSS), en JSON para comparar entre versiones.
+
+El pico de RSS es por etapa en Linux (se reinicia con /proc/self/clear_refs);
+en otros sistemas es el pico del proceso acumulado hasta el final de la etapa.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_extraction.py [pdf ...] [--synthetic N ...]
+        [--engine tesseract|easyocr] [--ocr-pages N] [--repeat N]
+        [--json] [--output reporte.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import fitz
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.pdf_document import PDFDocument  # noqa: E402
+from src.utils.pdf_extractor import PDFTextExtractor, PDFTextExtractorEasyOCR  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_PDF = ROOT / "data" / "PLIEGO-LICO-V-2023-001.pdf"
+DEFAULT_SYNTHETIC_PAGES = (300,)
+
+_PARAGRAPH = (
+    "La entidad contratante convoca a las personas naturales o jurídicas, nacionales "
+    "o extranjeras, a presentar sus ofertas para la ejecución de la obra descrita en "
+    "el presente pliego. El presupuesto referencial es de USD 1.250.000,00 sin IVA y "
+    "el plazo de ejecución es de 180 días contados desde la fecha de notificación "
+    "de que el anticipo se encuentra disponible. Las ofertas se presentarán de forma "
+    "electrónica a través del Sistema Oficial de Contratación Pública del Ecuador."
+)
+_TABLE_HEADER = ["Ítem", "Descripción", "Unidad", "Cantidad", "P. Unitario", "Total"]
+
+
+class _NoOCRExtractor(PDFTextExtractor):
+    """Extractor sin motor OCR, para medir el resto de etapas si no hay Tesseract."""
+
+    def _setup_ocr_engine(self, tesseract_path=None) -> None:
+        pass
+
+
+def _draw_table(page: "fitz.Page", top: float, rows: int) -> None:
+    """Tabla con bordes (detectable por las estrategias de líneas)."""
+    left, row_h = 60.0, 16.0
+    widths = [40, 200, 50, 60, 70, 70]
+    for r in range(rows + 1):
+        x = left
+        for c, width in enumerate(widths):
+            cell = fitz.Rect(x, top + r * row_h, x + width, top + (r + 1) * row_h)
+            page.draw_rect(cell, color=(0, 0, 0), width=0.5)
+            value = _TABLE_HEADER[c] if r == 0 else (f"{r}" if c == 0 else f"R{r}-{c}")
+            page.insert_text((cell.x0 + 2, cell.y1 - 4), value, fontsize=8)
+            x += width
+
+
+def make_synthetic_pdf(pages: int, table_every: int = 3, scanned_every: int = 10) -> bytes:
+    """
+    PDF sintético tipo pliego: párrafos, una tabla con bordes cada `table_every`
+    páginas y una página escaneada (solo imagen, requiere OCR) cada `scanned_every`.
+    """
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((60, 60), f"SECCIÓN {i + 1}. CONDICIONES PARTICULARES DEL PLIEGO", fontsize=13)
+        page.insert_textbox(fitz.Rect(60, 80, 535, 420), "\n\n".join([_PARAGRAPH] * 3), fontsize=10)
+        if table_every and i % table_every == 0:
+            _draw_table(page, 440, rows=12)
+        page.insert_text((280, 810), f"Página {i + 1} de {pages}", fontsize=8)
+
+        if scanned_every and i % scanned_every == scanned_every - 1:
+            # Sustituir la página por su imagen, como un escaneo
+            pix = page.get_pixmap(dpi=150, colorspace=fitz.csGRAY)
+            doc.delete_page(i)
+            scanned = doc.new_page(pno=i, width=595, height=842)
+            scanned.insert_image(scanned.rect, pixmap=pix)
+    data = doc.tobytes(garbage=3, deflate=True)
+    doc.close()
+    return data
+
+
+def _reset_peak_rss() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB en Linux, bytes en macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _measure(func, repeat: int, pages: int) -> dict:
+    """Mejor tiempo de `repeat` ejecuciones y pico de RSS durante la etapa."""
+    best = float("inf")
+    value = None
+    _reset_peak_rss()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = func()
+            best = min(best, time.perf_counter() - start)
+    except Exception as e:
+        return {"error": repr(e)}, None
+    stats = {
+        "seconds": round(best, 4),
+        "pages": pages,
+        "pages_per_s": round(pages / best, 2) if best else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    return stats, value
+
+
+def _make_extractor(engine: str):
+    try:
+        if engine == "easyocr":
+            return PDFTextExtractorEasyOCR(), None
+        return PDFTextExtractor(), None
+    except Exception as e:
+        return _NoOCRExtractor(), repr(e)
+
+
+def bench_document(name: str, source, extractor, ocr_error, ocr_pages: int, repeat: int) -> dict:
+    """Mide cada etapa sobre un documento (ruta o bytes) con sesiones independientes."""
+    with PDFDocument(source) as session:
+        n_pages = session.page_count
+        ocr_subset = list(range(min(ocr_pages, n_pages)))
+        stages = {}
+        stages["metadata"], _ = _measure(lambda: extractor._extract_metadata(session), repeat, n_pages)
+        stages["fitz_text"], fitz_pages = _measure(lambda: extractor._extract_with_fitz(session),
+                                                   repeat, n_pages)
+        if ocr_error:
+            stages["ocr"] = {"error": ocr_error}
+        elif ocr_subset:
+            stages["ocr"], _ = _measure(lambda: extractor._extract_with_ocr(session, ocr_subset),
+                                        1, len(ocr_subset))
+        stages["tables"], tables = _measure(lambda: extractor._extract_tables_advanced(session),
+                                            repeat, n_pages)
+
+    raw_text = "".join(page["text"] for page in fitz_pages or [])
+    stages["normalization"], _ = _measure(
+        lambda: extractor._clean_text(extractor._process_licitacion_text(raw_text)), repeat, n_pages
+    )
+    stages["table_formatting"], _ = _measure(
+        lambda: extractor._format_tables_for_text(tables or []), repeat, n_pages
+    )
+    # Extracción completa: OCR solo donde la capa de texto no basta (páginas escaneadas)
+    total, _ = _measure(lambda: extractor.extract_text(source), 1, n_pages)
+    return {
+        "name": name,
+        "pages": n_pages,
+        "bytes": len(source) if isinstance(source, bytes) else Path(source).stat().st_size,
+        "tables": len(tables or []),
+        "stages": stages,
+        "total": total,
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(pdfs=(DEFAULT_PDF,), synthetic=DEFAULT_SYNTHETIC_PAGES, engine: str = "tesseract",
+        ocr_pages: int = 5, repeat: int = 3) -> dict:
+    extractor, ocr_error = _make_extractor(engine)
+    documents = [bench_document(Path(pdf).name, str(pdf), extractor, ocr_error, ocr_pages, repeat)
+                 for pdf in pdfs]
+    for pages in synthetic:
+        data = make_synthetic_pdf(pages)
+        documents.append(bench_document(f"synthetic-{pages}p", data, extractor, ocr_error,
+                                        ocr_pages, repeat))
+    return {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "engine": engine,
+        "repeat": repeat,
+        "peak_rss_per_stage": _reset_peak_rss(),
+        "documents": documents,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="*", type=Path, default=[DEFAULT_PDF])
+    parser.add_argument("--synthetic", type=int, nargs="*", default=list(DEFAULT_SYNTHETIC_PAGES),
+                        help="páginas de cada PDF sintético (sin valores: ninguno)")
+    parser.add_argument("--engine", choices=("tesseract", "easyocr"), default="tesseract")
+    parser.add_argument("--ocr-pages", type=int, default=5, help="páginas medidas en la etapa de OCR")
+    parser.add_argument("--repeat", type=int, default=3, help="repeticiones por etapa (se toma la mejor)")
+    parser.add_argument("--json", action="store_true", help="imprime el reporte como JSON")
+    parser.add_argument("--output", type=Path, help="guarda el reporte JSON en este archivo")
+    args = parser.parse_args()
+
+    report = run(args.pdf, args.synthetic, args.engine, args.ocr_pages, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    for doc in report["documents"]:
+        print(f"== {doc['name']} ({doc['pages']} páginas, {doc['tables']} tablas) ==")
+        for stage, stats in list(doc["stages"].items()) + [("total", doc["total"])]:
+            if "error" in stats:
+                print(f"  {stage:<17} error: {stats['error']}")
+                continue
+            print(f"  {stage:<17} {stats['seconds']:9.3f} s  {stats['pages_per_s']:>9} pág/s"
+                  f"  pico RSS {stats['peak_rss_mb']} MB")
+
+
+if __name__ == "__main__":
+    main()
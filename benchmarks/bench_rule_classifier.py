@@ -0,0 +1,104 @@
+"""
+Benchmark del clasificador por reglas (src/classifier/rule_based.py).
+
+Compara oraciones/s de la implementación anterior (recompila los patrones de
+cada keyword y ejecuta un `findall` por keyword en cada llamada) con el índice
+compilado de `KeywordClassifier`, sobre las oraciones de data/result.txt y
+una entrada 20 veces más grande. Comprueba además que ambas asignan la misma
+categoría y las mismas puntuaciones a cada oración.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_rule_classifier.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.classifier.rule_based import (CATEGORY_PRIORITY, KeywordClassifier,  # noqa: E402
+                                       _build_keyword_patterns, _normalize, get_categories)
+
+SAMPLE_PATH = ROOT / "data" / "result.txt"
+
+
+def _legacy_scores(text) -> dict:
+    """Puntuaciones como antes del índice compilado: patrones reconstruidos en cada llamada."""
+    categories = get_categories()
+    norm_text = _normalize(str(text))
+    patterns = _build_keyword_patterns(categories)
+    return {cat: sum(len(pat.findall(norm_text)) for pat in pats) for cat, pats in patterns.items()}
+
+
+def _legacy_classify(text) -> str:
+    scores = _legacy_scores(text)
+    max_score = max(scores.values(), default=0)
+    if max_score == 0:
+        return "OTRO"
+    candidatas = [c for c, s in scores.items() if s == max_score]
+    for cat in CATEGORY_PRIORITY:
+        if cat in candidatas:
+            return cat
+    return sorted(candidatas)[0]
+
+
+def _sentences(text: str) -> list:
+    return [s for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+
+
+def _rate(func, sentences: list, repeat: int) -> dict:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sentence in sentences:
+            func(sentence)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": round(best, 6), "sentences_per_s": round(len(sentences) / best, 1) if best else None}
+
+
+def run(repeat: int = 5) -> dict:
+    base = _sentences(SAMPLE_PATH.read_text(encoding="utf-8"))
+    # Mismo léxico (el del archivo vigente) para ambas implementaciones
+    classifier = KeywordClassifier(get_categories())
+    mismatches = sum(
+        1 for s in base
+        if _legacy_scores(s) != classifier.scores(s) or _legacy_classify(s) != classifier.classify(s)
+    )
+    report = {"sentences": len(base), "mismatches": mismatches, "inputs": {}}
+    for label, factor in (("1x", 1), ("20x", 20)):
+        sentences = base * factor
+        before = _rate(_legacy_classify, sentences, repeat)
+        after = _rate(classifier.classify, sentences, repeat)
+        report["inputs"][label] = {
+            "sentences": len(sentences),
+            "before": before,
+            "after": after,
+            "speedup": round(before["seconds"] / after["seconds"], 2) if after["seconds"] else None,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones por medición (se toma la mejor)")
+    parser.add_argument("--json", action="store_true", help="imprime el resultado como JSON")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['sentences']} oraciones, {report['mismatches']} con resultado distinto")
+    for label, data in report["inputs"].items():
+        print(f"== entrada {label} ({data['sentences']} oraciones) ==")
+        print(f"  antes    {data['before']['sentences_per_s']:>10} oraciones/s")
+        print(f"  después  {data['after']['sentences_per_s']:>10} oraciones/s  (x{data['speedup']})")
+
+
+if __name__ == "__main__":
+    main()
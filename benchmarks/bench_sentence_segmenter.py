@@ -0,0 +1,159 @@
+"""
+Benchmark del segmentador de oraciones del clasificador por reglas.
+
+Compara la segmentación anterior (marcadores §DOT§/§NL§, un `re.sub` por
+abreviatura y pasadas separadas para URLs, correos, siglas y decimales) con
+`iter_sentence_spans`, que recorre el texto una sola vez. Comprueba que ambas
+producen las mismas oraciones en el ejemplo de `test()` y en data/result.txt,
+y mide MB/s sobre data/result.txt y sobre una entrada de ~1 MB.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_sentence_segmenter.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.classifier.rule_based import iter_sentence_spans  # noqa: E402
+
+SAMPLE_PATH = ROOT / "data" / "result.txt"
+TEST_EXAMPLE = (
+    "El contratista deberá cumplir con todas las normas de seguridad."
+    "    El plazo será de 90 días a partir de la firma del contrato. El presupuesto estimado es de $500,000."
+    "    Se solicita presentar póliza de seguro de buena ejecución. La primera entrega parcial será en 30 días hábiles."
+    "    Contacto: soporte@empresa.com o visite https://www.empresa.com/terminos."
+)
+
+
+def _legacy_split(text: str) -> list:
+    """Segmentación anterior: marcadores, una sustitución por abreviatura y dos divisiones."""
+    text = text.strip()
+    if not text:
+        return []
+
+    DOT = "§DOT§"  # marcador temporal para puntos protegidos
+    NL = "§NL§"  # marcador temporal para saltos de línea
+
+    protected = text.replace("\r\n", "\n").replace("\r", "\n")
+    protected = re.sub(r"\n+", f" {NL} ", protected)
+
+    # Proteger URLs y correos (reemplazando los '.' internos)
+    def _protect_dots(m: re.Match) -> str:
+        return m.group(0).replace(".", DOT)
+
+    # URLs con http(s)
+    protected = re.sub(r"https?://\S+", _protect_dots, protected)
+    # Dominios tipo www.
+    protected = re.sub(r"\bwww\.\S+", _protect_dots, protected)
+    # Emails básicos
+    protected = re.sub(r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)+", _protect_dots, protected)
+
+    # Abreviaturas comunes (títulos, compañías y otras)
+    abbreviations = [
+        # Títulos y grados
+        "Dr.", "Dra.", "Sr.", "Sra.", "Ing.", "Lic.", "Arq.",
+        "Phd.", "Ph.D.", "M.Sc.", "MSc.", "Mg.", "Mtr.",
+        # Compañías y razones sociales
+        "S.A.", "S.A.S.", "S.R.L.", "S.L.", "C.A.", "S.A.C.", "C.V.", "Ltd.", "Inc.", "Co.", "Corp.", "Cía.",
+        # Otras comunes
+        "etc.", "Art.", "art.", "No.", "Nº.", "N°.", "a.m.", "p.m.", "p.ej.", "p.e.", "e.g.",
+    ]
+    for abbr in abbreviations:
+        escaped = re.escape(abbr)
+        replacement = abbr.replace(".", DOT)
+        protected = re.sub(escaped, replacement, protected)
+
+    # Proteger siglas con puntos (p. ej., U.S.A., EE.UU., A.B.C.)
+    protected = re.sub(
+        r"(?<!\w)((?:[A-ZÁÉÍÓÚÑ]\.){2,})(?!\w)",
+        lambda m: m.group(1).replace(".", DOT),
+        protected
+    )
+
+    # Proteger números decimales (p. ej., 3.14)
+    protected = re.sub(r"(\d)\.(\d)", r"\1" + DOT + r"\2", protected)
+
+    # Dividir por final de oración: ., ?, ! seguidos de espacio/fin
+    parts = re.split(r"(?<=[.!?])\s+", protected)
+
+    # Dividir adicionalmente por saltos de línea marcados
+    candidates: list[str] = []
+    for part in parts:
+        subparts = re.split(r"\s*" + re.escape(NL) + r"\s*", part)
+        for sp in subparts:
+            s = sp.strip()
+            if s:
+                candidates.append(s)
+
+    # Restaurar puntos
+    sentences: list[str] = []
+    for s in candidates:
+        s = s.replace(DOT, ".").replace(NL, " ").strip()
+        if s:
+            sentences.append(s)
+    return sentences
+
+
+def _split(text: str) -> list:
+    return [text[start:end] for start, end in iter_sentence_spans(text)]
+
+
+def _throughput(func, text: str, repeat: int) -> dict:
+    size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": round(best, 6), "mb_per_s": round(size_mb / best, 2) if best else None}
+
+
+def run(repeat: int = 5) -> dict:
+    base = SAMPLE_PATH.read_text(encoding="utf-8")
+    report = {
+        "same_segmentation": {
+            "test_example": _legacy_split(TEST_EXAMPLE) == _split(TEST_EXAMPLE),
+            "result_txt": _legacy_split(base) == _split(base),
+        },
+        "inputs": {},
+    }
+    # ~1 MB: result.txt repetido en párrafos separados por saltos de línea
+    big = "\n".join([base] * max(1, (1024 * 1024) // len(base.encode("utf-8")) + 1))
+    for label, text in (("result.txt", base), ("1MB", big)):
+        before = _throughput(_legacy_split, text, repeat)
+        after = _throughput(_split, text, repeat)
+        report["inputs"][label] = {
+            "bytes": len(text.encode("utf-8")),
+            "before": before,
+            "after": after,
+            "speedup": round(before["seconds"] / after["seconds"], 2) if after["seconds"] else None,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones por medición (se toma la mejor)")
+    parser.add_argument("--json", action="store_true", help="imprime el resultado como JSON")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"misma segmentación: {report['same_segmentation']}")
+    for label, data in report["inputs"].items():
+        print(f"== {label} ({data['bytes'] / 1024:.1f} KiB) ==")
+        print(f"  antes    {data['before']['mb_per_s']:>9} MB/s")
+        print(f"  después  {data['after']['mb_per_s']:>9} MB/s  (x{data['speedup']})")
+
+
+if __name__ == "__main__":
+    main()
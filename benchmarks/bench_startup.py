@@ -0,0 +1,115 @@
+"""
+Benchmark de arranque: tiempo de importación en frío y memoria en reposo.
+
+Importa cada módulo en un intérprete nuevo (sin cachés de módulos del proceso
+actual) y reporta el tiempo de importación, el RSS del proceso tras importarlo
+y qué backends pesados quedaron cargados (torch, easyocr, pandas, sklearn...).
+Para comparar antes/después, ejecutar en ambas revisiones con --json.
+
+El RSS se lee de /proc/self/status (Linux); en otros sistemas se usa el pico
+de `resource.getrusage`.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_startup.py [modulo ...] [--repeat N] [--json] [--output reporte.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_MODULES = ("src.main", "src.utils.pdf_extractor", "src.classifier.ml_based")
+HEAVY_MODULES = ("torch", "easyocr", "pandas", "sklearn", "scipy", "pdfplumber", "pdfminer",
+                 "pytesseract", "PIL", "joblib", "cv2")
+
+# Se ejecuta en el intérprete hijo; imprime una línea JSON
+_PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+error = None
+try:
+    __import__({module!r})
+except Exception as e:
+    error = repr(e)
+seconds = time.perf_counter() - start
+rss = None
+try:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = round(int(line.split()[1]) / 1024, 1)
+except OSError:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+print(json.dumps({{
+    "seconds": round(seconds, 4),
+    "rss_mb": rss,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+    "error": error,
+}}))
+"""
+
+
+def measure_import(module: str, repeat: int) -> dict:
+    """Mejor tiempo de `repeat` importaciones en frío, cada una en un proceso nuevo."""
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                              cwd=ROOT, capture_output=True, text=True, timeout=600)
+        if proc.returncode != 0:
+            return {"module": module, "error": proc.stderr.strip().splitlines()[-1:]}
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run["seconds"])
+    return {"module": module, **best}
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(modules=DEFAULT_MODULES, repeat: int = 3) -> dict:
+    return {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "modules": [measure_import(module, repeat) for module in modules],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("module", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--repeat", type=int, default=3, help="procesos por módulo (se toma el más rápido)")
+    parser.add_argument("--json", action="store_true", help="imprime el reporte como JSON")
+    parser.add_argument("--output", type=Path, help="guarda el reporte JSON en este archivo")
+    args = parser.parse_args()
+
+    report = run(args.module, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    for result in report["modules"]:
+        if result.get("error"):
+            print(f"{result['module']:<28} error: {result['error']}")
+            continue
+        loaded = ", ".join(result["loaded"]) or "-"
+        print(f"{result['module']:<28} {result['seconds']:8.3f} s  RSS {result['rss_mb']} MB"
+              f"  backends: {loaded}")
+
+
+if __name__ == "__main__":
+    main()
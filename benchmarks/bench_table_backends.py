@@ -0,0 +1,117 @@
+"""
+Comparación de los motores de tablas de PDFTextExtractor (pdfplumber vs PyMuPDF).
+
+Mide el tiempo de `_extract_tables_advanced` con cada motor y genera un reporte
+de concordancia por página: tablas detectadas, tablas con la misma forma
+(filas x columnas), celdas idénticas y similitud media del texto de las celdas.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_table_backends.py [pdf] [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.pdf_document import PDFDocument  # noqa: E402
+from src.utils.pdf_extractor import TABLE_BACKENDS, PDFTextExtractor  # noqa: E402
+
+DEFAULT_PDF = ROOT / "data" / "PLIEGO-LICO-V-2023-001.pdf"
+
+
+class _TablesOnlyExtractor(PDFTextExtractor):
+    """Extractor sin motor OCR: el benchmark solo ejercita la detección de tablas."""
+
+    def _setup_ocr_engine(self, tesseract_path=None) -> None:
+        pass
+
+
+def _run_backend(pdf_path: Path, backend: str, repeat: int):
+    extractor = _TablesOnlyExtractor(table_backend=backend)
+    best = float("inf")
+    tables = []
+    for _ in range(repeat):
+        # Sesión nueva en cada repetición: incluye el parseo propio de cada motor
+        with PDFDocument(str(pdf_path)) as session:
+            start = time.perf_counter()
+            tables = extractor._extract_tables_advanced(session)
+            best = min(best, time.perf_counter() - start)
+    return tables, best
+
+
+def _by_page(tables):
+    pages = defaultdict(list)
+    for table in tables:
+        pages[table['page']].append(table['table'])
+    return pages
+
+
+def _agreement(reference, candidate) -> dict:
+    ref_pages, cand_pages = _by_page(reference), _by_page(candidate)
+    same_shape = cells = equal_cells = 0
+    similarity = 0.0
+    pages = []
+    for page in sorted(set(ref_pages) | set(cand_pages)):
+        ref, cand = ref_pages.get(page, []), cand_pages.get(page, [])
+        if len(ref) != len(cand):
+            pages.append({'page': page, 'pdfplumber': len(ref), 'pymupdf': len(cand)})
+        # Las tablas de una página se emparejan en orden de aparición
+        for ref_table, cand_table in zip(ref, cand):
+            shape_ok = (len(ref_table) == len(cand_table)
+                        and all(len(a) == len(b) for a, b in zip(ref_table, cand_table)))
+            same_shape += shape_ok
+            for ref_row, cand_row in zip(ref_table, cand_table):
+                for a, b in zip(ref_row, cand_row):
+                    cells += 1
+                    equal_cells += a == b
+                    similarity += 1.0 if a == b else SequenceMatcher(None, a, b).ratio()
+    return {
+        'tables': {'pdfplumber': len(reference), 'pymupdf': len(candidate)},
+        'tables_same_shape': same_shape,
+        'cells_compared': cells,
+        'cells_identical_pct': round(100 * equal_cells / cells, 2) if cells else None,
+        'cell_similarity_pct': round(100 * similarity / cells, 2) if cells else None,
+        'pages_with_different_counts': pages,
+    }
+
+
+def run(pdf_path: Path = DEFAULT_PDF, repeat: int = 3) -> dict:
+    results = {backend: _run_backend(pdf_path, backend, repeat) for backend in TABLE_BACKENDS}
+    return {
+        'pdf': pdf_path.name,
+        'timings_s': {backend: round(seconds, 3) for backend, (_, seconds) in results.items()},
+        'agreement': _agreement(results['pdfplumber'][0], results['pymupdf'][0]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--repeat", type=int, default=3, help="repeticiones por motor (se toma la mejor)")
+    parser.add_argument("--json", action="store_true", help="imprime el reporte como JSON")
+    args = parser.parse_args()
+
+    report = run(args.pdf, args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    agreement = report['agreement']
+    print(f"== {report['pdf']} ==")
+    for backend, seconds in report['timings_s'].items():
+        print(f"  {backend:<11} {seconds:7.3f} s  {agreement['tables'][backend]:4d} tablas")
+    print(f"  tablas con la misma forma: {agreement['tables_same_shape']}")
+    print(f"  celdas idénticas: {agreement['cells_identical_pct']}% de {agreement['cells_compared']}")
+    print(f"  similitud media de celdas: {agreement['cell_similarity_pct']}%")
+    for diff in agreement['pages_with_different_counts']:
+        print(f"  página {diff['page']}: pdfplumber={diff['pdfplumber']} pymupdf={diff['pymupdf']}")
+
+
+if __name__ == "__main__":
+    main()
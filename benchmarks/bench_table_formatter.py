@@ -0,0 +1,57 @@
+"""
+Benchmark del formateo de tablas (src/utils/table_formatter.py).
+
+Genera un anexo presupuestario sintético (varias tablas de cientos de filas) y
+mide los microsegundos por fila de cada formato de salida.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_table_formatter.py [--tables N] [--rows N] [--cols N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.table_formatter import TABLE_FORMATS, format_tables  # noqa: E402
+
+
+def _synthetic_tables(n_tables: int, n_rows: int, n_cols: int):
+    header = ["Ítem", "Descripción", "Unidad", "Cantidad", "P. Unitario", "Total"][:n_cols]
+    header += [f"Col {c}" for c in range(len(header), n_cols)]
+    return [
+        {
+            'page': page,
+            'table': [header] + [
+                [f"{r}.{c}" if c == 0 else f"Rubro {r} valor {c}" for c in range(n_cols)]
+                for r in range(n_rows)
+            ],
+        }
+        for page in range(1, n_tables + 1)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones por medición (se toma la mejor)")
+    args = parser.parse_args()
+
+    tables = _synthetic_tables(args.tables, args.rows, args.cols)
+    total_rows = sum(len(t['table']) for t in tables)
+    for table_format in TABLE_FORMATS:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            format_tables(tables, table_format)
+            best = min(best, time.perf_counter() - start)
+        print(f"{table_format:<10} {best / total_rows * 1e6:8.2f} µs/fila  ({best * 1000:.2f} ms, {total_rows} filas)")
+
+
+if __name__ == "__main__":
+    main()
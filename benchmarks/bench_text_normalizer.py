@@ -0,0 +1,75 @@
+"""
+Benchmark del motor de normalización de texto (src/utils/text_normalizer.py).
+
+Mide el throughput en MB/s de cada etapa (filtrado de ruido, corrección +
+estructura y limpieza final) sobre data/result.txt y sobre una entrada 100
+veces más grande.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_text_normalizer.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.text_normalizer import DEFAULT_NORMALIZER  # noqa: E402
+
+SAMPLE_PATH = ROOT / "data" / "result.txt"
+
+
+def _throughput(func, text: str, repeat: int) -> dict:
+    size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": round(best, 6), "mb_per_s": round(size_mb / best, 2) if best else None}
+
+
+def run(repeat: int = 5) -> dict:
+    base = SAMPLE_PATH.read_text(encoding="utf-8")
+    # result.txt es una sola línea; se reparte en líneas para ejercitar los filtros por línea
+    base = base.replace(". ", ".\n")
+    stages = {
+        "filter_noise": DEFAULT_NORMALIZER.filter_noise,
+        "process": DEFAULT_NORMALIZER.process,
+        "clean": DEFAULT_NORMALIZER.clean,
+        "pipeline": lambda t: DEFAULT_NORMALIZER.clean(
+            DEFAULT_NORMALIZER.process(DEFAULT_NORMALIZER.filter_noise(t))
+        ),
+    }
+    report = {}
+    for label, factor in (("1x", 1), ("100x", 100)):
+        text = "\n".join([base] * factor)
+        report[label] = {
+            "bytes": len(text.encode("utf-8")),
+            "stages": {name: _throughput(func, text, repeat) for name, func in stages.items()},
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones por medición (se toma la mejor)")
+    parser.add_argument("--json", action="store_true", help="imprime el resultado como JSON")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for label, data in report.items():
+        print(f"== entrada {label} ({data['bytes'] / 1024:.1f} KiB) ==")
+        for name, stats in data["stages"].items():
+            print(f"  {name:<14} {stats['mb_per_s']:>9} MB/s  ({stats['seconds'] * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ setup(
     url="https://github.com/davexat/HackIAthon_neurobit_licitacion",
     packages=find_packages(),
     include_package_data=True,
+    package_data={"src.classifier": ["lexicon.json"]},
     install_requires=[],
     python_requires=">=3.9",
     classifiers=[
@@ -4,23 +4,21 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
-
-import joblib
-import numpy as np
-import pandas as pd
-from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import (
-    accuracy_score,
-    classification_report,
-    f1_score,
-)
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
-from sklearn.svm import LinearSVC
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+# sklearn, pandas y joblib se importan dentro de las funciones que los usan:
+# importar este módulo (p. ej. desde la API) no debe cargarlos si no se entrena
+# ni se predice con el modelo.
+if TYPE_CHECKING:
+    import numpy as np
+    from sklearn.preprocessing import LabelEncoder
+
+try:
+    from ..utils.text_normalizer import fold_text
+except ImportError:
+    from src.utils.text_normalizer import fold_text
 
 
 # --------------------------------------------------------------------------------------
@@ -30,6 +28,17 @@ from sklearn.svm import LinearSVC
 DEFAULT_MODEL_DIR = Path("models")
 DEFAULT_MODEL_PATH = DEFAULT_MODEL_DIR / "ml_tfidf_logreg.joblib"
 
+# Versión de la limpieza de texto (`clean_text` y stopwords) con la que se entrena el
+# vectorizador; se guarda en el modelo y `load` rechaza los de otra versión, porque su
+# vocabulario no coincide con el texto limpio. Incrementar al cambiar la limpieza.
+# 1: minúsculas con tildes. 2: sin tildes, conserva la ñ (`fold_text`).
+PREPROCESSING_VERSION = 2
+
+
+class ModelVersionError(RuntimeError):
+    """El modelo guardado se entrenó con otra versión de la limpieza de texto."""
+
+
 # Conjunto mínimo de stopwords en español (evita depender de descargas en tiempo de ejecución)
 MIN_ES_STOPWORDS = {
     "a",
@@ -143,8 +152,8 @@ def clean_text(text: str) -> str:
     """
     Limpieza segura:
     - Usa la limpieza del proyecto si está disponible.
-    - Si no, aplica una limpieza básica: minúsculas, quita URLs, menciones,
-      dígitos y puntuación redundante, y colapsa espacios.
+    - Si no, aplica una limpieza básica: minúsculas sin tildes (conserva la ñ),
+      quita URLs, menciones, dígitos y puntuación redundante, y colapsa espacios.
     """
     if _PROJECT_CLEAN_TEXT is not None:
         try:
@@ -156,12 +165,12 @@ def clean_text(text: str) -> str:
     if text is None:
         return ""
     txt = str(text)
-    txt = txt.lower()
+    txt = fold_text(txt, keep_enie=True)
     txt = re.sub(r"https?://\S+|www\.\S+", " ", txt)  # URLs
     txt = re.sub(r"@[A-Za-z0-9_]+", " ", txt)  # menciones
     txt = re.sub(r"#\S+", " ", txt)  # hashtags
     txt = re.sub(r"\d+", " ", txt)  # dígitos
-    txt = re.sub(r"[^\wáéíóúüñ\s]", " ", txt, flags=re.UNICODE)  # puntuación
+    txt = re.sub(r"[^\w\s]", " ", txt)  # puntuación
     txt = re.sub(r"\s+", " ", txt).strip()
     return txt
 
@@ -170,51 +179,73 @@ def clean_text(text: str) -> str:
 # Vectorizador basado en spaCy (opcional)
 # --------------------------------------------------------------------------------------
 
-class SpacyVectorTransformer(BaseEstimator, TransformerMixin):
+@lru_cache(maxsize=None)
+def _spacy_transformer_class() -> type:
     """
-    Transformador sklearn-compatible que convierte textos en embeddings promedio
-    usando un modelo de spaCy con vectores (p. ej., 'es_core_news_md').
+    Crea la clase SpacyVectorTransformer en su primer uso, para heredar de las
+    clases base de sklearn sin importarlo al cargar el módulo.
     """
-    def __init__(self, model_name: str = "es_core_news_md", disable: Optional[List[str]] = None):
-        self.model_name = model_name
-        self.disable = disable or ["parser", "tagger", "attribute_ruler", "lemmatizer", "ner"]
-        self._nlp = None
-        self._dim = None
-
-    def _load(self):
-        if self._nlp is None:
-            try:
-                import spacy
-                self._nlp = spacy.load(self.model_name, disable=self.disable)
-            except Exception as e:
-                raise RuntimeError(
-                    f"No se pudo cargar el modelo de spaCy '{self.model_name}'. "
-                    f"Asegúrate de tenerlo instalado localmente. Error: {e}"
-                ) from e
-            # Determinar dimensión de vectores
-            try:
-                self._dim = self._nlp.vocab.vectors_length
-            except Exception:
-                self._dim = None
-            if not self._dim or self._dim <= 0:
-                # Algunos modelos no traen vectores; abortar
-                raise RuntimeError(
-                    f"El modelo de spaCy '{self.model_name}' no proporciona vectores útiles."
-                )
-
-    def fit(self, X: Iterable[str], y: Optional[Iterable[Any]] = None):
-        self._load()
-        return self
-
-    def transform(self, X: Iterable[str]) -> np.ndarray:
-        self._load()
-        vectors = []
-        for doc in self._nlp.pipe(X, batch_size=64):
-            vec = doc.vector
-            if vec is None or (isinstance(vec, np.ndarray) and vec.size == 0):
-                vec = np.zeros(self._dim, dtype=np.float32)
-            vectors.append(vec)
-        return np.vstack(vectors)
+    from sklearn.base import BaseEstimator, TransformerMixin
+
+    class SpacyVectorTransformer(BaseEstimator, TransformerMixin):
+        """
+        Transformador sklearn-compatible que convierte textos en embeddings promedio
+        usando un modelo de spaCy con vectores (p. ej., 'es_core_news_md').
+        """
+        def __init__(self, model_name: str = "es_core_news_md", disable: Optional[List[str]] = None):
+            self.model_name = model_name
+            self.disable = disable or ["parser", "tagger", "attribute_ruler", "lemmatizer", "ner"]
+            self._nlp = None
+            self._dim = None
+
+        def _load(self):
+            if self._nlp is None:
+                try:
+                    import spacy
+                    self._nlp = spacy.load(self.model_name, disable=self.disable)
+                except Exception as e:
+                    raise RuntimeError(
+                        f"No se pudo cargar el modelo de spaCy '{self.model_name}'. "
+                        f"Asegúrate de tenerlo instalado localmente. Error: {e}"
+                    ) from e
+                # Determinar dimensión de vectores
+                try:
+                    self._dim = self._nlp.vocab.vectors_length
+                except Exception:
+                    self._dim = None
+                if not self._dim or self._dim <= 0:
+                    # Algunos modelos no traen vectores; abortar
+                    raise RuntimeError(
+                        f"El modelo de spaCy '{self.model_name}' no proporciona vectores útiles."
+                    )
+
+        def fit(self, X: Iterable[str], y: Optional[Iterable[Any]] = None):
+            self._load()
+            return self
+
+        def transform(self, X: Iterable[str]) -> "np.ndarray":
+            import numpy as np
+
+            self._load()
+            vectors = []
+            for doc in self._nlp.pipe(X, batch_size=64):
+                vec = doc.vector
+                if vec is None or (isinstance(vec, np.ndarray) and vec.size == 0):
+                    vec = np.zeros(self._dim, dtype=np.float32)
+                vectors.append(vec)
+            return np.vstack(vectors)
+
+    # Nombre de módulo para pickle/joblib (ver `__getattr__`)
+    SpacyVectorTransformer.__module__ = __name__
+    SpacyVectorTransformer.__qualname__ = "SpacyVectorTransformer"
+    return SpacyVectorTransformer
+
+
+def __getattr__(name: str) -> Any:
+    # Los modelos guardados con joblib referencian `ml_based.SpacyVectorTransformer`
+    if name == "SpacyVectorTransformer":
+        return _spacy_transformer_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --------------------------------------------------------------------------------------
@@ -259,6 +290,13 @@ class MLTextClassifier:
         """
         Entrena el clasificador a partir de un CSV con columnas: texto, categoria.
         """
+        import pandas as pd
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import LabelEncoder
+        from sklearn.svm import LinearSVC
+
         dataset_csv = Path(dataset_csv)
         if not dataset_csv.exists():
             raise FileNotFoundError(f"No se encontró el dataset: {dataset_csv}")
@@ -290,13 +328,14 @@ class MLTextClassifier:
         if vectorizer == "tfidf":
             vec = TfidfVectorizer(
                 lowercase=False,  # ya limpiamos a lower
-                stop_words=list(MIN_ES_STOPWORDS),
+                # Misma forma que el texto limpio ("según" -> "segun")
+                stop_words=sorted({fold_text(w, keep_enie=True) for w in MIN_ES_STOPWORDS}),
                 max_features=max_features,
                 ngram_range=ngram_range,
                 sublinear_tf=True,
             )
         elif vectorizer == "spacy":
-            vec = SpacyVectorTransformer(model_name=spacy_model)
+            vec = _spacy_transformer_class()(model_name=spacy_model)
         else:
             raise ValueError("vectorizer debe ser 'tfidf' o 'spacy'")
 
@@ -336,6 +375,7 @@ class MLTextClassifier:
                 "test_size": test_size,
                 "random_state": random_state,
                 "labels": list(le.classes_),
+                "preprocessing_version": PREPROCESSING_VERSION,
             },
         )
 
@@ -381,6 +421,8 @@ class MLTextClassifier:
         """
         Evalúa el modelo actual frente a un CSV con ground truth.
         """
+        import pandas as pd
+
         bundle = self._ensure_loaded()
 
         df = pd.read_csv(dataset_csv)
@@ -413,6 +455,8 @@ class MLTextClassifier:
         """
         Compara métricas entre el modelo ML y el clasificador por reglas.
         """
+        import pandas as pd
+
         # Cargar dataset
         df = pd.read_csv(dataset_csv)
         if text_column not in df.columns or label_column not in df.columns:
@@ -443,6 +487,8 @@ class MLTextClassifier:
     # -------------------- Guardar/Cargar --------------------
 
     def save(self, bundle: ModelBundle, path: Union[str, Path]) -> None:
+        import joblib
+
         path = Path(path)
         _ensure_dir(path)
         payload = {
@@ -455,10 +501,24 @@ class MLTextClassifier:
         joblib.dump(payload, path)
 
     def load(self, path: Optional[Union[str, Path]] = None) -> ModelBundle:
+        """
+        Carga un modelo guardado. Lanza ModelVersionError si se entrenó con otra
+        versión de la limpieza de texto (ver PREPROCESSING_VERSION): hay que
+        reentrenarlo con `train`/`train_from_csv`.
+        """
+        import joblib
+
         model_file = Path(path) if path else self.model_path
         if not model_file.exists():
             raise FileNotFoundError(f"No se encontró el modelo en: {model_file}")
         payload = joblib.load(model_file)
+        # Los modelos anteriores a la versión no la guardaban
+        version = payload.get("metadata", {}).get("preprocessing_version", 1)
+        if version != PREPROCESSING_VERSION:
+            raise ModelVersionError(
+                f"El modelo {model_file} se entrenó con la limpieza de texto v{version} y la "
+                f"actual es v{PREPROCESSING_VERSION}; reentrénelo con train_from_csv."
+            )
         bundle = ModelBundle(
             vectorizer_type=payload["vectorizer_type"],
             vectorizer=payload["vectorizer"],
@@ -488,6 +548,8 @@ def compute_metrics(
     """
     Calcula accuracy y F1 por clase, además de F1 macro.
     """
+    from sklearn.metrics import accuracy_score, classification_report
+
     acc = accuracy_score(y_true, y_pred)
     report = classification_report(
         y_true,
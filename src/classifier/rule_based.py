@@ -1,6 +1,45 @@
+import json
+import os
 import re
-import unicodedata
-from typing import List, Dict
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..utils.text_normalizer import fold_text
+
+# Desempate por prioridad (más específicas primero)
+CATEGORY_PRIORITY = (
+    "GARANTIAS_Y_POLIZAS",
+    "PLAZOS_Y_ENTREGABLES",
+    "CONDICIONES_ECONOMICAS",
+    "REQUISITOS_TECNICOS",
+    "CONDICIONES_LEGALES",
+)
+
+# Flexión plural simple de las keywords de una palabra
+_PLURAL_SUFFIXES = ("", "s", "es")
+_WORD_RE = re.compile(r"\w+")
+# Keywords que se pueden indexar por palabra: palabras separadas por un espacio
+_INDEXABLE_RE = re.compile(r"\w+(?: \w+)*")
+
+# Abreviaturas comunes (títulos, compañías y otras): su punto no cierra la oración
+ABBREVIATIONS = (
+    # Títulos y grados
+    "Dr.", "Dra.", "Sr.", "Sra.", "Ing.", "Lic.", "Arq.",
+    "Phd.", "Ph.D.", "M.Sc.", "MSc.", "Mg.", "Mtr.",
+    # Compañías y razones sociales
+    "S.A.", "S.A.S.", "S.R.L.", "S.L.", "C.A.", "S.A.C.", "C.V.", "Ltd.", "Inc.", "Co.", "Corp.", "Cía.",
+    # Otras comunes
+    "etc.", "Art.", "art.", "No.", "Nº.", "N°.", "a.m.", "p.m.", "p.ej.", "p.e.", "e.g.",
+)
+# Posibles finales de oración: '.', '?' o '!' seguido de espacio, o un salto de línea
+_BOUNDARY_RE = re.compile(r"[.!?](?=\s)|[\r\n]")
+_NON_SPACE_RE = re.compile(r"\S")
+# Siglas con puntos al final de una palabra (p. ej., U.S.A., A.B.C.)
+_ACRONYM_END_RE = re.compile(r"(?<!\w)[A-ZÁÉÍÓÚÑ]\.[A-ZÁÉÍÓÚÑ]\.\Z")
+# Palabras que contienen una URL (con http(s) o tipo www.)
+_URL_RE = re.compile(r"https?://\S|\bwww\.\S")
 
 def test():
     """Prueba de humo: ejecuta la clasificación sobre un texto de ejemplo y muestra resultados."""
@@ -22,40 +61,31 @@ def test():
     except AssertionError:
         print("Aserciones básicas: alguna categoría esperada no se detectó")
 
+# Léxico de categorías en archivo (ver `LexiconWatcher`); RULE_LEXICON_PATH lo reemplaza
+DEFAULT_LEXICON_PATH = Path(__file__).with_name("lexicon.json")
+# Segundos entre revisiones del archivo de léxico
+DEFAULT_LEXICON_CHECK_S = 2.0
+
 def get_categories() -> dict[str, list[str]]:
-    """Devuelve categorías con palabras clave en minúsculas.
-        Nota: se evita duplicar términos entre categorías cuando sea posible.
+    """Devuelve categorías con palabras clave del léxico vigente (ver `get_lexicon_watcher`).
+        El léxico se define solo en el archivo (DEFAULT_LEXICON_PATH o RULE_LEXICON_PATH);
+        se devuelve una copia que se puede modificar sin afectar al clasificador.
         """
-    categories = {
-        "CONDICIONES_LEGALES": [
-            "contratista", "ley", "norma", "garantía", "responsabilidad",
-            "cláusula", "contrato", "incumplimiento",
-        ],
-        "REQUISITOS_TECNICOS": [
-            "plazo", "entrega", "materiales", "especificación", "obra",
-            "técnico", "alcance", "documentación", "procedimiento",
-        ],
-        "CONDICIONES_ECONOMICAS": [
-            "presupuesto", "costo", "pago", "monto", "precio",
-            "tarifa", "anticipo", "factura",
-        ],
-        "GARANTIAS_Y_POLIZAS": [
-            "póliza", "seguro", "fianza", "caución", "aval",
-            "garantía de cumplimiento", "garantía de calidad",
-        ],
-        "PLAZOS_Y_ENTREGABLES": [
-            "entregable", "entregables", "cronograma", "hito", "milestone",
-            "entrega parcial", "fecha de entrega", "vencimiento", "deadline",
-        ],
-    }
-    return categories
+    return {cat: list(keywords) for cat, keywords in get_classifier().keywords.items()}
 
 def _normalize(text: str) -> str:
     """Normaliza texto: minúsculas y sin acentos."""
-    text = text.lower()
-    text = unicodedata.normalize("NFD", text)
-    text = "".join(ch for ch in text if unicodedata.category(ch) != "Mn")
-    return text
+    return fold_text(text)
+
+def _keyword_pattern(nkw: str) -> re.Pattern:
+    """Patrón de una keyword ya normalizada, con límites de palabra."""
+    # Si la keyword tiene espacios (multi-palabra), se busca como frase completa con límites aproximadamente
+    if " " in nkw:
+        # Evitar cortar palabras, permitir espacios múltiples
+        return re.compile(rf"(?<!\w){re.escape(nkw)}(?!\w)")
+    # Coincidencia por palabra con flexión simple plural s/es
+    # Ej.: "precio" -> "precio(s|es)?"
+    return re.compile(rf"\b{re.escape(nkw)}(?:s|es)?\b")
 
 def _build_keyword_patterns(categories: Dict[str, List[str]]) -> Dict[str, List[re.Pattern]]:
     """Construye patrones por categoría con límites de palabra y flexión simple (s/es)."""
@@ -69,58 +99,229 @@ def _build_keyword_patterns(categories: Dict[str, List[str]]) -> Dict[str, List[
             nkw = _normalize(kw).strip()
             if not nkw:
                 continue
-            # Si la keyword tiene espacios (multi-palabra), se busca como frase completa con límites aproximadamente
-            if " " in nkw:
-                # Evitar cortar palabras, permitir espacios múltiples
-                pat = re.compile(rf"(?<!\w){re.escape(nkw)}(?!\w)")
-            else:
-                # Coincidencia por palabra con flexión simple plural s/es
-                # Ej.: "precio" -> "precio(s|es)?"
-                pat = re.compile(rf"\b{re.escape(nkw)}(?:s|es)?\b")
-            pats.append(pat)
+            pats.append(_keyword_pattern(nkw))
         patterns[cat] = pats
     return patterns
 
+class KeywordClassifier:
+    """Clasificador por palabras clave compilado una sola vez.
+
+    Las keywords formadas por palabras separadas por un espacio se indexan por
+    palabra (con sus formas plurales s/es si son de una sola palabra): una única
+    pasada por las palabras del texto normalizado encuentra las coincidencias de
+    todas las categorías. Las keywords con otros caracteres conservan su regex.
+    Cuenta exactamente lo mismo que los patrones de `_build_keyword_patterns`.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]],
+                 priority: Sequence[str] = CATEGORY_PRIORITY, version: Any = None):
+        self.categories = list(categories)
+        # Keywords originales por categoría (ver `get_categories`)
+        self.keywords = {cat: list(keywords) for cat, keywords in categories.items()}
+        self.priority = tuple(priority)
+        # Versión del léxico del que se compiló (None si no viene de un archivo)
+        self.version = version
+        # Categoría (índice) de cada keyword compilada
+        self._keyword_category: List[int] = []
+        # Forma de una palabra -> keywords de una palabra que coinciden con ella
+        self._words: Dict[str, List[int]] = {}
+        # Primera palabra -> (keyword, palabras) de las keywords de varias palabras
+        self._phrases: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = {}
+        self._patterns: List[Tuple[int, re.Pattern]] = []
+        for index, keywords in enumerate(categories.values()):
+            for kw in keywords:
+                nkw = _normalize(kw).strip() if kw else ""
+                if not nkw:
+                    continue
+                kid = len(self._keyword_category)
+                self._keyword_category.append(index)
+                if not _INDEXABLE_RE.fullmatch(nkw):
+                    self._patterns.append((kid, _keyword_pattern(nkw)))
+                elif " " in nkw:
+                    words = tuple(nkw.split(" "))
+                    self._phrases.setdefault(words[0], []).append((kid, words))
+                else:
+                    for suffix in _PLURAL_SUFFIXES:
+                        self._words.setdefault(nkw + suffix, []).append(kid)
+
+    def scores(self, text) -> Dict[str, int]:
+        """Coincidencias por categoría en el texto (normalizado a minúsculas sin acentos)."""
+        norm_text = _normalize(str(text))
+        counts = [0] * len(self.categories)
+        categories = self._keyword_category
+        tokens = [(m.start(), m.end(), m.group()) for m in _WORD_RE.finditer(norm_text)]
+        # Fin de la última coincidencia de cada frase: como `findall`, sin solapes consigo misma
+        phrase_end: Dict[int, int] = {}
+        for i, (start, _, word) in enumerate(tokens):
+            for kid in self._words.get(word, ()):
+                counts[categories[kid]] += 1
+            for kid, words in self._phrases.get(word, ()):
+                end = _match_phrase(norm_text, tokens, i, words)
+                if end is not None and start >= phrase_end.get(kid, 0):
+                    phrase_end[kid] = end
+                    counts[categories[kid]] += 1
+        for kid, pat in self._patterns:
+            counts[categories[kid]] += len(pat.findall(norm_text))
+        return dict(zip(self.categories, counts))
+
+    def classify(self, text) -> str:
+        """Categoría con más coincidencias; desempate por `priority` y 'OTRO' si no hay ninguna."""
+        scores = self.scores(text)
+        max_score = max(scores.values(), default=0)
+        # Si nadie tiene puntuación, OTRO
+        if max_score == 0:
+            return "OTRO"
+        candidatas = [c for c, s in scores.items() if s == max_score]
+        if len(candidatas) == 1:
+            return candidatas[0]
+        for cat in self.priority:
+            if cat in candidatas:
+                return cat
+        # Fallback determinista
+        return sorted(candidatas)[0]
+
+def _match_phrase(text: str, tokens: List[Tuple[int, int, str]], i: int,
+                  words: Tuple[str, ...]) -> Optional[int]:
+    """Fin de la frase `words` si empieza en la palabra `i` (separada por espacios simples)."""
+    if i + len(words) > len(tokens):
+        return None
+    prev_end = tokens[i][1]
+    for offset in range(1, len(words)):
+        start, end, word = tokens[i + offset]
+        if word != words[offset] or start != prev_end + 1 or text[prev_end] != " ":
+            return None
+        prev_end = end
+    return prev_end
+
+def load_lexicon(path: Union[str, Path]) -> KeywordClassifier:
+    """Compila el léxico de `path`: JSON, o YAML (requiere PyYAML) si termina en .yaml/.yml.
+
+    El archivo es un objeto con 'version' (identifica la revisión del léxico),
+    'categories' (categoría -> lista de keywords) y, opcionalmente, 'priority'
+    (orden de desempate; por defecto CATEGORY_PRIORITY). Lanza ValueError si
+    el contenido no tiene esa forma.
+    """
+    path = Path(path)
+    raw = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".yaml", ".yml"):
+        import yaml  # Solo para léxicos en YAML
+        data = yaml.safe_load(raw)
+    else:
+        data = json.loads(raw)
+
+    if not isinstance(data, dict) or "version" not in data:
+        raise ValueError(f"{path}: el léxico debe ser un objeto con 'version' y 'categories'")
+    categories = data.get("categories")
+    if not isinstance(categories, dict) or not categories:
+        raise ValueError(f"{path}: 'categories' debe ser un objeto categoría -> keywords no vacío")
+    for cat, keywords in categories.items():
+        if cat == "OTRO":
+            raise ValueError(f"{path}: 'OTRO' está reservada para textos sin coincidencias")
+        if not isinstance(keywords, list) or not all(isinstance(kw, str) for kw in keywords):
+            raise ValueError(f"{path}: las keywords de {cat!r} deben ser una lista de textos")
+    priority = data.get("priority", list(CATEGORY_PRIORITY))
+    if not isinstance(priority, list) or not all(isinstance(cat, str) for cat in priority):
+        raise ValueError(f"{path}: 'priority' debe ser una lista de categorías")
+    return KeywordClassifier(categories, priority, version=data["version"])
+
+class LexiconWatcher:
+    """Clasificador compilado del archivo de léxico, recompilado cuando el archivo cambia.
+
+    `get()` revisa el archivo (mtime, tamaño e inodo) como mucho una vez cada
+    `check_interval` segundos y solo lo recompila si cambió. Un único hilo
+    recompila mientras los demás siguen usando el clasificador vigente; el nuevo
+    se publica reemplazando la referencia, así que cada llamada ve un léxico
+    completo. Si el archivo no existe o no es válido se informa una vez por
+    cambio y se conserva el clasificador vigente; en la primera carga se lanza el error.
+    """
+
+    def __init__(self, path: Union[str, Path], check_interval: float = DEFAULT_LEXICON_CHECK_S):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._classifier: Optional[KeywordClassifier] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._next_check = 0.0
+        self._loads = 0
+
+    @property
+    def loads(self) -> int:
+        """Veces que se compiló el archivo de léxico."""
+        return self._loads
+
+    def get(self) -> KeywordClassifier:
+        """Clasificador vigente, recompilado antes si el archivo cambió."""
+        if self._classifier is None:
+            # Primera carga: los demás hilos esperan a que termine
+            with self._lock:
+                if self._classifier is None:
+                    self._refresh()
+        elif time.monotonic() >= self._next_check and self._lock.acquire(blocking=False):
+            try:
+                self._refresh()
+            finally:
+                self._lock.release()
+        return self._classifier
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _refresh(self) -> None:
+        """Recompila el léxico si el archivo cambió desde la última revisión (con `_lock` tomado)."""
+        self._next_check = time.monotonic() + self.check_interval
+        stamp = self._file_stamp()
+        if self._classifier is not None and stamp == self._stamp:
+            return
+        self._stamp = stamp
+        try:
+            if stamp is None:
+                raise FileNotFoundError(f"no existe {self.path}")
+            classifier = load_lexicon(self.path)
+        except Exception as e:
+            print(f"[LEXICON WARN] No se pudo cargar el léxico {self.path}: {e}")
+            if self._classifier is None:
+                raise
+            return
+        self._classifier = classifier
+        self._loads += 1
+
+_lexicon_watcher: Optional[LexiconWatcher] = None
+_lexicon_watcher_lock = threading.Lock()
+
+def get_lexicon_watcher() -> LexiconWatcher:
+    """Watcher del léxico compartido por el proceso; se crea en la primera llamada.
+
+    El archivo se toma de RULE_LEXICON_PATH (por defecto DEFAULT_LEXICON_PATH) y
+    el intervalo de revisión de RULE_LEXICON_CHECK_S. El archivo es la única
+    definición del léxico: si la primera carga falla se lanza el error.
+    """
+    global _lexicon_watcher
+    watcher = _lexicon_watcher
+    if watcher is None:
+        with _lexicon_watcher_lock:
+            if _lexicon_watcher is None:
+                _lexicon_watcher = LexiconWatcher(
+                    os.getenv("RULE_LEXICON_PATH", DEFAULT_LEXICON_PATH),
+                    check_interval=float(os.getenv("RULE_LEXICON_CHECK_S", DEFAULT_LEXICON_CHECK_S)),
+                )
+            watcher = _lexicon_watcher
+    return watcher
+
+def get_classifier() -> KeywordClassifier:
+    """Clasificador compilado del léxico vigente (ver `get_lexicon_watcher`)."""
+    return get_lexicon_watcher().get()
+
 def classify_text(text) -> str:
     """Clasifica un texto basado en palabras clave, con normalización y coincidencia por palabra.
     - Normaliza a minúsculas sin acentos.
-    - Cuenta coincidencias por categoría con patrones regex.
+    - Cuenta coincidencias por categoría con el índice compilado (ver `KeywordClassifier`).
     - Desempate mediante prioridad fija de categorías.
     """
-    categories = get_categories()
-    norm_text = _normalize(str(text))
-    patterns = _build_keyword_patterns(categories)
-
-    scores = {categoria: 0 for categoria in categories}
-    for categoria, pats in patterns.items():
-        for pat in pats:
-            # count non-overlapping matches
-            matches = pat.findall(norm_text)
-            if matches:
-                scores[categoria] += len(matches)
-
-    # Si nadie tiene puntuación, OTRO
-    max_cat = max(scores, key=scores.get) if scores else None
-    if not max_cat or scores[max_cat] == 0:
-        return "OTRO"
-
-    # Desempate por prioridad (más específicas primero)
-    prioridad = [
-        "GARANTIAS_Y_POLIZAS",
-        "PLAZOS_Y_ENTREGABLES",
-        "CONDICIONES_ECONOMICAS",
-        "REQUISITOS_TECNICOS",
-        "CONDICIONES_LEGALES",
-    ]
-    max_score = max(scores.values())
-    candidatas = [c for c, s in scores.items() if s == max_score]
-    if len(candidatas) == 1:
-        return candidatas[0]
-    for cat in prioridad:
-        if cat in candidatas:
-            return cat
-    # Fallback determinista
-    return sorted(candidatas)[0]
+    return get_classifier().classify(text)
 
 def classify_paragraph(paragraph) -> list:
     """Divide un párrafo en oraciones considerando abreviaturas/siglas, URLs y correos,
@@ -129,72 +330,123 @@ def classify_paragraph(paragraph) -> list:
     """
     if paragraph is None:
         return []
+    text = str(paragraph)
+    sentences = (text[a:b] for a, b in iter_sentence_spans(text))
+    return [{"texto": s, "categoria": classify_text(s)} for s in sentences]
 
-    text = str(paragraph).strip()
-    if not text:
-        return []
+def iter_sentence_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """Posiciones [inicio, fin) de cada oración de `text`, en orden, en una sola pasada.
 
-    DOT = "§DOT§"  # marcador temporal para puntos protegidos
-    NL = "§NL§"  # marcador temporal para saltos de línea
-
-    protected = text.replace("\r\n", "\n").replace("\r", "\n")
-    protected = re.sub(r"\n+", f" {NL} ", protected)
-
-    # Proteger URLs y correos (reemplazando los '.' internos)
-    def _protect_dots(m: re.Match) -> str:
-        return m.group(0).replace(".", DOT)
-
-    # URLs con http(s)
-    protected = re.sub(r"https?://\S+", _protect_dots, protected)
-    # Dominios tipo www.
-    protected = re.sub(r"\bwww\.\S+", _protect_dots, protected)
-    # Emails básicos
-    protected = re.sub(r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)+", _protect_dots, protected)
-
-    # Abreviaturas comunes (títulos, compañías y otras)
-    abbreviations = [
-        # Títulos y grados
-        "Dr.", "Dra.", "Sr.", "Sra.", "Ing.", "Lic.", "Arq.",
-        "Phd.", "Ph.D.", "M.Sc.", "MSc.", "Mg.", "Mtr.",
-        # Compañías y razones sociales
-        "S.A.", "S.A.S.", "S.R.L.", "S.L.", "C.A.", "S.A.C.", "C.V.", "Ltd.", "Inc.", "Co.", "Corp.", "Cía.",
-        # Otras comunes
-        "etc.", "Art.", "art.", "No.", "Nº.", "N°.", "a.m.", "p.m.", "p.ej.", "p.e.", "e.g.",
-    ]
-    for abbr in abbreviations:
-        escaped = re.escape(abbr)
-        replacement = abbr.replace(".", DOT)
-        protected = re.sub(escaped, replacement, protected)
-
-    # Proteger siglas con puntos (p. ej., U.S.A., EE.UU., A.B.C.)
-    protected = re.sub(
-        r"(?<!\w)((?:[A-ZÁÉÍÓÚÑ]\.){2,})(?!\w)",
-        lambda m: m.group(1).replace(".", DOT),
-        protected
-    )
-
-    # Proteger números decimales (p. ej., 3.14)
-    protected = re.sub(r"(\d)\.(\d)", r"\1" + DOT + r"\2", protected)
-
-    # Dividir por final de oración: ., ?, ! seguidos de espacio/fin
-    parts = re.split(r"(?<=[.!?])\s+", protected)
-
-    # Dividir adicionalmente por saltos de línea marcados
-    candidates: list[str] = []
-    for part in parts:
-        subparts = re.split(r"\s*" + re.escape(NL) + r"\s*", part)
-        for sp in subparts:
-            s = sp.strip()
-            if s:
-                candidates.append(s)
-
-    # Restaurar puntos y clasificar
-    results: list[dict] = []
-    for s in candidates:
-        s = s.replace(DOT, ".").replace(NL, " ").strip()
-        if not s:
+    Una oración termina en '.', '?' o '!' seguido de espacio, o en un salto de
+    línea. No cierran oración el punto final de una abreviatura (ABBREVIATIONS),
+    de una sigla (U.S.A.) ni de una URL; los puntos de correos y decimales
+    nunca van seguidos de espacio. Las oraciones no incluyen espacios alrededor.
+    """
+    start = 0
+    for m in _BOUNDARY_RE.finditer(text):
+        end = m.end()
+        if m.group() == "." and _protected_dot(text, start, end):
             continue
-        categoria = classify_text(s)
-        results.append({"texto": s, "categoria": categoria})
+        span = _trim(text, start, end)
+        start = end
+        if span is not None:
+            yield span
+    span = _trim(text, start, len(text))
+    if span is not None:
+        yield span
+
+def _protected_dot(text: str, start: int, end: int) -> bool:
+    """Si el punto en text[end - 1] no cierra la oración (abreviatura, sigla o URL)."""
+    # Palabra que termina en el punto, sin pasar del inicio de la oración
+    token_start = end - 1
+    while token_start > start and not text[token_start - 1].isspace():
+        token_start -= 1
+    token = text[token_start:end]
+    return bool(token.endswith(ABBREVIATIONS) or _ACRONYM_END_RE.search(token)
+                or _URL_RE.search(token))
 
-    return results
\ No newline at end of file
+def _trim(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Posiciones de text[start:end] sin espacios alrededor, o None si solo hay espacios."""
+    first = _NON_SPACE_RE.search(text, start, end)
+    if first is None:
+        return None
+    while text[end - 1].isspace():
+        end -= 1
+    return first.start(), end
+
+def iter_document_segments(text, classifier: Optional[KeywordClassifier] = None) -> Iterator[Dict[str, Any]]:
+    """Clasifica un documento oración por oración, entregando cada segmento en cuanto se clasifica.
+
+    Cada segmento tiene 'id' (desde 1), 'span' ([inicio, fin) en `text`, como en
+    data/responses.json), 'texto' y 'categoria'.
+    """
+    text = "" if text is None else str(text)
+    classifier = classifier or get_classifier()
+    for n, (start, end) in enumerate(iter_sentence_spans(text), 1):
+        sentence = text[start:end]
+        yield {"id": n, "span": [start, end], "texto": sentence, "categoria": classifier.classify(sentence)}
+
+def _document_items(documents: Union[str, Dict[str, str], Iterable[str]]) -> Iterator[Tuple[str, str]]:
+    """(document_id, texto) de un texto, un diccionario id -> texto o una lista de textos ("0", "1", ...)."""
+    if isinstance(documents, str):
+        yield "0", documents
+    elif isinstance(documents, dict):
+        for doc_id, text in documents.items():
+            yield str(doc_id), text
+    else:
+        for n, text in enumerate(documents):
+            yield str(n), text
+
+def iter_classify_documents(documents: Union[str, Dict[str, str], Iterable[str]],
+                            classifier: Optional[KeywordClassifier] = None) -> Iterator[Dict[str, Any]]:
+    """Clasifica uno o varios documentos como un flujo de eventos, sin acumular los segmentos.
+
+    - `{"type": "segment", "document_id", "id", "span", "texto", "categoria"}` por oración.
+    - `{"type": "document", "document_id", "segments", "counts"}` al terminar cada documento.
+    - `{"type": "done", "documents", "segments", "counts"}` con el total al final.
+
+    'counts' son los segmentos por categoría (incluida 'OTRO', también con 0).
+    """
+    # Un mismo clasificador para todo el lote, aunque el léxico cambie a mitad
+    classifier = classifier or get_classifier()
+    labels = list(classifier.categories) + ["OTRO"]
+    totals = dict.fromkeys(labels, 0)
+    n_documents = n_segments = 0
+    for doc_id, text in _document_items(documents):
+        counts = dict.fromkeys(labels, 0)
+        segments = 0
+        for segment in iter_document_segments(text, classifier):
+            counts[segment["categoria"]] = counts.get(segment["categoria"], 0) + 1
+            segments += 1
+            yield {"type": "segment", "document_id": doc_id, **segment}
+        for label, count in counts.items():
+            totals[label] = totals.get(label, 0) + count
+        n_documents += 1
+        n_segments += segments
+        yield {"type": "document", "document_id": doc_id, "segments": segments, "counts": counts}
+    yield {"type": "done", "documents": n_documents, "segments": n_segments, "counts": totals}
+
+def classify_documents(documents: Union[str, Dict[str, str], Iterable[str]],
+                       classifier: Optional[KeywordClassifier] = None) -> Dict[str, Any]:
+    """Clasifica uno o varios documentos en una sola llamada.
+
+    Retorna {'documents': [{'document_id', 'segments', 'counts'}, ...], 'counts'}:
+    los segmentos de cada documento (ver `iter_document_segments`) y los
+    recuentos por categoría de cada documento y del lote. Para documentos muy
+    largos, `iter_classify_documents` entrega los segmentos sin acumularlos.
+    """
+    results: List[Dict[str, Any]] = []
+    segments: List[Dict[str, Any]] = []
+    totals: Dict[str, int] = {}
+    for event in iter_classify_documents(documents, classifier):
+        kind = event.pop("type")
+        if kind == "segment":
+            event.pop("document_id")
+            segments.append(event)
+        elif kind == "document":
+            results.append({"document_id": event["document_id"], "segments": segments,
+                            "counts": event["counts"]})
+            segments = []
+        else:
+            totals = event["counts"]
+    return {"documents": results, "counts": totals}
\ No newline at end of file
@@ -1,12 +1,18 @@
 # src/main.py
 
-from fastapi import FastAPI, HTTPException, Body,UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Body,UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartParser
 
+import asyncio
 import os
 import shutil
-from typing import Dict, Optional, Any, List
 import tempfile
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Any, List
 import json
 from pydantic import BaseModel
 
@@ -14,15 +20,146 @@ from pydantic import BaseModel
 # Python entiende esta ruta porque ejecutaremos el comando desde la raíz del proyecto.
 
 from src.ruc.ruc_search import unificar_info_empresa_produccion
+from src.utils.extraction_cache import get_default_page_store
 from src.utils.pdf_analisis import analyze_contract_documents
-from src.utils.pdf_extractor import PDFTextExtractor, extract_text_from_pdf
+from src.utils.pdf_document import PDFSource
+from src.utils.pdf_extractor import (ExtractionCancelled, PDFTextExtractor, extract_text_from_pdf,
+                                     parse_page_ranges, warm_ocr_engines)
+
+
+# --- Subidas de PDF ---
+# Starlette recibe cada archivo en un buffer spooled que pasa a disco al superar
+# `MultiPartParser.spool_max_size` (1 MB por defecto; no se modifica, afectaría a
+# todas las aplicaciones del proceso). Las subidas que caben en ese buffer se
+# extraen desde memoria; las mayores se copian por bloques a un archivo temporal
+# que el extractor abre sin cargarlo entero. Por encima de PDF_UPLOAD_MAX_MB se
+# responde 413.
+UPLOAD_MAX_BYTES = int(float(os.getenv("PDF_UPLOAD_MAX_MB", 200)) * 1024 * 1024)
+UPLOAD_MEMORY_MAX_BYTES = MultiPartParser.spool_max_size
+UPLOAD_COPY_CHUNK = 1024 * 1024
+
+
+# --- Límites de tiempo de la extracción ---
+# Una página patológica (foto a página completa, imagen enorme) no debe bloquear
+# el worker: su OCR se omite al superar OCR_PAGE_TIMEOUT segundos y la extracción
+# entera se corta en PDF_EXTRACT_TIMEOUT. 0 desactiva el límite.
+OCR_PAGE_TIMEOUT = float(os.getenv("OCR_PAGE_TIMEOUT", 120)) or None
+PDF_EXTRACT_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", 900)) or None
+# Cada cuánto se comprueba si el cliente sigue conectado durante una extracción
+DISCONNECT_POLL_SECONDS = 1.0
+
+
+# --- Instrumentación de la extracción ---
+# metadata['timings'] (y 'timings' en cada página del streaming) lleva el tiempo
+# por etapa; las etapas más lentas que PDF_SLOW_STAGE_SECONDS se registran en el
+# log. PDF_TRACE_MEMORY=1 añade el pico de memoria asignada (tracemalloc).
+SLOW_STAGE_SECONDS = float(os.getenv("PDF_SLOW_STAGE_SECONDS", 5))
+TRACE_MEMORY = os.getenv("PDF_TRACE_MEMORY", "0").lower() in ("1", "true", "yes")
+
+
+def log_slow_stage(event: Dict[str, Any]) -> None:
+    """Hook de instrumentación: avisa de las etapas que superan SLOW_STAGE_SECONDS."""
+    if event['wall_s'] >= SLOW_STAGE_SECONDS:
+        where = f" (página {event['page']})" if event['page'] is not None else ""
+        print(f"WARN: Etapa lenta '{event['stage']}'{where}: {event['wall_s']:.2f}s de pared, "
+              f"{event['cpu_s']:.2f}s de CPU, pico {event['peak_alloc_kb']} KB")
+
+
+async def run_until_disconnect(request: Request, cancel: threading.Event, func, /, *args, **kwargs):
+    """
+    Ejecuta `func` en el threadpool sin bloquear el event loop. Si el cliente se
+    desconecta antes de que termine, activa `cancel` para que la extracción se
+    detenga en la siguiente página (y lance ExtractionCancelled).
+
+    Los tres primeros parámetros son solo posicionales: `func` puede recibir sus
+    propios `request` o `cancel` por nombre.
+    """
+    task = asyncio.ensure_future(run_in_threadpool(func, *args, **kwargs))
+    try:
+        while not task.done():
+            await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if not task.done() and await request.is_disconnected():
+                cancel.set()
+        return task.result()
+    finally:
+        if not task.done():
+            cancel.set()
+
+
+def check_page_ranges(pages: Optional[str]) -> None:
+    """Valida el campo `pages` antes de leer el PDF (400 si no es válido)."""
+    try:
+        parse_page_ranges(pages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def upload_size(file: UploadFile) -> int:
+    """Tamaño de la subida en bytes (sin leerla)."""
+    if file.size is not None:
+        return file.size
+    position = file.file.tell()
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(position)
+    return size
+
+
+def _copy_to_temp_file(upload) -> str:
+    """Copia el archivo spooled de la subida a un archivo temporal con nombre, por bloques."""
+    upload.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="neurobit_upload_", suffix=".pdf", delete=False) as f:
+        try:
+            shutil.copyfileobj(upload, f, UPLOAD_COPY_CHUNK)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    return f.name
+
+
+async def open_upload(file: UploadFile) -> PDFSource:
+    """
+    Origen del PDF subido para el extractor: sus bytes si Starlette lo mantuvo en
+    memoria, o la ruta de una copia en disco si no (ver `close_upload`). Lanza
+    413 si supera UPLOAD_MAX_BYTES.
+    """
+    size = upload_size(file)
+    if size > UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"El archivo supera el máximo de {UPLOAD_MAX_BYTES // (1024 * 1024)} MB."
+        )
+    if size <= UPLOAD_MEMORY_MAX_BYTES:
+        return await file.read()
+    return await run_in_threadpool(_copy_to_temp_file, file.file)
+
+
+def close_upload(source: PDFSource) -> None:
+    """Borra la copia en disco creada por `open_upload`, si la hay."""
+    if isinstance(source, str):
+        try:
+            os.remove(source)
+        except OSError as e:
+            print(f"WARN: No se pudo borrar la subida temporal {source}: {e}")
+
+
+# --- Arranque: motores OCR precalentados ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Los motores (OCR_WARM_ENGINES, por defecto 'tesseract') quedan listos antes
+    # de la primera petición y se reutilizan en todas las siguientes
+    status = warm_ocr_engines()
+    print(f"INFO: Motores OCR precalentados: {status}")
+    yield
 
 
 # --- Inicialización de la aplicación FastAPI ---
 app = FastAPI(
     title="API de Consulta de Empresas Ecuador",
     description="Una API para unificar información del SRI y Supercias.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # --- Configuración de CORS ---
@@ -69,9 +206,12 @@ def read_root():
 # --- Nuevo Endpoint para Extracción de PDF ---
 @app.post("/api/v1/extract_pdf", tags=["PDF"])
 async def extract_pdf_data(
+    request: Request,
     file: UploadFile = File(...),
     use_ocr: Optional[bool] = Form(False),
-    extract_tables: Optional[bool] = Form(True)
+    extract_tables: Optional[bool] = Form(True),
+    pages: Optional[str] = Form(None),
+    triage: Optional[bool] = Form(False)
 ) -> Dict[str, Any]:
     """
     Extrae texto y tablas de un archivo PDF subido.
@@ -79,37 +219,139 @@ async def extract_pdf_data(
     - **file**: El archivo PDF a procesar.
     - **use_ocr**: Opcional. Si se establece en `True`, fuerza el uso de OCR. Por defecto es `False`.
     - **extract_tables**: Opcional. Si se establece en `True`, intenta extraer tablas. Por defecto es `True`.
+    - **pages**: Opcional. Páginas a extraer, p. ej. `1-5,8,10-`. Por defecto, todas.
+    - **triage**: Opcional. Si es `True`, solo extrae la capa de texto de una muestra
+      de páginas (las primeras y algunas repartidas por el resto), sin OCR ni tablas,
+      para decidir rápido qué hacer con el documento. Por defecto es `False`.
     """
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="El archivo debe ser un PDF.")
+    check_page_ranges(pages)
 
-    # Guardar el archivo en una ubicación temporal
-    # Esto es crucial ya que 'pdf_extractor' necesita una ruta de archivo.
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-        shutil.copyfileobj(file.file, temp_file)
-        temp_file_path = temp_file.name
+    # Desde memoria si la subida es pequeña, o desde una copia en disco (ver `open_upload`)
+    pdf_source = await open_upload(file)
+    where = "en disco" if isinstance(pdf_source, str) else "en memoria"
     
-    print(f"INFO: Procesando PDF temporal en: {temp_file_path} con use_ocr={use_ocr} y extract_tables={extract_tables}")
+    print(f"INFO: Procesando PDF '{file.filename}' ({upload_size(file)} bytes) {where} con use_ocr={use_ocr}, extract_tables={extract_tables}, pages={pages} y triage={triage}")
     
+    cancel = threading.Event()
     try:
         # Llamar a la función de extracción con los parámetros recibidos
-        extracted_data = extract_text_from_pdf(
-            pdf_path=temp_file_path, 
+        extracted_data = await run_until_disconnect(
+            request, cancel, extract_text_from_pdf,
+            pdf_path=pdf_source, 
             use_ocr=use_ocr, 
-            extract_tables=extract_tables
+            extract_tables=extract_tables,
+            ocr_page_timeout=OCR_PAGE_TIMEOUT,
+            document_timeout=PDF_EXTRACT_TIMEOUT,
+            cancel=cancel,
+            timing_hook=log_slow_stage,
+            trace_memory=TRACE_MEMORY,
+            pages=pages,
+            triage=triage
         )
         print("INFO: Extracción de PDF completada con éxito.")
         return extracted_data
-    except FileNotFoundError as e:
-        print(f"ERROR: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
+    except ExtractionCancelled:
+        print(f"INFO: Cliente desconectado; extracción de '{file.filename}' cancelada.")
+        raise HTTPException(status_code=499, detail="Extracción cancelada: el cliente se desconectó.")
     except Exception as e:
         print(f"ERROR: Fallo al procesar el PDF: {e}")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {e}")
     finally:
-        # Asegurarse de eliminar el archivo temporal
-        os.unlink(temp_file_path)
-        print("INFO: Archivo temporal eliminado.")
+        close_upload(pdf_source)
+
+
+# --- Endpoint de extracción progresiva (NDJSON) ---
+@app.post("/api/v1/extract_pdf/stream", tags=["PDF"])
+async def extract_pdf_data_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    use_ocr: Optional[bool] = Form(False),
+    extract_tables: Optional[bool] = Form(True),
+    pages: Optional[str] = Form(None),
+    triage: Optional[bool] = Form(False)
+) -> StreamingResponse:
+    """
+    Igual que `/api/v1/extract_pdf`, pero devuelve el resultado página por página
+    como NDJSON (una línea JSON por evento) para que el cliente pueda mostrarlo
+    a medida que avanza la extracción.
+
+    - Eventos `{"type": "page", ...}`: página, texto, tablas y decisión de OCR.
+    - Evento final `{"type": "done", ...}`: resumen del documento.
+    - Evento `{"type": "error", "detail": ...}` si la extracción falla a mitad.
+
+    Si el cliente se desconecta, la extracción se cancela en la siguiente página.
+    Acepta las mismas opciones `pages` y `triage`.
+    """
+    if file.content_type != "application/pdf":
+        raise HTTPException(status_code=400, detail="El archivo debe ser un PDF.")
+    check_page_ranges(pages)
+
+    pdf_source = await open_upload(file)
+    where = "en disco" if isinstance(pdf_source, str) else "en memoria"
+
+    try:
+        extractor = PDFTextExtractor(ocr_page_timeout=OCR_PAGE_TIMEOUT,
+                                     document_timeout=PDF_EXTRACT_TIMEOUT,
+                                     page_store=get_default_page_store(),
+                                     timing_hook=log_slow_stage,
+                                     trace_memory=TRACE_MEMORY)
+    except Exception as e:
+        close_upload(pdf_source)
+        print(f"ERROR: No se pudo inicializar el extractor: {e}")
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {e}")
+
+    print(f"INFO: Procesando PDF '{file.filename}' ({upload_size(file)} bytes, streaming) {where} con use_ocr={use_ocr}, extract_tables={extract_tables}, pages={pages} y triage={triage}")
+
+    async def generate_events():
+        n_pages = 0
+        ocr_pages = []
+        ocr_timeouts = []
+        page_cache_hits = 0
+        n_tables = 0
+        table_pages_skipped = 0
+        cancel = threading.Event()
+        page_iter = extractor.iter_pages(pdf_source, use_ocr=use_ocr, extract_tables=extract_tables,
+                                         cancel=cancel, pages=pages, triage=triage)
+        try:
+            while True:
+                # Cada página se extrae en el threadpool: el event loop sigue libre
+                page = await run_until_disconnect(request, cancel, next, page_iter, None)
+                if page is None:
+                    break
+                n_pages += 1
+                n_tables += len(page['tables'])
+                table_pages_skipped += page['tables_skipped']
+                if page['ocr']:
+                    ocr_pages.append(page['page'])
+                if page['ocr_timeout']:
+                    ocr_timeouts.append(page['page'])
+                page_cache_hits += page['page_cache_hit']
+                yield json.dumps({"type": "page", **page}, ensure_ascii=False) + "\n"
+            yield json.dumps({"type": "done", "pages": n_pages, "ocr_pages": ocr_pages, "tables": n_tables,
+                              "table_pages_skipped": table_pages_skipped,
+                              "ocr_timeouts": ocr_timeouts,
+                              "page_cache_hits": page_cache_hits}) + "\n"
+            print("INFO: Extracción de PDF (streaming) completada con éxito.")
+        except ExtractionCancelled:
+            print(f"INFO: Cliente desconectado; extracción de '{file.filename}' cancelada.")
+        except Exception as e:
+            print(f"ERROR: Fallo al procesar el PDF: {e}")
+            yield json.dumps({"type": "error", "detail": f"Error interno del servidor: {e}"}, ensure_ascii=False) + "\n"
+        finally:
+            # Si Starlette cierra la respuesta a mitad de página, la extracción se detiene sola
+            cancel.set()
+            # Cierra el documento y, con extracción paralela, el pool de procesos. Si
+            # una página sigue en curso en el threadpool, `cancel` la detiene y el
+            # generador se cierra solo al lanzar ExtractionCancelled
+            try:
+                page_iter.close()
+            except ValueError:
+                pass
+            close_upload(pdf_source)
+
+    return StreamingResponse(generate_events(), media_type="application/x-ndjson")
 
 
 # --- NUEVO ENDPOINT PARA COMPARAR DOCUMENTOS ---
@@ -2,7 +2,7 @@ import requests
 import os
 from PIL import Image  # Para manipulación de imágenes
 import io             # Para manejar bytes en memoria
-import pytesseract    # El nuevo motor de OCR
+# pytesseract se importa al resolver el CAPTCHA: al cargarse importa pandas
 
 # Nota: Se han eliminado las dependencias de 'easyocr' y 'cv2'.
 # Asegúrate de que no haya 'import easyocr' o 'import cv2' en este archivo.
@@ -71,6 +71,8 @@ def obtener_informacion_compania(ruc):
             buffer = _reqimg.content
             captcha = ""
             try:
+                import pytesseract  # El nuevo motor de OCR
+
                 img = Image.open(io.BytesIO(buffer))
                 print("Procesando imagen del CAPTCHA con Pytesseract desde memoria...")
                 
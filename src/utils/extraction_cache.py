@@ -0,0 +1,263 @@
+"""
+Caché en disco de resultados de extracción de PDFs, direccionada por contenido.
+
+La clave es el SHA-256 de los bytes del PDF más las opciones de extracción, de
+modo que el mismo pliego subido por distintos analistas se procesa una sola vez.
+Los resultados se guardan como JSON en un directorio que pueden compartir varios
+workers de uvicorn: las escrituras son atómicas (archivo temporal + os.replace)
+y el tamaño total se limita expulsando primero las entradas usadas hace más tiempo.
+
+La misma estructura guarda también resultados por página, direccionados por la
+huella del contenido de cada página (ver `PDFDocument.page_fingerprint`): una
+nueva revisión de un pliego reutiliza el OCR y las tablas de las páginas que
+no cambiaron.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Union
+
+from .instrumentation import ExtractionTimings, measure
+
+# Cambiar cuando el formato del resultado de extracción cambie, para invalidar entradas
+CACHE_VERSION = 6
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "neurobit_pdf_cache")
+DEFAULT_CACHE_MAX_MB = 512
+# Fracción del límite a la que baja la carpeta tras una expulsión
+EVICT_TARGET = 0.9
+
+DEFAULT_PAGE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "neurobit_page_cache")
+DEFAULT_PAGE_CACHE_MAX_MB = 512
+
+
+# Contenido de un PDF en memoria o ruta a su archivo
+PDFContent = Union[bytes, bytearray, memoryview, str, os.PathLike]
+
+
+def _content_digest(pdf_data: PDFContent) -> str:
+    """SHA-256 del contenido; una ruta se lee por bloques."""
+    if not isinstance(pdf_data, (str, os.PathLike)):
+        return hashlib.sha256(pdf_data).hexdigest()
+    digest = hashlib.sha256()
+    with open(pdf_data, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Caché LRU en disco, acotada por tamaño, para resultados de extracción.
+
+    Args:
+        directory: Carpeta donde se guardan las entradas (compartible entre procesos).
+        max_bytes: Tamaño máximo total; al superarlo se expulsan las entradas menos
+            usadas recientemente.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Tamaño total estimado: se recorre la carpeta al primer guardado y luego
+        # solo se suman las escrituras de este proceso hasta superar el límite
+        self._total_bytes: Optional[int] = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(pdf_data: PDFContent, **options: Any) -> str:
+        """
+        Clave a partir del contenido del PDF y de las opciones de extracción. Con
+        una ruta, el archivo se lee por bloques sin cargarlo entero en memoria.
+        """
+        digest = _content_digest(pdf_data)
+        opts = json.dumps(options, sort_keys=True, default=str)
+        return hashlib.sha256(f"v{CACHE_VERSION}:{digest}:{opts}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_page_key(fingerprint: str, **options: Any) -> str:
+        """Clave de una página a partir de su huella y de las opciones de extracción."""
+        opts = json.dumps(options, sort_keys=True, default=str)
+        return hashlib.sha256(f"v{CACHE_VERSION}:page:{fingerprint}:{opts}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        # Subcarpetas por prefijo para no acumular miles de archivos en un directorio
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Devuelve el resultado guardado o None si no existe (o está corrupto)."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"[CACHE WARN] Entrada ilegible {path}: {e!r}")
+            self._remove(path)
+            return None
+        # Marcar como usada recientemente para la política LRU
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: Dict) -> None:
+        """Guarda un resultado de forma atómica y aplica el límite de tamaño."""
+        self.put_many({key: result})
+
+    def put_many(self, results: Dict[str, Dict]) -> None:
+        """Guarda varios resultados y aplica el límite de tamaño una sola vez."""
+        if not results:
+            return
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        for key, result in results.items():
+            self._total_bytes += self._write(key, result)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _write(self, key: str, result: Dict) -> int:
+        """Escribe la entrada y devuelve cuánto creció la carpeta (en bytes)."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        return size - replaced
+
+    def _entries(self):
+        for prefix in os.scandir(self.directory):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def _evict(self) -> None:
+        """
+        Expulsa las entradas usadas hace más tiempo hasta bajar a EVICT_TARGET
+        del límite, de modo que los guardados siguientes no vuelvan a recorrer
+        la carpeta enseguida. Recalcula el total con las entradas de todos los
+        procesos que comparten la carpeta.
+        """
+        entries = list(self._entries())
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * EVICT_TARGET
+            for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                if total <= target:
+                    break
+                if self._remove(path):
+                    total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # Otro worker pudo haberla expulsado o la tiene abierta (Windows)
+            return False
+
+
+_default_cache: Optional[ExtractionCache] = None
+
+
+def get_default_cache() -> Optional[ExtractionCache]:
+    """
+    Caché compartida del proceso, configurada por variables de entorno:
+    - PDF_CACHE_DIR: carpeta de la caché.
+    - PDF_CACHE_MAX_MB: tamaño máximo en MB (0 desactiva la caché).
+    """
+    global _default_cache
+    max_mb = float(os.getenv("PDF_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB))
+    if max_mb <= 0:
+        return None
+    if _default_cache is None:
+        _default_cache = ExtractionCache(
+            directory=os.getenv("PDF_CACHE_DIR", DEFAULT_CACHE_DIR),
+            max_bytes=int(max_mb * 1024 * 1024),
+        )
+    return _default_cache
+
+
+_default_page_store: Optional[ExtractionCache] = None
+
+
+def get_default_page_store() -> Optional[ExtractionCache]:
+    """
+    Almacén de resultados por página compartido del proceso, configurado por:
+    - PDF_PAGE_CACHE_DIR: carpeta del almacén.
+    - PDF_PAGE_CACHE_MAX_MB: tamaño máximo en MB (0 lo desactiva).
+    """
+    global _default_page_store
+    max_mb = float(os.getenv("PDF_PAGE_CACHE_MAX_MB", DEFAULT_PAGE_CACHE_MAX_MB))
+    if max_mb <= 0:
+        return None
+    if _default_page_store is None:
+        _default_page_store = ExtractionCache(
+            directory=os.getenv("PDF_PAGE_CACHE_DIR", DEFAULT_PAGE_CACHE_DIR),
+            max_bytes=int(max_mb * 1024 * 1024),
+        )
+    return _default_page_store
+
+
+def cached_extraction(pdf_data: PDFContent, options: Dict[str, Any],
+                      extract, cache: Optional[ExtractionCache] = None) -> Dict:
+    """
+    Devuelve el resultado en caché para (pdf_data, options) o lo calcula con
+    `extract()` y lo guarda. Añade metadata['cache'] con la clave y si hubo acierto.
+    Los resultados parciales (metadata['partial']) no se guardan.
+
+    Las mediciones de tiempo describen la extracción que las produjo, así que no
+    se guardan: en un acierto, metadata['timings'] solo mide la búsqueda en la
+    caché (etapa 'cache') y el tiempo de OCR de cada página es 0.
+    """
+    if cache is None:
+        return extract()
+
+    key = ExtractionCache.make_key(pdf_data, **options)
+    with measure() as lookup:
+        result = cache.get(key)
+    hit = result is not None
+    if hit:
+        timings = ExtractionTimings()
+        timings.add('cache', lookup)
+        result.setdefault('metadata', {})['timings'] = timings.as_dict(lookup)
+    else:
+        result = extract()
+        if not result.get('metadata', {}).get('partial'):
+            try:
+                cache.put(key, _without_timings(result))
+            except OSError as e:
+                print(f"[CACHE WARN] No se pudo guardar la entrada {key}: {e!r}")
+    result.setdefault('metadata', {})['cache'] = {'key': key, 'hit': hit}
+    return result
+
+
+def _without_timings(result: Dict) -> Dict:
+    """Copia superficial de `result` sin las mediciones de la extracción."""
+    metadata = {k: v for k, v in result.get('metadata', {}).items() if k != 'timings'}
+    if 'page_ocr' in metadata:
+        metadata['page_ocr'] = [dict(page, seconds=0.0) for page in metadata['page_ocr']]
+    return {**result, 'metadata': metadata}
@@ -0,0 +1,116 @@
+"""
+Instrumentación de la extracción por etapa y por página.
+
+Cada medición registra tiempo de pared, tiempo de CPU del hilo y, si se activa
+el rastreo de memoria (tracemalloc), el pico de memoria asignada por Python
+durante la etapa. El CPU de procesos hijos (Tesseract) y la memoria nativa de
+MuPDF no se incluyen. Las mediciones se agregan en `ExtractionTimings`, que
+también las entrega a un hook opcional a medida que se producen.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+TimingHook = Callable[[Dict], None]
+
+
+@contextmanager
+def measure(trace_memory: bool = False) -> Iterator[Dict]:
+    """
+    Mide el bloque `with`. Al salir, el diccionario entregado contiene 'wall_s',
+    'cpu_s' y 'peak_alloc_kb' (None si no se está rastreando la memoria).
+    """
+    stats: Dict = {}
+    tracing = trace_memory and tracemalloc.is_tracing()
+    if tracing:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield stats
+    finally:
+        stats['wall_s'] = round(time.perf_counter() - wall, 6)
+        stats['cpu_s'] = round(time.thread_time() - cpu, 6)
+        stats['peak_alloc_kb'] = None
+        # Otra extracción pudo detener el rastreo mientras tanto
+        if tracing and tracemalloc.is_tracing():
+            stats['peak_alloc_kb'] = round(max(0, tracemalloc.get_traced_memory()[1] - base) / 1024, 1)
+
+
+@contextmanager
+def memory_tracing(enabled: bool) -> Iterator[None]:
+    """Activa tracemalloc durante el bloque si se pide y no estaba ya activo."""
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def share(stats: Dict, n: int) -> Dict:
+    """Parte de una medición conjunta (p. ej. un lote de OCR) que corresponde a una de `n` páginas."""
+    return {
+        'wall_s': round(stats['wall_s'] / n, 6),
+        'cpu_s': round(stats['cpu_s'] / n, 6),
+        'peak_alloc_kb': stats['peak_alloc_kb'],
+    }
+
+
+class ExtractionTimings:
+    """
+    Agrega las mediciones de una extracción.
+
+    Args:
+        hook: Función opcional que recibe cada medición como diccionario con
+            'stage', 'page' (None en etapas del documento), 'wall_s', 'cpu_s'
+            y 'peak_alloc_kb'. Sus errores se informan sin detener la extracción.
+    """
+
+    def __init__(self, hook: Optional[TimingHook] = None):
+        self.hook = hook
+        self.stages: Dict[str, Dict] = {}
+        self.pages: List[Dict] = []
+
+    def add(self, stage: str, stats: Dict, page: Optional[int] = None) -> None:
+        """Registra una medición de `stage` (del documento o de la página `page`)."""
+        total = self.stages.setdefault(
+            stage, {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'peak_alloc_kb': None}
+        )
+        total['calls'] += 1
+        total['wall_s'] += stats['wall_s']
+        total['cpu_s'] += stats['cpu_s']
+        if stats.get('peak_alloc_kb') is not None:
+            total['peak_alloc_kb'] = max(total['peak_alloc_kb'] or 0.0, stats['peak_alloc_kb'])
+        if self.hook is not None:
+            try:
+                self.hook({'stage': stage, 'page': page, **stats})
+            except Exception as e:
+                print(f"[TIMING WARN] El hook de instrumentación falló: {e!r}")
+
+    def add_page(self, page: int, timings: Dict[str, Dict]) -> None:
+        """Registra las mediciones por etapa de una página."""
+        for stage, stats in timings.items():
+            self.add(stage, stats, page)
+        self.pages.append({'page': page, **timings})
+
+    def as_dict(self, total: Dict) -> Dict:
+        """
+        Resumen para metadata['timings']: 'total' (medición de toda la extracción,
+        con el mayor pico de memoria de sus etapas), 'stages' (acumulado por
+        etapa) y 'pages' (mediciones por etapa de cada página).
+        """
+        peaks = [stats['peak_alloc_kb'] for stats in self.stages.values()
+                 if stats['peak_alloc_kb'] is not None]
+        return {
+            'total': {**total, 'peak_alloc_kb': max(peaks) if peaks else None},
+            'stages': {
+                stage: {**stats, 'wall_s': round(stats['wall_s'], 6), 'cpu_s': round(stats['cpu_s'], 6)}
+                for stage, stats in self.stages.items()
+            },
+            'pages': self.pages,
+        }
@@ -0,0 +1,125 @@
+"""
+Pool de motores OCR compartido por todo el proceso.
+
+Crear un motor OCR (p. ej. `easyocr.Reader`, que carga los modelos de detección
+y reconocimiento) cuesta segundos y cientos de MB. El pool los crea bajo
+demanda hasta un tamaño máximo, los reutiliza entre peticiones y garantiza que
+cada motor lo use un solo hilo a la vez. Se puede precalentar al iniciar la API.
+"""
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+DEFAULT_POOL_SIZE = 1
+
+
+class OCREnginePool:
+    """
+    Pool acotado de motores OCR, inicializados de forma perezosa.
+
+    Args:
+        factory: Función sin argumentos que crea un motor nuevo.
+        size: Número máximo de motores vivos (y de usos simultáneos).
+        name: Nombre para los mensajes de log.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = DEFAULT_POOL_SIZE,
+                 name: str = "ocr"):
+        self.factory = factory
+        self.size = max(1, size)
+        self.name = name
+        # LIFO: se reutiliza primero el motor usado más recientemente (cachés calientes)
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @property
+    def created(self) -> int:
+        """Motores creados hasta ahora."""
+        return self._created
+
+    def _create(self) -> Any:
+        with self._lock:
+            self._created += 1
+        try:
+            return self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Toma un motor libre (o crea uno si aún no se alcanzó el tamaño máximo)."""
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No hay motores OCR '{self.name}' libres tras {timeout}s")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._create()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, engine: Any) -> None:
+        """Devuelve un motor al pool."""
+        self._idle.put(engine)
+        self._slots.release()
+
+    def discard(self, engine: Any) -> None:
+        """
+        Retira un motor prestado que no debe reutilizarse (p. ej. sigue ocupado con
+        un reconocimiento abandonado). Se creará otro bajo demanda.
+        """
+        with self._lock:
+            self._created -= 1
+        self._slots.release()
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Presta un motor durante el bloque `with` y lo devuelve al salir."""
+        engine = self.acquire(timeout)
+        try:
+            yield engine
+        finally:
+            self.release(engine)
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """
+        Crea por adelantado hasta `count` motores (por defecto, el tamaño del pool).
+        Devuelve cuántos motores quedan disponibles.
+        """
+        target = self.size if count is None else min(max(0, count), self.size)
+        engines = []
+        try:
+            while self._created < target:
+                engines.append(self.acquire())
+        finally:
+            for engine in engines:
+                self.release(engine)
+        return self._created
+
+
+_pools: Dict[Hashable, OCREnginePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_ocr_pool(key: Hashable, factory: Callable[[], Any],
+                 size: Optional[int] = None) -> OCREnginePool:
+    """
+    Pool compartido del proceso para `key`; se crea en la primera llamada.
+    El tamaño por defecto se toma de la variable de entorno OCR_POOL_SIZE.
+    """
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            if size is None:
+                size = int(os.getenv("OCR_POOL_SIZE", DEFAULT_POOL_SIZE))
+            pool = OCREnginePool(factory, size=size, name=str(key))
+            _pools[key] = pool
+        return pool
@@ -0,0 +1,119 @@
+"""
+Preparación de páginas para OCR: resolución adaptativa, enderezado y binarización.
+
+Renderizar todo a 300 dpi desperdicia píxeles en páginas con letra grande. Una
+prueba a baja resolución (PROBE_DPI) estima la altura de las líneas de texto y,
+opcionalmente, la inclinación del escaneo; con eso se elige la resolución final
+para que las líneas midan unos TARGET_LINE_PX píxeles. Todo se calcula con NumPy
+sobre el pixmap en escala de grises, sin dependencias adicionales.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import fitz
+import numpy as np
+
+from .pdf_document import pixmap_to_array
+
+PROBE_DPI = 100
+# Altura de una línea de texto (de ascendentes a descendentes) con la que
+# Tesseract reconoce bien: ~20 px de altura de mayúsculas
+TARGET_LINE_PX = 30
+MIN_OCR_DPI = 150
+MAX_OCR_DPI = 300
+DPI_STEP = 25
+
+MAX_SKEW_DEGREES = 5.0
+SKEW_STEP_DEGREES = 0.25
+# Píxeles de tinta muestreados para estimar la inclinación
+MAX_SKEW_SAMPLES = 20000
+
+
+def otsu_threshold(gray: np.ndarray) -> int:
+    """Umbral de Otsu (0-255) de una imagen en escala de grises."""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    total = hist.sum()
+    if not total:
+        return 128
+    prob = hist / total
+    omega = np.cumsum(prob)
+    mu = np.cumsum(prob * np.arange(256))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        between = (mu[-1] * omega - mu) ** 2 / (omega * (1.0 - omega))
+    return int(np.argmax(np.nan_to_num(between)))
+
+
+def _row_profile(ys: np.ndarray, xs: np.ndarray, angle: float) -> np.ndarray:
+    """Píxeles de tinta por fila tras compensar una inclinación de `angle` grados."""
+    rows = np.round(ys - xs * math.tan(math.radians(angle))).astype(np.int64)
+    return np.bincount(rows - rows.min())
+
+
+def estimate_skew(ys: np.ndarray, xs: np.ndarray) -> float:
+    """
+    Inclinación (grados) que deja las líneas de texto más horizontales: la que
+    maximiza la energía del perfil de filas.
+    """
+    if len(ys) > MAX_SKEW_SAMPLES:
+        idx = np.random.default_rng(0).choice(len(ys), MAX_SKEW_SAMPLES, replace=False)
+        ys, xs = ys[idx], xs[idx]
+    angles = np.arange(-MAX_SKEW_DEGREES, MAX_SKEW_DEGREES + SKEW_STEP_DEGREES / 2,
+                       SKEW_STEP_DEGREES)
+    scores = [float(np.sum(_row_profile(ys, xs, angle).astype(np.float64) ** 2))
+              for angle in angles]
+    return float(angles[int(np.argmax(scores))])
+
+
+def estimate_line_height(profile: np.ndarray, page_height: int) -> Optional[float]:
+    """
+    Altura mediana (en píxeles) de las franjas de texto de un perfil de filas.
+    Las franjas muy altas (fotos, bloques sólidos) se descartan; devuelve None
+    si no quedan suficientes líneas para estimar.
+    """
+    if not len(profile):
+        return None
+    inked = np.concatenate(([False], profile > max(1, 0.05 * profile.max()), [False]))
+    edges = np.flatnonzero(np.diff(inked.astype(np.int8)))
+    heights = edges[1::2] - edges[::2]
+    heights = heights[(heights >= 3) & (heights <= page_height / 8)]
+    if len(heights) < 3:
+        return None
+    return float(np.median(heights))
+
+
+def analyze_probe(pix: "fitz.Pixmap", deskew: bool = False) -> Tuple[Optional[float], float]:
+    """
+    Analiza una prueba en escala de grises.
+
+    Returns:
+        Tupla (altura de línea en píxeles de la prueba o None, inclinación en grados).
+    """
+    gray = pixmap_to_array(pix)
+    ys, xs = np.nonzero(gray <= otsu_threshold(gray))
+    if not len(ys):
+        return None, 0.0
+    skew = estimate_skew(ys, xs) if deskew else 0.0
+    return estimate_line_height(_row_profile(ys, xs, skew), gray.shape[0]), skew
+
+
+def choose_dpi(line_px: Optional[float], probe_dpi: int = PROBE_DPI,
+               min_dpi: int = MIN_OCR_DPI, max_dpi: int = MAX_OCR_DPI) -> int:
+    """
+    Resolución con la que una línea de `line_px` píxeles (a `probe_dpi`) mide
+    unos TARGET_LINE_PX píxeles, redondeada hacia arriba a múltiplos de DPI_STEP.
+    Sin estimación (fotos, páginas sin texto claro) se usa `max_dpi`.
+    """
+    if not line_px:
+        return max_dpi
+    dpi = math.ceil(TARGET_LINE_PX * probe_dpi / line_px / DPI_STEP) * DPI_STEP
+    return int(min(max(dpi, min_dpi), max_dpi))
+
+
+def binarize(pix: "fitz.Pixmap") -> "fitz.Pixmap":
+    """Pixmap en blanco y negro (umbral de Otsu) a partir de uno gris o RGB."""
+    if pix.n != 1:
+        pix = fitz.Pixmap(fitz.csGRAY, pix)
+    gray = pixmap_to_array(pix)
+    bw = np.where(gray > otsu_threshold(gray), 255, 0).astype(np.uint8)
+    return fitz.Pixmap(fitz.csGRAY, pix.width, pix.height, bw.tobytes(), False)
@@ -0,0 +1,174 @@
+"""
+Sesión de documento PDF compartida entre las etapas de extracción.
+
+Un PDFDocument lee y parsea el archivo una sola vez; metadatos, texto,
+renderizado para OCR y detección de tablas reutilizan el mismo documento.
+"""
+
+import hashlib
+import io
+import os
+from typing import TYPE_CHECKING, BinaryIO, Dict, Optional, Union
+
+import fitz
+import numpy as np
+
+if TYPE_CHECKING:
+    # pdfplumber (con pdfminer) y PIL se importan en su primer uso: muchos
+    # documentos no necesitan tablas ni OCR
+    import pdfplumber
+    from PIL import Image
+
+PDFSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+
+def read_pdf_source(source: PDFSource) -> bytes:
+    """
+    Contenido del PDF a partir de una ruta, un buffer en memoria (bytes,
+    bytearray, memoryview) o un objeto tipo archivo abierto en modo binario.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"El archivo {path} no existe")
+        with open(path, 'rb') as f:
+            return f.read()
+    data = source.read() if hasattr(source, 'read') else source
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+class PDFDocument:
+    """
+    Documento PDF abierto una única vez para toda la extracción.
+
+    Args:
+        source: Ruta al PDF, buffer en memoria con su contenido u objeto tipo
+            archivo binario (se lee una sola vez).
+
+    El documento de PyMuPDF se abre al crear la sesión; el de pdfplumber solo
+    se abre (sobre el mismo buffer) la primera vez que se piden tablas. Una ruta
+    no se carga en memoria: ambos leen el archivo bajo demanda.
+    """
+
+    def __init__(self, source: PDFSource):
+        is_path = isinstance(source, (str, os.PathLike))
+        self.path: Optional[str] = os.fspath(source) if is_path else None
+        if is_path:
+            if not os.path.exists(self.path):
+                raise FileNotFoundError(f"El archivo {self.path} no existe")
+            self.data: Optional[bytes] = None
+            self.doc = fitz.open(self.path, filetype="pdf")
+        else:
+            self.data = read_pdf_source(source)
+            self.doc = fitz.open(stream=self.data, filetype="pdf")
+        self._plumber = None
+        self._metadata: Optional[Dict] = None
+
+    @property
+    def source(self) -> PDFSource:
+        """Origen con el que otro proceso puede volver a abrir el documento."""
+        return self.path if self.path is not None else self.data
+
+    @property
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    @property
+    def plumber(self) -> "pdfplumber.PDF":
+        """Documento pdfplumber, abierto bajo demanda sobre el mismo archivo o buffer."""
+        if self._plumber is None:
+            import pdfplumber
+
+            self._plumber = pdfplumber.open(self.path if self.path is not None else io.BytesIO(self.data))
+        return self._plumber
+
+    @property
+    def metadata(self) -> Dict:
+        """Metadatos básicos del PDF."""
+        if self._metadata is None:
+            info = self.doc.metadata or {}
+            self._metadata = {
+                'pages': len(self.doc),
+                'title': info.get('title', ''),
+                'author': info.get('author', ''),
+                'creation_date': info.get('creationDate', '')
+            }
+        return dict(self._metadata)
+
+    def load_page(self, page_num: int) -> "fitz.Page":
+        return self.doc.load_page(page_num)
+
+    def page_fingerprint(self, page_num: int) -> str:
+        """
+        Huella (SHA-256) del contenido de una página: tamaño, rotación, flujo de
+        contenido y los recursos que usa (imágenes, XObjects y fuentes), por nombre.
+        Una página sin cambios conserva su huella en otra revisión del PDF aunque
+        cambie de posición o de número de objeto.
+        """
+        page = self.load_page(page_num)
+        digest = hashlib.sha256()
+        digest.update(f"{tuple(page.rect)}:{page.rotation}".encode("utf-8"))
+        digest.update(page.read_contents())
+        resources = [(img[7], img[0]) for img in page.get_images(full=True)]
+        resources += [(xobj[1], xobj[0]) for xobj in page.get_xobjects()]
+        for name, xref in sorted(resources):
+            digest.update(name.encode("utf-8"))
+            digest.update(self.doc.xref_stream_raw(xref) or b"")
+        # Fuentes por nombre, tipo y codificación (sus números de objeto cambian entre revisiones)
+        fonts = sorted((font[4], font[3], font[2], font[5], font[1])
+                       for font in page.get_fonts(full=True))
+        digest.update(repr(fonts).encode("utf-8"))
+        return digest.hexdigest()
+
+    def plumber_page(self, page_num: int) -> "pdfplumber.page.Page":
+        return self.plumber.pages[page_num]
+
+    def render_page(self, page_num: int, dpi: int = 300,
+                    grayscale: bool = False, rotate: float = 0.0) -> "fitz.Pixmap":
+        """
+        Rasteriza una página para OCR (RGB o escala de grises, sin canal alfa).
+        `rotate` gira el contenido esos grados al renderizar (p. ej. para enderezar
+        un escaneo inclinado).
+        """
+        colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+        page = self.load_page(page_num)
+        if not rotate:
+            return page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+        matrix = fitz.Matrix(dpi / 72, dpi / 72).prerotate(rotate)
+        return page.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False)
+
+    def close(self) -> None:
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+        self.doc.close()
+
+    def __enter__(self) -> "PDFDocument":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def pixmap_to_image(pix: "fitz.Pixmap") -> "Image.Image":
+    """
+    Imagen PIL construida directamente sobre `pix.samples`, sin codificar a PNG.
+
+    En escala de grises ('L') PIL mapea el buffer sin copiarlo; en RGB hace una
+    única copia cruda. El pixmap debe seguir vivo mientras se use la imagen.
+    """
+    from PIL import Image
+
+    mode = 'L' if pix.n == 1 else 'RGB'
+    return Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv,
+                            'raw', mode, pix.stride, 1)
+
+
+def pixmap_to_array(pix: "fitz.Pixmap") -> np.ndarray:
+    """
+    Vista NumPy (alto, ancho[, canales]) sobre `pix.samples`, sin copias.
+    El pixmap debe seguir vivo mientras se use el array.
+    """
+    array = np.ndarray((pix.height, pix.width, pix.n), dtype=np.uint8,
+                       buffer=pix.samples_mv, strides=(pix.stride, pix.n, 1))
+    return array[:, :, 0] if pix.n == 1 else array
@@ -8,238 +8,76 @@ Módulo mejorado para extracción de texto de PDFs con soporte para:
 
 import os
 import re
-import io
 import platform
-from typing import Optional, List, Dict
-from PIL import Image
-import fitz
-import pdfplumber
-import easyocr
-import pytesseract
-# --- EasyOCR extractor ---
-class PDFTextExtractorEasyOCR:
-    """
-    Extrae texto de PDFs usando EasyOCR, con soporte para:
-    - Documentos de licitación
-    - Extracción de tablas (pdfplumber)
-    - Filtrado y procesamiento avanzado
-    """
-    def __init__(self, languages=None, table_settings=None):
-        self.languages = languages or ['es', 'en']
-        self.reader = easyocr.Reader(self.languages, gpu=False)
-        self.table_settings = table_settings or {
-            "vertical_strategy": "lines",
-            "horizontal_strategy": "lines",
-            "intersection_y_tolerance": 15,
-            "intersection_x_tolerance": 15
-        }
-        self.licitacion_patterns = {
-            'section_header': r'^(SECCI[OÓ]N|CAP[IÍ]TULO)\s+[IVXLCDM]+\s*[-:]?\s*(.*)$',
-            'subsection': r'^\d+\.\d+\.?\s*(.*)$',
-            'item': r'^\d+\.\d+\.\d+\.?\s*(.*)$'
-        }
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, List, Dict, Iterable, Iterator, Sequence, Tuple, Union
 
-    def extract_text(self, pdf_path: str, use_ocr: bool = True, extract_tables: bool = True) -> dict:
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"El archivo {pdf_path} no existe")
-        result = {
-            'text': '',
-            'tables': [],
-            'metadata': self._extract_metadata(pdf_path)
-        }
-        text = ''
-        # Extraer texto con fitz (PyMuPDF)
-        text = self._ensure_str(self._extract_with_fitz(pdf_path))
-        # Si el texto es pobre o se fuerza OCR, usar EasyOCR
-        if use_ocr or self._needs_ocr(text):
-            ocr_text = self._ensure_str(self._extract_with_easyocr(pdf_path))
-            if ocr_text.strip():
-                text += "\n" + ocr_text
-        text = self._process_licitacion_text(text)
-        if extract_tables:
-            tables = self._extract_tables_advanced(pdf_path)
-            result['tables'] = tables
-            table_text = self._ensure_str(self._format_tables_for_text(tables))
-            if table_text.strip():
-                text += "\n" + table_text
-        result['text'] = self._clean_text(self._ensure_str(text))
-        return result
+from .extraction_cache import (ExtractionCache, cached_extraction, get_default_cache,
+                               get_default_page_store)
+from .instrumentation import ExtractionTimings, TimingHook, measure, memory_tracing, share
+from .ocr_pool import OCREnginePool, get_ocr_pool
+from .ocr_preprocess import PROBE_DPI, analyze_probe, binarize, choose_dpi
+from .pdf_document import PDFDocument, PDFSource, pixmap_to_array, pixmap_to_image, read_pdf_source
+from .table_formatter import TABLE_FORMATS, format_tables
+from .tesseract_batch import (DEFAULT_TESSERACT_CONFIG, TesseractBatchError, TesseractTimeout,
+                              recognize_images, save_image, select_language)
+from .text_normalizer import LICITACION_PATTERNS, LicitacionTextNormalizer
 
-    def _extract_with_easyocr(self, pdf_path: str) -> str:
-        """Extrae texto usando EasyOCR página por página."""
-        ocr_text = ""
-        with fitz.open(pdf_path) as doc:
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                pix = page.get_pixmap(dpi=300)
-                img_bytes = pix.tobytes("png")
-                try:
-                    with Image.open(io.BytesIO(img_bytes)) as img:
-                        img = img.convert("RGB")
-                        # EasyOCR espera numpy array
-                        import numpy as np
-                        np_img = np.array(img)
-                        result = self.reader.readtext(np_img, detail=0)
-                        raw = "\n".join(result)
-                        filtered = self._filter_licitacion_content(raw)
-                        filtered = self._ensure_str(filtered)
-                        ocr_text += filtered + "\n"
-                except Exception as e:
-                    print(f"[EasyOCR ERROR] página {page_num+1}: {repr(e)}")
-                    continue
-        return ocr_text
-
-    def _needs_ocr(self, text: str, threshold: int = 100) -> bool:
-        clean_text = re.sub(r'\s+', '', text)
-        return len(clean_text) < threshold
-
-    def _extract_metadata(self, pdf_path: str) -> dict:
-        with fitz.open(pdf_path) as doc:
-            return {
-                'pages': len(doc),
-                'title': doc.metadata.get('title', ''),
-                'author': doc.metadata.get('author', ''),
-                'creation_date': doc.metadata.get('creationDate', '')
-            }
+if TYPE_CHECKING:
+    import fitz
 
-    def _extract_with_fitz(self, pdf_path: str) -> str:
-        text = ""
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                text += page.get_text("text") + "\n"
-        return text
+# Configuración por defecto para la detección de tablas con pdfplumber
+DEFAULT_TABLE_SETTINGS = {
+    "vertical_strategy": "lines", 
+    "horizontal_strategy": "lines",
+    "intersection_y_tolerance": 15,
+    "intersection_x_tolerance": 15
+}
 
-    def _filter_licitacion_content(self, text: str) -> str:
-        patterns_to_filter = [
-            r'DIRECCI[OÓ]N:.*PLATAFORMA GUBERNAMENTAL.*QUITO-ECUADOR',
-            r'SERCOP.*SERVICIO NACIONAL DE CONTRATACI[OÓ]N P[UÚ]BLICA',
-            r'GOBIERNO.*ECUADOR',
-            r'C[OÓ]DIGO POSTAL:\s*\d{6}',
-            r'^\s*\d+\s*$',
-            r'^\s*-\s*$',
-            r'^\s*\.+\s*$',
-            r'^\s*[_\-=]+\s*$'
-        ]
-        if not isinstance(text, str):
-            text = " ".join(str(x) for x in text)
-        filtered_lines = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            should_filter = any(re.search(pattern, line, re.IGNORECASE) for pattern in patterns_to_filter)
-            if not should_filter:
-                filtered_lines.append(line)
-        return "\n".join(filtered_lines)
+# Estrategias de pdfplumber que solo encuentran tablas a partir de líneas dibujadas
+RULING_STRATEGIES = ("lines", "lines_strict")
 
-    def _process_licitacion_text(self, text: str) -> str:
-        corrections = {
-            r'(\w)\s*-\s*(\w)': r'\1-\2',
-            r'ﬁ': 'fi',
-            r'ﬀ': 'ff',
-            r'ﬂ': 'fl',
-            r'(\d)\s+(\d)': r'\1\2',
-            r'\b([A-Z])\s+([A-Z])\b': r'\1\2',
-            r'\b(\d+)\s*\.\s*(\d+)\b': r'\1.\2',
-            r'\b([a-z])\s+([a-z])\b': r'\1\2',
-        }
-        for pattern, replacement in corrections.items():
-            text = re.sub(pattern, replacement, text)
-        lines = text.splitlines()
-        processed_lines = []
-        current_section = ""
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            section_match = re.match(self.licitacion_patterns['section_header'], line)
-            subsection_match = re.match(self.licitacion_patterns['subsection'], line)
-            item_match = re.match(self.licitacion_patterns['item'], line)
-            if section_match:
-                current_section = f"\nSECCIÓN {section_match.group(1).strip()}: {section_match.group(2).strip()}\n"
-                processed_lines.append(current_section)
-            elif subsection_match:
-                processed_lines.append(f"\nSubsección: {subsection_match.group(1).strip()}\n")
-            elif item_match:
-                processed_lines.append(f"• {item_match.group(1).strip()}")
-            else:
-                processed_lines.append(line)
-        return "\n".join(processed_lines)
+# Motivos de `_needs_ocr` por los que una página necesita OCR
+OCR_REASONS_NEEDED = ('sin_texto', 'texto_ilegible')
 
-    def _extract_tables_advanced(self, pdf_path: str) -> list:
-        tables = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                page_tables = page.extract_tables(self.table_settings)
-                for table_data in page_tables:
-                    cleaned_table = [
-                        [self._clean_table_cell(cell) if cell is not None else "" for cell in row]
-                        for row in table_data
-                    ]
-                    if any(any(cell.strip() for cell in row) for row in cleaned_table):
-                        tables.append({
-                            'page': page_num + 1,
-                            'table': cleaned_table
-                        })
-        return tables
+# Cada cuánto se comprueba la cancelación mientras se esperan bloques de otros procesos
+CANCEL_POLL_SECONDS = 0.5
 
-    def _clean_table_cell(self, cell: str) -> str:
-        if not cell:
-            return ""
-        cell = re.sub(r'\s+', ' ', str(cell)).strip()
-        cell = re.sub(r'[^\w\s\-$%.,;:()/\'"&@#]', '', cell)
-        return cell
+# Ejecutable de Tesseract del proceso (ver `resolve_tesseract_cmd`). Se guarda aquí
+# y no en pytesseract para no importarlo (ni a pandas con él) salvo que se use
+_tesseract_cmd = 'tesseract'
 
-    def _format_tables_for_text(self, tables: list) -> str:
-        table_text = ""
-        for i, table_data in enumerate(tables, 1):
-            table_text += f"\n\nTABLA {i} (Página {table_data['page']}):\n"
-            import pandas as pd
-            df = pd.DataFrame(table_data['table'])
-            for _, row in df.iterrows():
-                formatted_row = " | ".join(f"{str(cell):<30}" for cell in row)
-                table_text += formatted_row + "\n"
-        return table_text
+# Modo triage: las primeras páginas (convocatoria, presupuesto) y una muestra
+# repartida por el resto del documento, sin OCR ni detección de tablas
+TRIAGE_HEAD_PAGES = 5
+TRIAGE_SAMPLE_PAGES = 12
 
-    def _ensure_str(self, value) -> str:
-        if isinstance(value, str):
-            return value
-        if isinstance(value, (list, tuple)):
-            return "\n".join(self._ensure_str(x) for x in value)
-        try:
-            return str(value)
-        except Exception:
-            return ""
+# Selección de páginas (base 1): "1-5,8,10-" o un iterable de números de página
+PageSelection = Union[str, Iterable[int], None]
+_PAGE_RANGE_RE = re.compile(r'(\d+)(?:\s*(-)\s*(\d+)?)?')
 
-    @staticmethod
-    def _clean_text(text: str) -> str:
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = re.sub(r'(\w)-\s+(\w)', r'\1-\2', text)
-        text = re.sub(r'([a-z])\s+([A-Z])', r'\1 \2', text)
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-        replacements = {
-            'Ã¡': 'á', 'Ã©': 'é', 'Ã': 'í', 'Ã³': 'ó', 'Ãº': 'ú',
-            'Ã±': 'ñ', 'Ã': 'Ñ', 'Â°': '°', 'â€“': '-', 'â€œ': '"',
-            'â€': '"', 'â€™': "'", 'â€¢': '-'
-        }
-        for wrong, right in replacements.items():
-            text = text.replace(wrong, right)
-        return text
+# Motores de detección de tablas disponibles
+TABLE_BACKENDS = ('pdfplumber', 'pymupdf')
+
+# Opciones de pdfplumber que `page.find_tables()` de PyMuPDF acepta con el mismo nombre
+PYMUPDF_TABLE_OPTIONS = (
+    "vertical_strategy", "horizontal_strategy",
+    "snap_tolerance", "snap_x_tolerance", "snap_y_tolerance",
+    "join_tolerance", "join_x_tolerance", "join_y_tolerance",
+    "edge_min_length", "min_words_vertical", "min_words_horizontal",
+    "intersection_tolerance", "intersection_x_tolerance", "intersection_y_tolerance",
+    "text_tolerance", "text_x_tolerance", "text_y_tolerance",
+)
+
+
+class ExtractionCancelled(Exception):
+    """La extracción se detuvo porque se activó su evento de cancelación."""
 
-# Función helper para EasyOCR
-def extract_text_from_pdf_easyocr(pdf_path: str, use_ocr: bool = True, extract_tables: bool = True) -> dict:
-    """
-    Extrae texto de PDF usando EasyOCR y tablas con pdfplumber.
-    Args:
-        pdf_path: Ruta al archivo PDF.
-        use_ocr: Si True, fuerza el uso de OCR.
-        extract_tables: Si True, extrae y procesa tablas por separado.
-    Returns:
-        Diccionario con texto estructurado y tablas.
-    """
-    extractor = PDFTextExtractorEasyOCR()
-    return extractor.extract_text(pdf_path, use_ocr, extract_tables)
-import pandas as pd
 
 class PDFTextExtractor:
     """
@@ -250,164 +88,763 @@ class PDFTextExtractor:
     
     Args:
         tesseract_path (str, optional): Ruta personalizada al ejecutable de Tesseract OCR.
-        table_settings (dict, optional): Configuración personalizada para extracción de tablas.
+        table_settings (dict, optional): Configuración personalizada para extracción de tablas
+            (nombres de opciones de pdfplumber; se traducen para PyMuPDF).
+        workers (int, optional): Número de procesos para repartir las páginas. Con 1
+            (por defecto) la extracción es secuencial.
+        min_pages_per_shard (int, optional): Tamaño mínimo de cada bloque de páginas
+            enviado a un proceso.
+        ocr_min_chars (int, optional): Caracteres visibles mínimos para considerar
+            que una página tiene una capa de texto utilizable.
+        ocr_grayscale (bool, optional): Renderiza las páginas para OCR en escala de
+            grises (un tercio de la memoria de RGB). Por defecto True.
+        ocr_dpi (int, optional): Resolución fija para OCR. Con None (por defecto) se
+            elige por página entre 150 y 300 dpi según la altura de las líneas,
+            estimada con un renderizado de prueba a baja resolución.
+        ocr_binarize (bool, optional): Pasa las páginas a blanco y negro (umbral de
+            Otsu) antes del OCR. Por defecto False.
+        ocr_deskew (bool, optional): Endereza los escaneos inclinados (hasta ±5°)
+            al renderizarlos para OCR. Por defecto False.
+        ocr_page_timeout (float, optional): Segundos máximos de OCR por página. Las
+            páginas que lo superan se omiten y se informan en el resultado.
+        document_timeout (float, optional): Segundos máximos de la extracción del
+            documento; agotados, el resto de páginas se entregan sin OCR.
+        page_store (ExtractionCache, optional): Almacén de resultados por página.
+            Las páginas cuya huella ya está guardada (p. ej. las que no cambian en
+            una adenda del pliego) reutilizan su texto, OCR y tablas. Solo se
+            guardan las páginas que pasaron por OCR o por la detección de tablas.
+        timing_hook (callable, optional): Recibe cada medición de etapa (documento o
+            página) a medida que se produce; ver `ExtractionTimings`.
+        trace_memory (bool, optional): Mide el pico de memoria asignada por etapa
+            con tracemalloc (tiene un coste apreciable). Por defecto False.
+        table_format (str, optional): Formato de las tablas dentro del texto:
+            'text' (columnas alineadas, por defecto), 'tsv' o 'markdown'.
+        table_prefilter (bool, optional): Omite pdfplumber en las páginas sin líneas
+            ni rectángulos suficientes para formar una tabla. Solo se aplica con
+            las estrategias basadas en líneas. Por defecto True.
+        table_backend (str, optional): Motor de detección de tablas: 'pdfplumber'
+            (por defecto) o 'pymupdf' (`page.find_tables()`, nativo y sin volver a
+            parsear el PDF en Python).
+        ocr_batch_size (int, optional): Páginas que se reconocen juntas en una sola
+            ejecución de Tesseract. Por defecto 8.
     """
     
     def __init__(self, tesseract_path: Optional[str] = None, 
-                 table_settings: Optional[Dict] = None):
-        self._configure_tesseract(tesseract_path)
-        self.table_settings = table_settings or {
-            "vertical_strategy": "lines", 
-            "horizontal_strategy": "lines",
-            "intersection_y_tolerance": 15,
-            "intersection_x_tolerance": 15
-        }
+                 table_settings: Optional[Dict] = None,
+                 workers: int = 1,
+                 min_pages_per_shard: int = 4,
+                 ocr_min_chars: int = 100,
+                 ocr_grayscale: bool = True,
+                 table_format: str = 'text',
+                 table_prefilter: bool = True,
+                 table_backend: str = 'pdfplumber',
+                 ocr_batch_size: int = 8,
+                 ocr_dpi: Optional[int] = None,
+                 ocr_binarize: bool = False,
+                 ocr_deskew: bool = False,
+                 ocr_page_timeout: Optional[float] = None,
+                 document_timeout: Optional[float] = None,
+                 page_store: Optional[ExtractionCache] = None,
+                 timing_hook: Optional[TimingHook] = None,
+                 trace_memory: bool = False):
+        if table_format not in TABLE_FORMATS:
+            raise ValueError(
+                f"Formato de tabla no soportado: {table_format!r} (opciones: {', '.join(TABLE_FORMATS)})"
+            )
+        if table_backend not in TABLE_BACKENDS:
+            raise ValueError(
+                f"Motor de tablas no soportado: {table_backend!r} (opciones: {', '.join(TABLE_BACKENDS)})"
+            )
+        self.table_format = table_format
+        self.table_backend = table_backend
+        self._setup_ocr_engine(tesseract_path)
+        self.ocr_min_chars = ocr_min_chars
+        self.ocr_grayscale = ocr_grayscale
+        self.ocr_batch_size = max(1, ocr_batch_size)
+        self.ocr_dpi = ocr_dpi
+        self.ocr_binarize = ocr_binarize
+        self.ocr_deskew = ocr_deskew
+        self.ocr_page_timeout = ocr_page_timeout
+        self.document_timeout = document_timeout
+        self.page_store = page_store
+        self.timing_hook = timing_hook
+        self.trace_memory = trace_memory
+        self.workers = max(1, workers or 1)
+        self.min_pages_per_shard = max(1, min_pages_per_shard)
+        self.table_settings = table_settings or dict(DEFAULT_TABLE_SETTINGS)
+        self.table_prefilter = table_prefilter and self._ruling_based(self.table_settings)
         # Patrones específicos para documentos de licitación
-        self.licitacion_patterns = {
-            'section_header': r'^(SECCI[OÓ]N|CAP[IÍ]TULO)\s+[IVXLCDM]+\s*[-:]?\s*(.*)$',
-            'subsection': r'^\d+\.\d+\.?\s*(.*)$',
-            'item': r'^\d+\.\d+\.\d+\.?\s*(.*)$'
-        }
+        self.licitacion_patterns = dict(LICITACION_PATTERNS)
+        self.normalizer = LicitacionTextNormalizer(self.licitacion_patterns)
     
+    def __getstate__(self) -> Dict:
+        # El hook (p. ej. una lambda) no viaja a los procesos: las mediciones de cada
+        # página vuelven con su registro y el hook se llama en el proceso principal
+        state = self.__dict__.copy()
+        state['timing_hook'] = None
+        return state
+
+    def _setup_ocr_engine(self, tesseract_path: Optional[str] = None) -> None:
+        """Prepara el motor OCR usado por `_ocr_image` (Tesseract por defecto)."""
+        self._configure_tesseract(tesseract_path)
+
     def _configure_tesseract(self, tesseract_path: Optional[str] = None) -> None:
-        """Configura el path de Tesseract OCR con verificación mejorada."""
-        if tesseract_path:
-            if not os.path.exists(tesseract_path):
-                raise FileNotFoundError(f"Tesseract no encontrado en: {tesseract_path}")
-            pytesseract.pytesseract.tesseract_cmd = tesseract_path
-        else:
-            # Rutas comunes por sistema operativo
-            paths_by_os = {
-                "Windows": [
-                    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"
-                ],
-                "Linux": ["/usr/bin/tesseract"],
-                "Darwin": ["/usr/local/bin/tesseract"]
-            }
-            
-            # Probar rutas hasta encontrar una válida
-            for path in paths_by_os.get(platform.system(), []):
-                if os.path.exists(path):
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    return
-            
-            raise pytesseract.TesseractNotFoundError(
-                "No se pudo encontrar Tesseract OCR. Por favor especifique la ruta manualmente."
-            )
+        """Configura el path de Tesseract OCR (la búsqueda se hace una vez por proceso)."""
+        _set_tesseract_cmd(resolve_tesseract_cmd(tesseract_path))
     
-    def extract_text(self, pdf_path: str, use_ocr: bool = False, 
-                    extract_tables: bool = True) -> Dict[str, str]:
-        if not os.path.exists(pdf_path):
+    def extract_text(self, pdf_path: PDFSource, use_ocr: bool = False, 
+                    extract_tables: bool = True,
+                    cancel: Optional[threading.Event] = None,
+                    pages: PageSelection = None,
+                    triage: bool = False) -> Dict[str, str]:
+        """
+        Extrae texto, tablas y metadatos de un PDF.
+
+        `pdf_path` puede ser una ruta, el contenido del PDF en memoria (bytes,
+        bytearray, memoryview) o un objeto tipo archivo binario, p. ej. una subida.
+
+        Si se activa `cancel` (p. ej. desde otro hilo al desconectarse el cliente),
+        la extracción se detiene y lanza ExtractionCancelled.
+
+        `pages` limita la extracción a esas páginas (base 1, p. ej. "1-5,8,10-");
+        las que no existen en el documento se ignoran. Con `triage` solo se extrae
+        la capa de texto de una muestra de páginas (ver `triage_sample`), sin OCR
+        ni tablas, para decidir rápido qué hacer con el documento. Las páginas
+        extraídas quedan en metadata['pages_extracted'].
+
+        metadata['timings'] contiene el tiempo de pared, de CPU y el pico de memoria
+        por etapa y por página (ver `ExtractionTimings.as_dict`).
+        """
+        if _is_path(pdf_path) and not os.path.exists(pdf_path):
             raise FileNotFoundError(f"El archivo {pdf_path} no existe")
         
+        timings = ExtractionTimings(self.timing_hook)
         try:
-            result = {
-                'text': '',
-                'tables': [],
-                'metadata': self._extract_metadata(pdf_path)
-            }
-            
-            # Extracción de texto principal (aseguramos string)
-            text = self._ensure_str(self._extract_with_fitz(pdf_path))
-            
-            # OCR complementario si es necesario
-            if use_ocr or self._needs_ocr(text):
-                ocr_text = self._ensure_str(self._extract_with_ocr(pdf_path))
-                if ocr_text.strip():
-                    text += "\n" + ocr_text
-            
-            # Procesamiento especial para documentos de licitación
-            text = self._process_licitacion_text(text)
+            with memory_tracing(self.trace_memory), measure() as total:
+                # El PDF se abre una sola vez y se comparte entre todas las etapas
+                with measure(self.trace_memory) as opening:
+                    session = PDFDocument(pdf_path)
+                timings.add('open', opening)
+                with session:
+                    result = self._extract_from_session(session, use_ocr, extract_tables,
+                                                        cancel, timings, pages, triage)
+            result['metadata']['timings'] = timings.as_dict(total)
+            return result
             
-            # Extracción de tablas (manejo seguro)
-            if extract_tables:
-                tables = self._extract_tables_advanced(pdf_path)
-                result['tables'] = tables
-                table_text = self._ensure_str(self._format_tables_for_text(tables))
+        except ExtractionCancelled:
+            raise
+        except Exception as e:
+            # Propagar con la traza real para debug si quieres, pero mantenemos el mensaje como antes
+            raise Exception(f"Error al procesar {_source_name(pdf_path)}: {str(e)}")
+
+    def iter_pages(self, pdf_path: PDFSource, use_ocr: bool = False,
+                   extract_tables: bool = True,
+                   cancel: Optional[threading.Event] = None,
+                   pages: PageSelection = None,
+                   triage: bool = False) -> Iterator[Dict]:
+        """
+        Extrae el PDF página por página, entregando cada una en cuanto termina.
+        Acepta las mismas fuentes, evento de cancelación y selección de páginas
+        (`pages`, `triage`) que `extract_text`. Las páginas no se agrupan en
+        lotes de OCR; con `workers` > 1 llegan por bloques, a medida que cada
+        proceso termina el suyo.
+
+        Yields:
+            Diccionario por página con:
+            - 'page': Número de página
+            - 'total_pages': Páginas del documento
+            - 'text': Texto procesado y limpio de la página
+            - 'tables': Tablas de la página (mismo formato que `extract_text`)
+            - 'tables_skipped': Si el prefiltro evitó buscar tablas en la página
+            - 'ocr': Si la página pasó por OCR
+            - 'ocr_reason': Motivo de la decisión de OCR
+            - 'ocr_dpi': Resolución usada para el OCR (None sin OCR)
+            - 'ocr_skew': Inclinación corregida, en grados
+            - 'ocr_seconds': Tiempo de renderizado y reconocimiento de la página
+            - 'ocr_timeout': Presupuesto agotado ('pagina' o 'documento') si el OCR
+              de la página se omitió por tiempo; None en otro caso
+            - 'page_key': Clave de la página en `page_store` (None sin almacén)
+            - 'page_cache_hit': Si la página se tomó del almacén
+            - 'timings': Mediciones de cada etapa de la página (también se
+              entregan a `timing_hook`)
+        """
+        if _is_path(pdf_path) and not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"El archivo {pdf_path} no existe")
+
+        timings = ExtractionTimings(self.timing_hook)
+        with memory_tracing(self.trace_memory), PDFDocument(pdf_path) as session:
+            n_pages = session.page_count
+            page_numbers = select_pages(n_pages, pages, triage)
+            # Páginas de una en una: cada una se entrega sin esperar al OCR de las
+            # siguientes (extract_text sí reconoce por lotes de `ocr_batch_size`)
+            for record in self._iter_page_records(session, page_numbers, use_ocr and not triage,
+                                                  extract_tables and not triage, cancel, triage,
+                                                  batch_size=1):
+                page_timings = record['timings']
+                with measure(self.trace_memory) as stats:
+                    text = self._process_licitacion_text(record['text'])
+                page_timings['normalization'] = stats
+                with measure(self.trace_memory) as stats:
+                    table_text = self._ensure_str(self._format_tables_for_text(record['tables']))
+                page_timings['table_formatting'] = stats
                 if table_text.strip():
                     text += "\n" + table_text
- 
+                with measure(self.trace_memory) as stats:
+                    text = self._clean_text(text)
+                page_timings['clean'] = stats
+                timings.add_page(record['page'], page_timings)
+                yield {
+                    'page': record['page'],
+                    'total_pages': n_pages,
+                    'text': text,
+                    'tables': record['tables'],
+                    'tables_skipped': record['tables_skipped'],
+                    'ocr': record['ocr'],
+                    'ocr_reason': record['ocr_reason'],
+                    'ocr_dpi': record['ocr_dpi'],
+                    'ocr_skew': record['ocr_skew'],
+                    'ocr_seconds': record['ocr_seconds'],
+                    'ocr_timeout': record['ocr_timeout'],
+                    'page_key': record['page_key'],
+                    'page_cache_hit': record['page_cache_hit'],
+                    'timings': page_timings
+                }
+
+    def _extract_from_session(self, session: PDFDocument, use_ocr: bool,
+                              extract_tables: bool,
+                              cancel: Optional[threading.Event] = None,
+                              timings: Optional[ExtractionTimings] = None,
+                              pages: PageSelection = None,
+                              triage: bool = False) -> Dict:
+        """Ejecuta todas las etapas de extracción sobre un documento ya abierto."""
+        timings = timings if timings is not None else ExtractionTimings(self.timing_hook)
+        if triage:
+            use_ocr = extract_tables = False
+        with measure(self.trace_memory) as stats:
+            metadata = self._extract_metadata(session)
+        timings.add('metadata', stats)
+        result = {
+            'text': '',
+            'tables': [],
+            'metadata': metadata
+        }
+        page_numbers = select_pages(result['metadata']['pages'], pages, triage)
+        records = []
+        for record in self._iter_page_records(session, page_numbers, use_ocr,
+                                              extract_tables, cancel, triage):
+            timings.add_page(record['page'], record.pop('timings'))
+            records.append(record)
+
+        # Páginas extraídas (todas salvo que se pidiera una selección o triage)
+        result['metadata']['pages_extracted'] = [record['page'] for record in records]
+        result['metadata']['triage'] = triage
+        # Páginas sin capa de texto utilizable que el triage no reconoció
+        result['metadata']['ocr_skipped'] = [
+            record['page'] for record in records
+            if not record['ocr'] and record['ocr_reason'] in OCR_REASONS_NEEDED
+        ]
+
+        # Páginas en las que el prefiltro evitó la detección de tablas
+        result['metadata']['table_pages_skipped'] = sum(
+            1 for record in records if record['tables_skipped']
+        )
+
+        # Decisión de OCR por página
+        result['metadata']['page_ocr'] = [
+            {
+                'page': record['page'],
+                'ocr': record['ocr'],
+                'reason': record['ocr_reason'],
+                'chars': record['chars'],
+                'dpi': record['ocr_dpi'],
+                'skew': record['ocr_skew'],
+                'seconds': record['ocr_seconds'],
+                'timeout': record['ocr_timeout']
+            }
+            for record in records
+        ]
+
+        # Páginas cuyo OCR se omitió por agotar su presupuesto de tiempo
+        result['metadata']['ocr_timeouts'] = [
+            {'page': record['page'], 'budget': record['ocr_timeout']}
+            for record in records if record['ocr_timeout']
+        ]
+        result['metadata']['partial'] = bool(result['metadata']['ocr_timeouts'])
+
+        # Reutilización de páginas de revisiones anteriores
+        hits = sum(1 for record in records if record['page_cache_hit'])
+        result['metadata']['page_cache'] = {
+            'enabled': self.page_store is not None,
+            'hits': hits,
+            'misses': len(records) - hits,
+            'pages': [
+                {'page': record['page'], 'key': record['page_key'], 'hit': record['page_cache_hit']}
+                for record in records
+            ]
+        }
+
+        # Procesamiento especial para documentos de licitación
+        with measure(self.trace_memory) as stats:
+            text = self._process_licitacion_text("".join(record['text'] for record in records))
+        timings.add('normalization', stats)
+
+        # Tablas en orden de página
+        if extract_tables:
+            tables = [table for record in records for table in record['tables']]
+            result['tables'] = tables
+            with measure(self.trace_memory) as stats:
+                table_text = self._ensure_str(self._format_tables_for_text(tables))
+            timings.add('table_formatting', stats)
+            if table_text.strip():
+                text += "\n" + table_text
+
+        with measure(self.trace_memory) as stats:
             result['text'] = self._clean_text(self._ensure_str(text))
-            return result
-            
+        timings.add('clean', stats)
+        return result
+
+    def _process_pages(self, session: PDFDocument, page_numbers: Sequence[int],
+                       use_ocr: bool, extract_tables: bool,
+                       deadline: Optional[float] = None,
+                       cancel: Optional[threading.Event] = None,
+                       skip_ocr: bool = False) -> List[Dict]:
+        """
+        Registros de `_extract_pages` para un bloque de páginas, tomando del
+        `page_store` las páginas ya extraídas con la misma huella y opciones.
+        Añade a cada registro 'page_key', 'page_cache_hit' y, en 'timings', la
+        medición de la búsqueda en el almacén ('page_cache'). Solo se guardan
+        las páginas nuevas que son caras de rehacer (ver `_worth_storing`).
+
+        Sin OCR (`skip_ocr`, modo triage) no se usa el almacén: calcular la huella
+        cuesta más que leer la capa de texto, y sus registros no deben reutilizarse
+        en una extracción completa.
+        """
+        if self.page_store is None or skip_ocr:
+            records = self._extract_pages(session, page_numbers, use_ocr, extract_tables,
+                                          deadline, cancel, skip_ocr)
+            for record in records:
+                record.update(page_key=None, page_cache_hit=False)
+            return records
+
+        options = self._page_options(use_ocr, extract_tables)
+        keys, cached, lookups = [], {}, {}
+        for page_num in page_numbers:
+            with measure(self.trace_memory) as lookups[page_num]:
+                key = self._page_key(session, page_num, options)
+                cached[page_num] = self.page_store.get(key) if key else None
+            keys.append(key)
+        missing = [page_num for page_num in page_numbers if cached[page_num] is None]
+        fresh = dict(zip(missing, self._extract_pages(session, missing, use_ocr, extract_tables,
+                                                      deadline, cancel)))
+
+        records, new_entries = [], {}
+        for page_num, key in zip(page_numbers, keys):
+            if page_num in fresh:
+                record = fresh[page_num]
+                # Las páginas que agotaron su tiempo se reintentarán la próxima vez
+                if key and not record['ocr_timeout'] and self._worth_storing(record, extract_tables):
+                    new_entries[key] = {k: v for k, v in record.items() if k != 'timings'}
+                record.update(page_key=key, page_cache_hit=False)
+            else:
+                record = _restore_page_record(cached[page_num], page_num)
+                record.update(page_key=key, page_cache_hit=True, timings={})
+            record['timings']['page_cache'] = lookups[page_num]
+            records.append(record)
+        try:
+            self.page_store.put_many(new_entries)
+        except OSError as e:
+            print(f"[CACHE WARN] No se pudieron guardar {len(new_entries)} páginas: {e!r}")
+        return records
+
+    @staticmethod
+    def _worth_storing(record: Dict, extract_tables: bool) -> bool:
+        """
+        Solo se guardan las páginas caras de rehacer: las que pasaron por OCR o por
+        la detección de tablas. Una página digital sin líneas de tabla se vuelve a
+        extraer más rápido de lo que cuesta escribirla y leerla del almacén.
+        """
+        return record['ocr'] or (extract_tables and not record['tables_skipped'])
+
+    def _page_options(self, use_ocr: bool, extract_tables: bool) -> Dict:
+        """Opciones que influyen en el registro de una página (parte de su clave)."""
+        return {
+            'engine': type(self).__name__,
+            'use_ocr': use_ocr,
+            'extract_tables': extract_tables,
+            'ocr_min_chars': self.ocr_min_chars,
+            'ocr_grayscale': self.ocr_grayscale,
+            'ocr_dpi': self.ocr_dpi,
+            'ocr_binarize': self.ocr_binarize,
+            'ocr_deskew': self.ocr_deskew,
+            'table_settings': self.table_settings,
+            'table_prefilter': self.table_prefilter,
+            'table_backend': self.table_backend
+        }
+
+    def _page_key(self, session: PDFDocument, page_num: int, options: Dict) -> Optional[str]:
+        """Clave de la página en `page_store`, o None si no se pudo calcular su huella."""
+        try:
+            return ExtractionCache.make_page_key(session.page_fingerprint(page_num), **options)
         except Exception as e:
-            # Propagar con la traza real para debug si quieres, pero mantenemos el mensaje como antes
-            raise Exception(f"Error al procesar {pdf_path}: {str(e)}")
+            print(f"[CACHE WARN] Sin huella para la página {page_num+1}: {e!r}")
+            return None
 
+    def _extract_pages(self, session: PDFDocument, page_numbers: Sequence[int],
+                       use_ocr: bool, extract_tables: bool,
+                       deadline: Optional[float] = None,
+                       cancel: Optional[threading.Event] = None,
+                       skip_ocr: bool = False) -> List[Dict]:
+        """
+        Procesa un bloque de páginas: capa de texto, decisión y OCR, y tablas.
+        Las páginas del bloque que necesitan OCR se reconocen juntas (ver `_ocr_pages`),
+        sin pasar de `deadline` (instante límite del documento, en `time.time()`).
+        Con `skip_ocr` la decisión se registra pero ninguna página se reconoce.
 
+        Returns:
+            Un diccionario por página con 'page', 'text' (texto sin procesar, con el
+            OCR añadido), 'tables', 'tables_skipped' (el prefiltro descartó la
+            página), 'ocr', 'ocr_reason', 'chars', 'ocr_dpi', 'ocr_skew',
+            'ocr_seconds', 'ocr_timeout' y 'timings' (mediciones por etapa:
+            'fitz_text', 'ocr' y 'tables').
+        """
+        page_timings = {page_num: {} for page_num in page_numbers}
+        pages = []
+        for page_num in page_numbers:
+            with measure(self.trace_memory) as page_timings[page_num]['fitz_text']:
+                pages.append(self._fitz_page(session, page_num))
+
+        # OCR solo si la página no tiene capa de texto utilizable (o si se fuerza)
+        decisions = [(True, 'forzado') if use_ocr else self._needs_ocr(page) for page in pages]
+        ocr_numbers = [page_num for page_num, (needs_ocr, _) in zip(page_numbers, decisions)
+                       if needs_ocr and not skip_ocr]
+        with measure(self.trace_memory) as ocr_stats:
+            ocr_results = dict(zip(ocr_numbers, self._ocr_pages(session, ocr_numbers,
+                                                                deadline, cancel)))
+        for page_num in ocr_numbers:
+            # Las páginas de un lote se reconocen juntas: se reparte la medición
+            page_timings[page_num]['ocr'] = share(ocr_stats, len(ocr_numbers))
+
+        records = []
+        for page_num, page, (needs_ocr, reason) in zip(page_numbers, pages, decisions):
+            text = self._ensure_str(page['text'])
+            ocr = ocr_results.get(page_num, {})
+            ocr_text = self._ensure_str(ocr.get('text', ""))
+            if ocr_text.strip():
+                text += "\n" + ocr_text + "\n"
+
+            tables, tables_skipped = [], False
+            if extract_tables:
+                with measure(self.trace_memory) as page_timings[page_num]['tables']:
+                    tables_skipped = not self._may_have_tables(session, page_num)
+                    if not tables_skipped:
+                        tables = self._tables_page(session, page_num)
+
+            records.append({
+                'page': page['page'],
+                'text': text,
+                'tables': tables,
+                'tables_skipped': tables_skipped,
+                'ocr': needs_ocr and not skip_ocr,
+                'ocr_reason': reason,
+                'chars': page['chars'],
+                'ocr_dpi': ocr.get('dpi'),
+                'ocr_skew': ocr.get('skew', 0.0),
+                'ocr_seconds': ocr.get('seconds', 0.0),
+                'ocr_timeout': ocr.get('timeout'),
+                'timings': page_timings[page_num]
+            })
+        return records
+
+    def _ocr_batches(self, page_numbers: Sequence[int],
+                     batch_size: Optional[int] = None) -> List[Sequence[int]]:
+        """Divide las páginas en bloques de `batch_size` (o `ocr_batch_size`), conservando el orden."""
+        size = batch_size or self.ocr_batch_size
+        return [page_numbers[i:i + size] for i in range(0, len(page_numbers), size)]
+
+    def _iter_page_records(self, session: PDFDocument, page_numbers: Sequence[int],
+                           use_ocr: bool, extract_tables: bool,
+                           cancel: Optional[threading.Event] = None,
+                           skip_ocr: bool = False,
+                           batch_size: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Genera los registros de `_process_pages` en orden de página.
+        Sin pool se procesan en este proceso sobre la sesión abierta, en bloques
+        de `batch_size` páginas (por defecto `ocr_batch_size`): los registros de
+        un bloque se entregan cuando termina el bloque completo; con pool,
+        cada proceso recibe el PDF una vez al arrancar y, por cada bloque contiguo
+        de páginas, abre su propia sesión; los bloques se entregan en orden a
+        medida que terminan.
+
+        La cancelación se comprueba entre bloques; los procesos reciben el instante
+        límite del documento, pero no el evento (no se puede compartir entre procesos).
+        """
+        deadline = time.time() + self.document_timeout if self.document_timeout else None
+        pool = self._page_pool(len(page_numbers), session.source)
+        if pool is None:
+            for batch in self._ocr_batches(page_numbers, batch_size):
+                _check_cancelled(cancel)
+                yield from self._process_pages(session, batch, use_ocr, extract_tables,
+                                               deadline, cancel, skip_ocr)
+            return
+
+        completed = False
+        try:
+            futures = [
+                pool.submit(_run_page_shard, self, shard, use_ocr, extract_tables,
+                            deadline, skip_ocr)
+                for shard in self._page_shards(page_numbers)
+            ]
+            for future in futures:
+                yield from _wait_cancellable(future, cancel)
+            completed = True
+        finally:
+            # Si el consumidor abandona el generador, cancelar los bloques pendientes sin esperar
+            pool.shutdown(wait=completed, cancel_futures=True)
+
+    def _page_shards(self, page_numbers: Sequence[int]) -> List[Sequence[int]]:
+        """Divide la lista de páginas en bloques contiguos, conservando el orden."""
+        # Varios bloques por proceso para equilibrar páginas lentas (p. ej. escaneadas)
+        n_pages = len(page_numbers)
+        n_shards = min(self.workers * 4, max(1, n_pages // self.min_pages_per_shard))
+        size, extra = divmod(n_pages, n_shards)
+        shards = []
+        start = 0
+        for i in range(n_shards):
+            stop = start + size + (1 if i < extra else 0)
+            shards.append(page_numbers[start:stop])
+            start = stop
+        return shards
+
+    def _page_pool(self, n_pages: int,
+                   source: Optional[PDFSource] = None) -> Optional[ProcessPoolExecutor]:
+        """
+        Crea el pool de procesos si la extracción paralela aplica a este documento.
+
+        El origen del PDF se entrega una sola vez a cada proceso al arrancarlo;
+        los bloques solo envían sus números de página.
+        """
+        if self.workers <= 1 or n_pages < 2 * self.min_pages_per_shard:
+            return None
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   initializer=_init_page_worker,
+                                   initargs=(source, _tesseract_cmd))
+
+    def _needs_ocr(self, page: Dict) -> Tuple[bool, str]:
+        """
+        Decide si una página necesita OCR a partir de su capa de texto.
+
+        Returns:
+            Tupla (necesita_ocr, motivo). Motivos: 'texto_suficiente',
+            'sin_texto', 'texto_ilegible' y 'sin_imagenes' (página casi vacía
+            sin imágenes que reconocer).
+        """
+        if page['chars'] >= self.ocr_min_chars:
+            # Capas de texto con fuentes sin mapa Unicode producen basura ilegible
+            if page['garbage_ratio'] > 0.3:
+                return True, 'texto_ilegible'
+            return False, 'texto_suficiente'
+        if not page['has_images']:
+            return False, 'sin_imagenes'
+        return True, 'sin_texto'
     
-    def _needs_ocr(self, text: str, threshold: int = 100) -> bool:
-        """Determina si el texto extraído necesita OCR complementario."""
-        # Eliminar espacios y saltos de línea para evaluación
-        clean_text = re.sub(r'\s+', '', text)
-        return len(clean_text) < threshold
-    
-    def _extract_metadata(self, pdf_path: str) -> Dict:
+    def _extract_metadata(self, session: PDFDocument) -> Dict:
         """Extrae metadatos básicos del PDF."""
-        with fitz.open(pdf_path) as doc:
-            return {
-                'pages': len(doc),
-                'title': doc.metadata.get('title', ''),
-                'author': doc.metadata.get('author', ''),
-                'creation_date': doc.metadata.get('creationDate', '')
-            }
+        return session.metadata
     
 
     
-    def _extract_with_ocr(self, pdf_path: str) -> str:
-        """OCR robusto: intenta spa, hace fallback y evita errores de permiso cerrando imágenes."""
-        ocr_text = ""
-
-        # Intentar asegurar variables de entorno y comando
-        # Ajusta la ruta si tu tesseract está en otra carpeta
-        possible_tess_base = r"C:\Program Files\Tesseract-OCR"
-        if os.path.exists(possible_tess_base):
-            os.environ.setdefault('TESSDATA_PREFIX', os.path.join(possible_tess_base, "tessdata"))
-            pytesseract.pytesseract.tesseract_cmd = os.path.join(possible_tess_base, "tesseract.exe")
-
-        with fitz.open(pdf_path) as doc:
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                pix = page.get_pixmap(dpi=300)
-
-                # Generar bytes PNG en memoria y abrir con contexto para asegurar cierre
-                img_bytes = pix.tobytes("png")
+    def _extract_with_ocr(self, session: PDFDocument,
+                          page_numbers: Optional[Sequence[int]] = None) -> List[str]:
+        """
+        OCR robusto página por página: evita errores de permiso cerrando imágenes.
+        Devuelve el texto filtrado de cada página solicitada, en el mismo orden.
+        """
+        pages = range(session.page_count) if page_numbers is None else page_numbers
+        return [ocr['text'] for batch in self._ocr_batches(pages)
+                for ocr in self._ocr_pages(session, batch)]
+
+    def _ocr_budget(self, n_pages: int,
+                    deadline: Optional[float]) -> Tuple[Optional[float], Optional[str]]:
+        """
+        Segundos disponibles para reconocer `n_pages` páginas y el presupuesto que
+        los limita ('pagina' o 'documento'); (None, None) si no hay límite.
+        """
+        limits = []
+        if self.ocr_page_timeout:
+            limits.append((self.ocr_page_timeout * n_pages, 'pagina'))
+        if deadline is not None:
+            limits.append((deadline - time.time(), 'documento'))
+        return min(limits) if limits else (None, None)
+
+    def _ocr_pages(self, session: PDFDocument, page_numbers: Sequence[int],
+                   deadline: Optional[float] = None,
+                   cancel: Optional[threading.Event] = None) -> List[Dict]:
+        """
+        OCR de varias páginas con una sola ejecución de Tesseract (ver
+        `recognize_images`). Cada página se renderiza una vez a disco y se
+        reconoce como mucho una vez: si una página agota `ocr_page_timeout` (o el
+        documento su presupuesto), se conservan las páginas ya reconocidas, la
+        página lenta se omite y las siguientes se reconocen en otra ejecución
+        sobre las mismas imágenes. Si el lote falla por otro motivo, las páginas
+        pendientes se reintentan de una en una.
+
+        Returns:
+            Un diccionario por página, como los de `_ocr_page`. El tiempo de cada
+            ejecución se reparte por igual entre las páginas que reconoció.
+        """
+        if not page_numbers:
+            return []
+        results = [{'text': "", 'dpi': None, 'skew': 0.0, 'timeout': None, 'seconds': 0.0}
+                   for _ in page_numbers]
+        if deadline is not None and deadline <= time.time():
+            for result in results:
+                result['timeout'] = 'documento'
+            return results
+        tesseract_cmd = _tesseract_cmd
+        lang = select_language(tesseract_cmd)
+
+        with tempfile.TemporaryDirectory(prefix="neurobit_ocr_") as tmp_dir:
+            # Las páginas se rasterizan y se escriben de una en una: solo una en memoria
+            paths = {}
+            for i, page_num in enumerate(page_numbers):
+                _check_cancelled(cancel)
+                start = time.perf_counter()
                 try:
-                    with Image.open(io.BytesIO(img_bytes)) as img:
-                        # Forzar a RGB por seguridad (evita ciertos problemas con tesseract)
-                        img = img.convert("RGB")
-
-                        # Intento principal: idioma español
-                        raw = ""
-                        try:
-                            raw = pytesseract.image_to_string(img, lang='spa', config='--oem 3 --psm 3')
-                        except Exception as e_spa:
-                            # Aviso y fallback: intentar sin especificar idioma o con 'eng'
-                            print(f"[OCR WARN] spa failed on page {page_num+1}: {repr(e_spa)} -- intentando fallback...")
-                            try:
-                                raw = pytesseract.image_to_string(img, config='--oem 3 --psm 3')
-                            except Exception as e_fallback:
-                                print(f"[OCR ERROR] fallback also failed on page {page_num+1}: {repr(e_fallback)}")
-                                raw = ""
-
-                        # Filtrar y asegurar string
-                        filtered = self._filter_licitacion_content(raw)
-                        filtered = self._ensure_str(filtered)
-
-                        ocr_text += filtered + "\n"
-
-                except PermissionError as perr:
-                    # Mensaje claro para que cierres cualquier visor de PDF o proceso que bloquee el archivo
-                    print(f"[PERMISSION ERROR] No se pudo procesar la página {page_num+1}: {perr}")
-                    print("Cierra cualquier visor/editor que esté usando el PDF y vuelve a intentarlo.")
-                    # continuamos a la siguiente página en vez de romper todo
-                    continue
+                    pix, info = self._render_for_ocr(session, page_num)
+                    results[i].update(info)
+                    paths[i] = save_image(pix, tmp_dir, f"{page_num + 1:05d}")
                 except Exception as e:
                     print(f"[UNEXPECTED ERROR] página {page_num+1}: {repr(e)}")
-                    continue
+                results[i]['seconds'] = time.perf_counter() - start
+
+            pending = list(paths)
+            one_by_one = False
+            while pending:
+                _check_cancelled(cancel)
+                if deadline is not None and deadline <= time.time():
+                    for i in pending:
+                        results[i]['timeout'] = 'documento'
+                    break
+                batch = pending[:1] if one_by_one else pending
+                start = time.perf_counter()
+                skipped = None
+                try:
+                    texts = recognize_images(tesseract_cmd, [paths[i] for i in batch], lang=lang,
+                                             timeout=None if deadline is None else deadline - time.time(),
+                                             cancel=cancel, page_timeout=self.ocr_page_timeout)
+                except TesseractTimeout as e:
+                    _check_cancelled(cancel)
+                    texts = e.pages[:len(batch)]
+                    # Si todas las páginas terminaron antes del límite, ninguna se omite
+                    if len(texts) < len(batch):
+                        skipped = batch[len(texts)]
+                        budget = 'pagina' if e.page_limit else 'documento'
+                        print(f"[OCR WARN] página {page_numbers[skipped]+1} omitida por tiempo ({budget}): {e}")
+                        results[skipped]['timeout'] = budget
+                except Exception as e:
+                    _check_cancelled(cancel)
+                    level = "OCR WARN" if isinstance(e, TesseractBatchError) else "UNEXPECTED ERROR"
+                    if len(batch) > 1:
+                        print(f"[{level}] lote de {len(batch)} páginas: {e!r} -- se reintenta página por página")
+                        one_by_one = True
+                        continue
+                    print(f"[{level}] página {page_numbers[batch[0]]+1}: {e!r}")
+                    texts, skipped = [], batch[0]
+
+                processed = batch[:len(texts) + (skipped is not None)]
+                recognition = (time.perf_counter() - start) / len(processed)
+                for i in processed:
+                    results[i]['seconds'] += recognition
+                for i, raw in zip(batch, texts):
+                    results[i]['text'] = self._ensure_str(self._filter_licitacion_content(raw))
+                pending = pending[len(processed):]
 
-        return ocr_text
+        for result in results:
+            result['seconds'] = round(result['seconds'], 3)
+        return results
+
+    def _render_for_ocr(self, session: PDFDocument, page_num: int) -> Tuple["fitz.Pixmap", Dict]:
+        """
+        Renderiza una página para OCR con la resolución y el enderezado que le
+        corresponden (ver `ocr_preprocess`), binarizada si se pidió.
+
+        Returns:
+            Tupla (pixmap, {'dpi': resolución usada, 'skew': grados corregidos}).
+        """
+        dpi, skew = self.ocr_dpi, 0.0
+        if dpi is None or self.ocr_deskew:
+            probe = session.render_page(page_num, dpi=PROBE_DPI, grayscale=True)
+            line_px, skew = analyze_probe(probe, deskew=self.ocr_deskew)
+            if dpi is None:
+                dpi = choose_dpi(line_px)
+        # El pixmap se entrega al motor OCR sin pasar por PNG
+        pix = session.render_page(page_num, dpi=dpi, grayscale=self.ocr_grayscale, rotate=-skew)
+        if self.ocr_binarize:
+            pix = binarize(pix)
+        return pix, {'dpi': dpi, 'skew': skew}
+
+    def _ocr_page(self, session: PDFDocument, page_num: int,
+                  deadline: Optional[float] = None,
+                  cancel: Optional[threading.Event] = None) -> Dict:
+        """
+        Renderiza una página, la pasa por OCR y filtra el ruido institucional.
+
+        Returns:
+            Diccionario con 'text' (texto filtrado), 'dpi', 'skew', 'seconds' y
+            'timeout' (presupuesto agotado, si el OCR se omitió por tiempo).
+        """
+        _check_cancelled(cancel)
+        start = time.perf_counter()
+        result = {'text': "", 'dpi': None, 'skew': 0.0, 'timeout': None}
+        timeout, budget = self._ocr_budget(1, deadline)
+        if budget == 'documento' and timeout <= 0:
+            result.update(timeout='documento', seconds=0.0)
+            return result
+        try:
+            pix, info = self._render_for_ocr(session, page_num)
+            result.update(info)
+            raw = self._ocr_image(pix, page_num, timeout)
+
+            # Filtrar y asegurar string
+            filtered = self._filter_licitacion_content(raw)
+            result['text'] = self._ensure_str(filtered)
+
+        except PermissionError as perr:
+            # Mensaje claro para que cierres cualquier visor de PDF o proceso que bloquee el archivo
+            print(f"[PERMISSION ERROR] No se pudo procesar la página {page_num+1}: {perr}")
+            print("Cierra cualquier visor/editor que esté usando el PDF y vuelve a intentarlo.")
+            # continuamos a la siguiente página en vez de romper todo
+        except TimeoutError as e:
+            print(f"[OCR WARN] página {page_num+1} omitida por tiempo ({budget}): {e}")
+            result['timeout'] = budget
+        except Exception as e:
+            print(f"[UNEXPECTED ERROR] página {page_num+1}: {repr(e)}")
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        return result
+
+    def _ocr_image(self, pix, page_num: int, timeout: Optional[float] = None) -> str:
+        """
+        Reconoce el texto de una página renderizada con Tesseract.
+        Lanza TimeoutError si el reconocimiento supera `timeout` segundos.
+        """
+        import pytesseract
+
+        pytesseract.pytesseract.tesseract_cmd = _tesseract_cmd
+        img = pixmap_to_image(pix)
+        # 'spa' si está instalado; la comprobación se hace una vez por proceso
+        lang = select_language(_tesseract_cmd)
+        try:
+            return pytesseract.image_to_string(img, lang=lang, config=DEFAULT_TESSERACT_CONFIG,
+                                               timeout=max(timeout, 0.01) if timeout else 0)
+        except RuntimeError as e:
+            # pytesseract mata el proceso y lo informa con este RuntimeError
+            if str(e) == 'Tesseract process timeout':
+                raise TimeoutError(f"Tesseract superó {timeout:.1f}s") from e
+            print(f"[OCR ERROR] página {page_num+1}: {repr(e)}")
+            return ""
+        except Exception as e:
+            print(f"[OCR ERROR] página {page_num+1}: {repr(e)}")
+            return ""
 
 
     
@@ -418,43 +855,8 @@ class PDFTextExtractor:
         - Números de página
         - Ruido común en estos documentos
         """
-
         text = self._ensure_str(text)
-
-        # Patrones comunes en documentos de licitación ecuatoriana
-        patterns_to_filter = [
-            # Patrones SERCOP
-            r'DIRECCI[OÓ]N:.*PLATAFORMA GUBERNAMENTAL.*QUITO-ECUADOR',
-            r'SERCOP.*SERVICIO NACIONAL DE CONTRATACI[OÓ]N P[UÚ]BLICA',
-            r'GOBIERNO.*ECUADOR',
-            r'C[OÓ]DIGO POSTAL:\s*\d{6}',
-            
-            # Números de página
-            r'^\s*\d+\s*$',
-            
-            # Ruido común
-            r'^\s*-\s*$',
-            r'^\s*\.+\s*$',
-            r'^\s*[_\-=]+\s*$'
-        ]
-        
-        if not isinstance(text, str):
-            text = " ".join(str(x) for x in text)
-
-        filtered_lines = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Verificar si la línea coincide con patrones a filtrar
-            should_filter = any(re.search(pattern, line, re.IGNORECASE) 
-                              for pattern in patterns_to_filter)
-            
-            if not should_filter:
-                filtered_lines.append(line)
-        
-        return "\n".join(filtered_lines)
+        return self.normalizer.filter_noise(text)
     
     def _process_licitacion_text(self, text: str) -> str:
         """
@@ -463,55 +865,37 @@ class PDFTextExtractor:
         - Corregir errores comunes
         - Estructurar el contenido
         """
-        # Corrección de errores comunes en OCR de documentos técnicos
-        corrections = {
-            r'(\w)\s*-\s*(\w)': r'\1-\2',  # Unir palabras separadas incorrectamente
-            r'ﬁ': 'fi',
-            r'ﬀ': 'ff',
-            r'ﬂ': 'fl',
-            r'(\d)\s+(\d)': r'\1\2',  # Unir números separados
-            r'\b([A-Z])\s+([A-Z])\b': r'\1\2',  # Unir siglas
-            r'\b(\d+)\s*\.\s*(\d+)\b': r'\1.\2',  # Decimales mal separados
-            r'\b([a-z])\s+([a-z])\b': r'\1\2',  # Unir palabras cortadas
-        }
-        
-        for pattern, replacement in corrections.items():
-            text = re.sub(pattern, replacement, text)
-        
-        # Identificación de estructura del documento
-        lines = text.splitlines()
-        processed_lines = []
-        current_section = ""
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Detección de secciones y subsecciones
-            section_match = re.match(self.licitacion_patterns['section_header'], line)
-            subsection_match = re.match(self.licitacion_patterns['subsection'], line)
-            item_match = re.match(self.licitacion_patterns['item'], line)
-            
-            if section_match:
-                current_section = f"\nSECCIÓN {section_match.group(1).strip()}: {section_match.group(2).strip()}\n"
-                processed_lines.append(current_section)
-            elif subsection_match:
-                processed_lines.append(f"\nSubsección: {subsection_match.group(1).strip()}\n")
-            elif item_match:
-                processed_lines.append(f"• {item_match.group(1).strip()}")
-            else:
-                processed_lines.append(line)
-        
-        return "\n".join(processed_lines)
+        return self.normalizer.process(text)
     
-    def _extract_with_fitz(self, pdf_path: str) -> str:
-        """Extrae texto usando PyMuPDF (fitz) con manejo mejorado de formatos."""
-        text = ""
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                text += page.get_text("text") + "\n"
-        return text
+    def _extract_with_fitz(self, session: PDFDocument,
+                           page_numbers: Optional[Sequence[int]] = None) -> List[Dict]:
+        """
+        Extrae texto usando PyMuPDF (fitz) con manejo mejorado de formatos.
+
+        Returns:
+            Lista de diccionarios por página con:
+            - 'page': Número de página
+            - 'text': Texto de la capa de texto
+            - 'chars': Caracteres visibles (sin espacios)
+            - 'garbage_ratio': Proporción de caracteres ilegibles
+            - 'has_images': Si la página contiene imágenes
+        """
+        numbers = range(session.page_count) if page_numbers is None else page_numbers
+        return [self._fitz_page(session, page_num) for page_num in numbers]
+
+    def _fitz_page(self, session: PDFDocument, page_num: int) -> Dict:
+        """Capa de texto de una página y los indicadores usados por `_needs_ocr`."""
+        page = session.load_page(page_num)
+        text = page.get_text("text") + "\n"
+        visible = re.sub(r'\s+', '', text)
+        garbage = sum(1 for ch in visible if ch == '\ufffd' or not ch.isprintable())
+        return {
+            'page': page_num + 1,
+            'text': text,
+            'chars': len(visible),
+            'garbage_ratio': garbage / len(visible) if visible else 0.0,
+            'has_images': bool(page.get_image_info())
+        }
 
     def _ensure_str(self, value) -> str:
         """
@@ -530,37 +914,103 @@ class PDFTextExtractor:
             return ""
 
 
-    def _extract_tables_advanced(self, pdf_path: str) -> List[Dict]:
+    def _extract_tables_advanced(self, session: PDFDocument,
+                                 page_numbers: Optional[Sequence[int]] = None) -> List[Dict]:
         """
         Extrae tablas con manejo mejorado para formatos complejos de licitaciones.
         
+        Args:
+            page_numbers: Páginas (base 0) a procesar; por defecto, todas.
+
         Returns:
             Lista de diccionarios con:
             - 'page': Número de página
             - 'table': Datos de la tabla (lista de listas)
         """
+        pages = range(session.page_count) if page_numbers is None else page_numbers
+        return [table for page_num in pages if self._may_have_tables(session, page_num)
+                for table in self._tables_page(session, page_num)]
+
+    def _raw_tables_page(self, session: PDFDocument, page_num: int) -> List[List[List[Optional[str]]]]:
+        """Tablas de una página sin limpiar, con el motor configurado."""
+        if self.table_backend == 'pymupdf':
+            finder = session.load_page(page_num).find_tables(**self._pymupdf_table_settings())
+            return [table.extract() for table in finder.tables]
+        # Extraer tablas con configuración personalizada
+        return session.plumber_page(page_num).extract_tables(self.table_settings)
+
+    def _pymupdf_table_settings(self) -> Dict:
+        """Traduce `table_settings` (formato pdfplumber) a argumentos de `find_tables`."""
+        settings = {key: value for key, value in self.table_settings.items()
+                    if key in PYMUPDF_TABLE_OPTIONS}
+        if self.table_settings.get("explicit_vertical_lines"):
+            settings["vertical_lines"] = self.table_settings["explicit_vertical_lines"]
+        if self.table_settings.get("explicit_horizontal_lines"):
+            settings["horizontal_lines"] = self.table_settings["explicit_horizontal_lines"]
+        return settings
+
+    @staticmethod
+    def _ruling_based(table_settings: Dict) -> bool:
+        """Indica si la configuración solo detecta tablas a partir de líneas dibujadas."""
+        return (
+            table_settings.get("vertical_strategy", "lines") in RULING_STRATEGIES
+            and table_settings.get("horizontal_strategy", "lines") in RULING_STRATEGIES
+            and not table_settings.get("explicit_vertical_lines")
+            and not table_settings.get("explicit_horizontal_lines")
+        )
+
+    def _may_have_tables(self, session: PDFDocument, page_num: int) -> bool:
+        """
+        Prefiltro barato (dibujos de PyMuPDF) antes de pdfplumber.
+
+        Con estrategias de líneas, pdfplumber solo devuelve tablas de al menos dos
+        celdas: hacen falta dos bordes horizontales, dos verticales y un quinto que
+        divida el recuadro. Un rectángulo aporta dos de cada orientación (el fondo
+        blanco de la página es uno); en caso de duda (curvas, diagonales) se cuenta
+        hacia arriba para no perder tablas.
+        """
+        if not self.table_prefilter:
+            return True
+
+        horizontal = vertical = 0
+        for path in session.load_page(page_num).get_drawings():
+            for item in path['items']:
+                kind = item[0]
+                if kind in ('re', 'qu'):
+                    horizontal += 2
+                    vertical += 2
+                elif kind == 'l':
+                    p1, p2 = item[1], item[2]
+                    is_h = abs(p1.y - p2.y) <= 1
+                    is_v = abs(p1.x - p2.x) <= 1
+                    horizontal += 1 if is_h or not is_v else 0
+                    vertical += 1 if is_v or not is_h else 0
+                else:
+                    # Curvas: pdfplumber las convierte en varios bordes
+                    return True
+            if horizontal >= 2 and vertical >= 2 and horizontal + vertical >= 5:
+                return True
+        return False
+
+    def _tables_page(self, session: PDFDocument, page_num: int) -> List[Dict]:
+        """Tablas limpias de una página, con el formato de `_extract_tables_advanced`."""
         tables = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                # Extraer tablas con configuración personalizada
-                page_tables = page.extract_tables(self.table_settings)
-                
-                for table_data in page_tables:
-                    # Limpieza de celdas
-                    cleaned_table = []
-                    for row in table_data:
-                        cleaned_row = [
-                            self._clean_table_cell(cell) if cell is not None else ""
-                            for cell in row
-                        ]
-                        cleaned_table.append(cleaned_row)
-                    
-                    # Solo agregar tablas con contenido válido
-                    if any(any(cell.strip() for cell in row) for row in cleaned_table):
-                        tables.append({
-                            'page': page_num + 1,
-                            'table': cleaned_table
-                        })
+        for table_data in self._raw_tables_page(session, page_num):
+            # Limpieza de celdas
+            cleaned_table = []
+            for row in table_data:
+                cleaned_row = [
+                    self._clean_table_cell(cell) if cell is not None else ""
+                    for cell in row
+                ]
+                cleaned_table.append(cleaned_row)
+            
+            # Solo agregar tablas con contenido válido
+            if any(any(cell.strip() for cell in row) for row in cleaned_table):
+                tables.append({
+                    'page': page_num + 1,
+                    'table': cleaned_table
+                })
         
         return tables
 
@@ -579,62 +1029,416 @@ class PDFTextExtractor:
     
     def _format_tables_for_text(self, tables: List[Dict]) -> str:
         """Formatea las tablas extraídas para inclusión en el texto plano."""
-        table_text = ""
-        for i, table_data in enumerate(tables, 1):
-            table_text += f"\n\nTABLA {i} (Página {table_data['page']}):\n"
-            
-            # Convertir a DataFrame para manejo más fácil
-            df = pd.DataFrame(table_data['table'])
-            
-            # Formatear como texto con alineación
-            for _, row in df.iterrows():
-                formatted_row = " | ".join(f"{str(cell):<30}" for cell in row)
-                table_text += formatted_row + "\n"
-        
-        return table_text
+        return format_tables(tables, self.table_format)
     
     @staticmethod
     def _clean_text(text: str) -> str:
         """Limpia y normaliza el texto extraído con reglas específicas para licitaciones."""
-        # Normalización de espacios
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Unir líneas que probablemente fueron separadas incorrectamente
-        text = re.sub(r'(\w)-\s+(\w)', r'\1-\2', text)  # Palabras con guiones
-        text = re.sub(r'([a-z])\s+([A-Z])', r'\1 \2', text)  # Evitar unir párrafos
-        
-        # Eliminar caracteres no imprimibles pero preservar símbolos importantes
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        return LicitacionTextNormalizer.clean(text)
 
-    
 
-        
-        # Corrección de encodings comunes
-        replacements = {
-            'Ã¡': 'á', 'Ã©': 'é', 'Ã': 'í', 'Ã³': 'ó', 'Ãº': 'ú',
-            'Ã±': 'ñ', 'Ã': 'Ñ', 'Â°': '°', 'â€“': '-', 'â€œ': '"',
-            'â€': '"', 'â€™': "'", 'â€¢': '-'
-        }
-        
-        for wrong, right in replacements.items():
-            text = text.replace(wrong, right)
-        
-        return text
+
+@lru_cache(maxsize=None)
+def resolve_tesseract_cmd(tesseract_path: Optional[str] = None) -> str:
+    """
+    Localiza el ejecutable de Tesseract OCR con verificación mejorada.
+
+    El resultado se memoriza por proceso: las peticiones siguientes no vuelven a
+    recorrer el sistema de archivos. Los errores no se memorizan.
+    """
+    if tesseract_path:
+        if not os.path.exists(tesseract_path):
+            raise FileNotFoundError(f"Tesseract no encontrado en: {tesseract_path}")
+        return tesseract_path
+
+    # Rutas comunes por sistema operativo
+    paths_by_os = {
+        "Windows": [
+            r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+            r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"
+        ],
+        "Linux": ["/usr/bin/tesseract"],
+        "Darwin": ["/usr/local/bin/tesseract"]
+    }
+
+    # Probar rutas hasta encontrar una válida
+    cmd = next((path for path in paths_by_os.get(platform.system(), []) if os.path.exists(path)), None)
+    if cmd is None:
+        from pytesseract import TesseractNotFoundError
+
+        # TesseractNotFoundError no acepta mensaje propio
+        print("[OCR ERROR] No se pudo encontrar Tesseract OCR. Por favor especifique la ruta manualmente.")
+        raise TesseractNotFoundError()
+
+    # Intentar asegurar variables de entorno y comando
+    # Ajusta la ruta si tu tesseract está en otra carpeta
+    possible_tess_base = r"C:\Program Files\Tesseract-OCR"
+    if os.path.exists(possible_tess_base):
+        os.environ.setdefault('TESSDATA_PREFIX', os.path.join(possible_tess_base, "tessdata"))
+        cmd = os.path.join(possible_tess_base, "tesseract.exe")
+    return cmd
+
+
+def parse_page_ranges(pages: PageSelection) -> Optional[List[Tuple[int, Optional[int]]]]:
+    """
+    Interpreta una selección de páginas (base 1) como rangos inclusivos (inicio, fin);
+    fin None significa hasta la última página.
+
+    Acepta una cadena como "1-5,8,10-" o un iterable de números de página. Devuelve
+    None si no hay selección (todas las páginas) y lanza ValueError si no es válida.
+    """
+    if pages is None:
+        return None
+    if isinstance(pages, str):
+        if not pages.strip():
+            return None
+        ranges = []
+        for part in pages.split(','):
+            match = _PAGE_RANGE_RE.fullmatch(part.strip())
+            if not match:
+                raise ValueError(f"Rango de páginas no válido: {part.strip()!r} (ejemplo: '1-5,8,10-')")
+            start, dash, end = match.groups()
+            ranges.append((int(start), int(end) if end else (None if dash else int(start))))
+    else:
+        ranges = [(int(page), int(page)) for page in pages]
+        if not ranges:
+            return None
+    for start, end in ranges:
+        if start < 1:
+            raise ValueError(f"Las páginas se numeran desde 1: {start}")
+        if end is not None and end < start:
+            raise ValueError(f"Rango de páginas no válido: {start}-{end}")
+    return ranges
+
+
+def triage_sample(page_numbers: Sequence[int], head: int = TRIAGE_HEAD_PAGES,
+                  size: int = TRIAGE_SAMPLE_PAGES) -> List[int]:
+    """
+    Muestra de hasta `size` páginas: las `head` primeras y el resto repartidas
+    uniformemente hasta la última, en orden.
+    """
+    page_numbers = list(page_numbers)
+    if len(page_numbers) <= size:
+        return page_numbers
+    head = min(head, size - 1)
+    rest = page_numbers[head:]
+    picks = size - head
+    step = (len(rest) - 1) / max(picks - 1, 1)
+    sample = {rest[round(i * step)] for i in range(picks)} if picks > 1 else {rest[-1]}
+    return page_numbers[:head] + sorted(sample)
+
+
+def select_pages(n_pages: int, pages: PageSelection = None, triage: bool = False) -> List[int]:
+    """Páginas (base 0) a extraer de un documento de `n_pages` páginas, en orden."""
+    ranges = parse_page_ranges(pages)
+    if ranges is None:
+        numbers = list(range(n_pages))
+    else:
+        selected = set()
+        for start, end in ranges:
+            selected.update(range(start - 1, min(end or n_pages, n_pages)))
+        numbers = sorted(selected)
+    return triage_sample(numbers) if triage else numbers
+
+
+def _set_tesseract_cmd(cmd: str) -> None:
+    global _tesseract_cmd
+    _tesseract_cmd = cmd
+
+
+def _is_path(source: PDFSource) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def _source_name(source: PDFSource) -> str:
+    """Nombre legible del origen para mensajes (sin volcar el contenido en memoria)."""
+    return os.fspath(source) if _is_path(source) else "PDF en memoria"
+
+
+def _restore_page_record(record: Dict, page_num: int) -> Dict:
+    """Registro guardado en `page_store`, renumerado a su posición en este documento."""
+    record = dict(record)
+    record['page'] = page_num + 1
+    record['tables'] = [dict(table, page=page_num + 1) for table in record['tables']]
+    # Reutilizar la página no costó tiempo de OCR
+    record['ocr_seconds'] = 0.0
+    return record
+
+
+def _check_cancelled(cancel: Optional[threading.Event]) -> None:
+    if cancel is not None and cancel.is_set():
+        raise ExtractionCancelled("Extracción cancelada")
+
+
+def _wait_cancellable(future, cancel: Optional[threading.Event]):
+    """Resultado de `future`, comprobando `cancel` mientras se espera."""
+    if cancel is None:
+        return future.result()
+    while True:
+        _check_cancelled(cancel)
+        try:
+            return future.result(timeout=CANCEL_POLL_SECONDS)
+        except FuturesTimeoutError:
+            continue
+
+
+# Origen del PDF del proceso de trabajo, fijado por `_init_page_worker`
+_worker_source: Optional[PDFSource] = None
+
+
+def _init_page_worker(source: PDFSource, tesseract_cmd: str) -> None:
+    """Inicializador de cada proceso del pool: guarda el origen del PDF y el comando de Tesseract."""
+    global _worker_source
+    _worker_source = source
+    _set_tesseract_cmd(tesseract_cmd)
+
+
+def _run_page_shard(extractor: PDFTextExtractor, shard: Sequence[int],
+                    use_ocr: bool, extract_tables: bool,
+                    deadline: Optional[float] = None, skip_ocr: bool = False) -> List[Dict]:
+    """Punto de entrada de cada bloque: abre el PDF del proceso y procesa sus páginas."""
+    with memory_tracing(extractor.trace_memory), PDFDocument(_worker_source) as session:
+        return [record for batch in extractor._ocr_batches(shard)
+                for record in extractor._process_pages(session, batch, use_ocr,
+                                                       extract_tables, deadline,
+                                                       skip_ocr=skip_ocr)]
 
 
 # Función de conveniencia mejorada
-def extract_text_from_pdf(pdf_path: str, use_ocr: bool = False, 
-                         extract_tables: bool = True) -> Dict[str, str]:
+def extract_text_from_pdf(pdf_path: PDFSource, use_ocr: bool = False, 
+                         extract_tables: bool = True, workers: int = 1,
+                         table_settings: Optional[Dict] = None,
+                         cache: Optional[ExtractionCache] = None,
+                         use_cache: bool = True,
+                         table_format: str = 'text',
+                         table_backend: str = 'pdfplumber',
+                         ocr_page_timeout: Optional[float] = None,
+                         document_timeout: Optional[float] = None,
+                         cancel: Optional[threading.Event] = None,
+                         page_store: Optional[ExtractionCache] = None,
+                         timing_hook: Optional[TimingHook] = None,
+                         trace_memory: bool = False,
+                         pages: PageSelection = None,
+                         triage: bool = False) -> Dict[str, str]:
     """
     Función helper mejorada para extraer texto de un PDF con opciones configurables.
     
     Args:
-        pdf_path: Ruta al archivo PDF.
+        pdf_path: Ruta al archivo PDF, contenido en memoria (bytes, bytearray,
+            memoryview) u objeto tipo archivo binario.
         use_ocr: Si True, fuerza el uso de OCR.
         extract_tables: Si True, extrae y procesa tablas por separado.
+        workers: Procesos para extraer páginas en paralelo (1 = secuencial).
+        table_settings: Configuración de pdfplumber para tablas (por defecto
+            DEFAULT_TABLE_SETTINGS).
+        cache: Caché de resultados a usar; por defecto la compartida del proceso
+            (ver `get_default_cache`).
+        use_cache: Si False, ignora la caché (también la de páginas) y siempre extrae.
+        table_format: Formato de las tablas en el texto ('text', 'tsv' o 'markdown').
+        table_backend: Motor de detección de tablas ('pdfplumber' o 'pymupdf').
+        ocr_page_timeout: Segundos máximos de OCR por página (None = sin límite).
+        document_timeout: Segundos máximos de la extracción (None = sin límite).
+        cancel: Evento que detiene la extracción (lanza ExtractionCancelled).
+        page_store: Almacén de resultados por página; por defecto el compartido
+            del proceso (ver `get_default_page_store`).
+        timing_hook: Recibe cada medición de etapa a medida que se produce.
+        trace_memory: Si True, mide el pico de memoria asignada por etapa.
+        pages: Páginas a extraer (base 1, p. ej. "1-5,8,10-"); por defecto, todas.
+        triage: Si True, solo la capa de texto de una muestra de páginas, sin OCR
+            ni tablas (ver `PDFTextExtractor.extract_text`).
         
+    Returns:
+        Diccionario con texto estructurado y tablas. Si alguna página agotó su
+        tiempo, metadata['partial'] es True y el resultado no se guarda en caché.
+    """
+    # Una ruta no se carga en memoria: la clave de caché se calcula leyendo el archivo
+    # por bloques y el extractor lo abre directamente. El resto se lee una sola vez y
+    # los mismos bytes sirven para la clave y la extracción
+    source = pdf_path if _is_path(pdf_path) else read_pdf_source(pdf_path)
+
+    def extract() -> Dict:
+        extractor = PDFTextExtractor(table_settings=table_settings, workers=workers,
+                                     table_format=table_format, table_backend=table_backend,
+                                     ocr_page_timeout=ocr_page_timeout,
+                                     document_timeout=document_timeout,
+                                     page_store=(page_store or get_default_page_store())
+                                     if use_cache else None,
+                                     timing_hook=timing_hook, trace_memory=trace_memory)
+        return extractor.extract_text(source, use_ocr, extract_tables, cancel, pages, triage)
+
+    if not use_cache:
+        return extract()
+
+    options = {
+        'use_ocr': use_ocr,
+        'extract_tables': extract_tables,
+        'table_settings': table_settings or DEFAULT_TABLE_SETTINGS,
+        'table_format': table_format,
+        'table_backend': table_backend,
+        'pages': parse_page_ranges(pages),
+        'triage': triage
+    }
+    return cached_extraction(source, options, extract, cache or get_default_cache())
+
+
+# --- EasyOCR extractor ---
+class PDFTextExtractorEasyOCR(PDFTextExtractor):
+    """
+    Extrae texto de PDFs usando EasyOCR, con soporte para:
+    - Documentos de licitación
+    - Extracción de tablas (pdfplumber o PyMuPDF)
+    - Filtrado y procesamiento avanzado
+
+    Comparte el flujo de PDFTextExtractor y solo cambia el motor OCR. Se ejecuta
+    siempre en un único proceso: el lector de EasyOCR no se puede serializar y
+    ya paraleliza internamente con torch.
+
+    `readtext` no se puede interrumpir: con límite de tiempo cada página se
+    reconoce en un hilo propio y, si vence, se abandona. Las páginas siguientes
+    esperan en la misma cola, así que el lector nunca se usa desde dos hilos.
+
+    Args:
+        reader (easyocr.Reader, optional): Lector ya inicializado (p. ej. prestado
+            por `get_easyocr_pool`). Si no se indica, se crea uno nuevo.
+    """
+    def __init__(self, languages=None, table_settings=None, ocr_min_chars: int = 100,
+                 ocr_grayscale: bool = True, table_format: str = 'text',
+                 table_backend: str = 'pdfplumber', reader=None,
+                 ocr_dpi: Optional[int] = None, ocr_binarize: bool = False,
+                 ocr_deskew: bool = False, ocr_page_timeout: Optional[float] = None,
+                 document_timeout: Optional[float] = None):
+        self.languages = languages or ['es', 'en']
+        self.reader = reader
+        self._ocr_executor: Optional[ThreadPoolExecutor] = None
+        self._ocr_job = None
+        super().__init__(table_settings=table_settings, ocr_min_chars=ocr_min_chars,
+                         ocr_grayscale=ocr_grayscale, table_format=table_format,
+                         table_backend=table_backend, ocr_dpi=ocr_dpi,
+                         ocr_binarize=ocr_binarize, ocr_deskew=ocr_deskew,
+                         ocr_page_timeout=ocr_page_timeout,
+                         document_timeout=document_timeout)
+
+    @property
+    def ocr_busy(self) -> bool:
+        """Si el lector sigue ocupado con un reconocimiento abandonado por tiempo."""
+        return self._ocr_job is not None and not self._ocr_job.done()
+
+    def _setup_ocr_engine(self, tesseract_path: Optional[str] = None) -> None:
+        if self.reader is None:
+            self.reader = _new_easyocr_reader(self.languages)
+
+    def extract_text(self, pdf_path: PDFSource, use_ocr: bool = True, extract_tables: bool = True,
+                     cancel: Optional[threading.Event] = None, pages: PageSelection = None,
+                     triage: bool = False) -> dict:
+        return super().extract_text(pdf_path, use_ocr, extract_tables, cancel, pages, triage)
+
+    def _ocr_pages(self, session: PDFDocument, page_numbers: Sequence[int],
+                   deadline: Optional[float] = None,
+                   cancel: Optional[threading.Event] = None) -> List[Dict]:
+        # EasyOCR reconoce en el mismo proceso: no hay lotes que agrupar
+        return [self._ocr_page(session, page_num, deadline, cancel) for page_num in page_numbers]
+
+    def _ocr_image(self, pix, page_num: int, timeout: Optional[float] = None) -> str:
+        """Reconoce el texto de una página renderizada con EasyOCR."""
+        if timeout is None and self._ocr_executor is None:
+            return self._readtext(pix)
+        if self._ocr_executor is None:
+            self._ocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="easyocr")
+        # El trabajo conserva el pixmap: sigue siendo válido aunque se abandone
+        self._ocr_job = self._ocr_executor.submit(self._readtext, pix)
+        try:
+            return self._ocr_job.result(timeout=max(timeout, 0.0) if timeout is not None else None)
+        except FuturesTimeoutError as e:
+            raise TimeoutError(f"EasyOCR superó {timeout:.1f}s") from e
+
+    def _readtext(self, pix) -> str:
+        # EasyOCR espera numpy array: vista directa sobre el pixmap, sin copias
+        result = self.reader.readtext(pixmap_to_array(pix), detail=0)
+        return "\n".join(result)
+
+
+def _new_easyocr_reader(languages: List[str]):
+    # easyocr arrastra a torch (segundos y cientos de MB): solo se importa al crear el primer lector
+    import easyocr
+
+    return easyocr.Reader(languages, gpu=False)
+
+
+def get_easyocr_pool(languages: Optional[Sequence[str]] = None) -> OCREnginePool:
+    """
+    Pool compartido de lectores EasyOCR para un juego de idiomas.
+    Tamaño configurable con la variable de entorno OCR_POOL_SIZE (por defecto 1).
+    """
+    languages = tuple(languages or ('es', 'en'))
+    return get_ocr_pool(('easyocr',) + languages,
+                        lambda: _new_easyocr_reader(list(languages)))
+
+
+def warm_ocr_engines(engines: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    Inicializa los motores OCR por adelantado (p. ej. al arrancar la API).
+
+    Args:
+        engines: Motores a preparar: 'tesseract' (localiza el ejecutable y sus idiomas) y/o
+            'easyocr' (carga los lectores del pool). Por defecto, los de la
+            variable de entorno OCR_WARM_ENGINES o solo 'tesseract'.
+
+    Returns:
+        Estado por motor. Los fallos se informan sin detener el arranque.
+    """
+    if engines is None:
+        engines = os.getenv("OCR_WARM_ENGINES", "tesseract").split(",")
+    status = {}
+    for engine in (e.strip().lower() for e in engines):
+        if not engine:
+            continue
+        try:
+            if engine == 'tesseract':
+                cmd = resolve_tesseract_cmd()
+                # Consulta única de los idiomas instalados
+                lang = select_language(cmd)
+                status[engine] = f"{cmd} ({lang or 'idioma por defecto'})"
+            elif engine == 'easyocr':
+                status[engine] = f"{get_easyocr_pool().warm()} lector(es)"
+            else:
+                status[engine] = "motor desconocido"
+        except Exception as e:
+            print(f"[OCR WARN] No se pudo precalentar '{engine}': {e!r}")
+            status[engine] = f"error: {e}"
+    return status
+
+
+# Función helper para EasyOCR
+def extract_text_from_pdf_easyocr(pdf_path: PDFSource, use_ocr: bool = True, extract_tables: bool = True,
+                                  ocr_page_timeout: Optional[float] = None,
+                                  document_timeout: Optional[float] = None,
+                                  cancel: Optional[threading.Event] = None,
+                                  pages: PageSelection = None, triage: bool = False) -> dict:
+    """
+    Extrae texto de PDF usando EasyOCR y tablas con pdfplumber.
+    El lector se toma prestado del pool compartido (ver `get_easyocr_pool`).
+    Args:
+        pdf_path: Ruta al archivo PDF o su contenido (bytes u objeto tipo archivo).
+        use_ocr: Si True, fuerza el uso de OCR.
+        extract_tables: Si True, extrae y procesa tablas por separado.
+        ocr_page_timeout: Segundos máximos de OCR por página (None = sin límite).
+        document_timeout: Segundos máximos de la extracción (None = sin límite).
+        cancel: Evento que detiene la extracción (lanza ExtractionCancelled).
+        pages: Páginas a extraer (base 1, p. ej. "1-5,8,10-"); por defecto, todas.
+        triage: Si True, solo la capa de texto de una muestra de páginas.
     Returns:
         Diccionario con texto estructurado y tablas.
     """
-    extractor = PDFTextExtractor()
-    return extractor.extract_text(pdf_path, use_ocr, extract_tables)
\ No newline at end of file
+    pool = get_easyocr_pool()
+    reader = pool.acquire()
+    extractor = None
+    try:
+        extractor = PDFTextExtractorEasyOCR(reader=reader, ocr_page_timeout=ocr_page_timeout,
+                                            document_timeout=document_timeout)
+        return extractor.extract_text(pdf_path, use_ocr, extract_tables, cancel, pages, triage)
+    finally:
+        # Un lector con un reconocimiento abandonado sigue ocupado: no vuelve al pool
+        if extractor is not None and extractor.ocr_busy:
+            pool.discard(reader)
+        else:
+            pool.release(reader)
@@ -0,0 +1,90 @@
+"""
+Formateo de tablas extraídas de PDFs como texto plano.
+
+Trabaja directamente sobre las tablas en forma de lista de listas (el formato
+que devuelven los extractores) y prepara la plantilla de cada fila una sola vez
+por tabla, sin construir DataFrames.
+"""
+
+from typing import Dict, List, Sequence
+
+# Ancho fijo de columna del formato 'text' (alineado)
+TEXT_COLUMN_WIDTH = 30
+
+TABLE_FORMATS = ('text', 'tsv', 'markdown')
+
+
+# Representación de las celdas ausentes (None o faltantes en filas cortas) por
+# formato; 'text' conserva la salida histórica basada en pandas ("None")
+_MISSING_CELL = {
+    'text': "None",
+    'tsv': "",
+    'markdown': "",
+}
+
+
+def _normalize_rows(table: Sequence[Sequence], n_cols: int, missing: str = "") -> List[List[str]]:
+    """Convierte las celdas a str y completa las filas cortas con `missing`."""
+    rows = []
+    for row in table:
+        cells = [missing if cell is None else str(cell) for cell in row]
+        if len(cells) < n_cols:
+            cells.extend([missing] * (n_cols - len(cells)))
+        rows.append(cells)
+    return rows
+
+
+def _format_text(rows: List[List[str]], n_cols: int) -> str:
+    # Columnas alineadas a ancho fijo separadas por " | "
+    template = " | ".join([f"{{:<{TEXT_COLUMN_WIDTH}}}"] * n_cols) + "\n"
+    return "".join(template.format(*row) for row in rows)
+
+
+def _format_tsv(rows: List[List[str]], n_cols: int) -> str:
+    return "".join("\t".join(row) + "\n" for row in rows)
+
+
+def _format_markdown(rows: List[List[str]], n_cols: int) -> str:
+    # La primera fila hace de encabezado, como en los pliegos
+    lines = []
+    for i, row in enumerate(rows):
+        lines.append("| " + " | ".join(cell.replace("|", "\\|") for cell in row) + " |\n")
+        if i == 0:
+            lines.append("|" + " --- |" * n_cols + "\n")
+    return "".join(lines)
+
+
+_FORMATTERS = {
+    'text': _format_text,
+    'tsv': _format_tsv,
+    'markdown': _format_markdown,
+}
+
+
+def format_tables(tables: List[Dict], table_format: str = 'text') -> str:
+    """
+    Formatea las tablas extraídas para inclusión en el texto plano.
+
+    Args:
+        tables: Lista de diccionarios con 'page' y 'table' (lista de listas).
+        table_format: 'text' (columnas alineadas, por defecto), 'tsv' (separadas
+            por tabuladores) o 'markdown'. En 'text' las celdas ausentes se
+            muestran como "None"; en 'tsv' y 'markdown', vacías.
+
+    Returns:
+        Texto con un bloque "TABLA i (Página p):" por tabla.
+    """
+    formatter = _FORMATTERS.get(table_format)
+    if formatter is None:
+        raise ValueError(
+            f"Formato de tabla no soportado: {table_format!r} (opciones: {', '.join(TABLE_FORMATS)})"
+        )
+
+    parts = []
+    for i, table_data in enumerate(tables, 1):
+        parts.append(f"\n\nTABLA {i} (Página {table_data['page']}):\n")
+        table = table_data['table']
+        n_cols = max((len(row) for row in table), default=0)
+        if n_cols:
+            parts.append(formatter(_normalize_rows(table, n_cols, _MISSING_CELL[table_format]), n_cols))
+    return "".join(parts)
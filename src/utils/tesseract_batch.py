@@ -0,0 +1,238 @@
+"""
+Reconocimiento con Tesseract por lotes.
+
+pytesseract lanza un proceso `tesseract` por imagen, que vuelve a cargar los
+datos de idioma cada vez. Aquí varias páginas se reconocen en una sola
+ejecución: se escriben como PNM crudo (sin compresión, a diferencia del PNG
+que pytesseract guarda por cada llamada) y se pasan a Tesseract en un archivo
+de lista. Tesseract separa el texto de cada página con un salto de página
+('\\f') y vacía la salida al terminar cada una, así que el avance se sigue
+mientras trabaja. Los idiomas instalados se consultan una sola vez por proceso.
+La ejecución admite un tiempo máximo (total y por página) y se puede cancelar
+desde otro hilo.
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_TESSERACT_CONFIG = '--oem 3 --psm 3'
+PREFERRED_LANGUAGE = 'spa'
+PAGE_SEPARATOR = '\f'
+_SEPARATOR_BYTES = PAGE_SEPARATOR.encode('ascii')
+# Cada cuánto se comprueba la cancelación mientras Tesseract trabaja
+CANCEL_POLL_SECONDS = 0.5
+
+
+class TesseractBatchError(RuntimeError):
+    """La ejecución por lotes de Tesseract falló o devolvió una salida inesperada."""
+
+
+class TesseractTimeout(TesseractBatchError):
+    """
+    La ejecución por lotes superó su tiempo máximo y se detuvo. `pages` lleva el
+    texto de las páginas que terminaron antes (en orden) y `page_limit` indica
+    si se agotó el límite de una página en lugar del de la ejecución.
+    """
+
+    def __init__(self, message: str, pages: Sequence[str] = (), page_limit: bool = False):
+        super().__init__(message)
+        self.pages = list(pages)
+        self.page_limit = page_limit
+
+
+@lru_cache(maxsize=None)
+def tesseract_languages(tesseract_cmd: str) -> FrozenSet[str]:
+    """Idiomas (traineddata) disponibles para `tesseract_cmd`, consultados una vez."""
+    try:
+        proc = subprocess.run([tesseract_cmd, '--list-langs'], capture_output=True,
+                              text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"[OCR WARN] No se pudieron listar los idiomas de Tesseract: {e!r}")
+        return frozenset()
+    # La primera línea es 'List of available languages in "...":'
+    lines = (proc.stdout or proc.stderr).splitlines()[1:]
+    return frozenset(line.strip() for line in lines if line.strip())
+
+
+@lru_cache(maxsize=None)
+def select_language(tesseract_cmd: str, preferred: str = PREFERRED_LANGUAGE) -> Optional[str]:
+    """
+    Idioma a usar con `tesseract_cmd`: `preferred` si está instalado o None
+    (idioma por defecto de Tesseract). Se decide y se avisa una sola vez.
+    """
+    if preferred in tesseract_languages(tesseract_cmd):
+        return preferred
+    print(f"[OCR WARN] Tesseract no tiene datos para '{preferred}'; se usará su idioma por defecto.")
+    return None
+
+
+def save_image(pix, directory: str, name: str) -> str:
+    """Guarda un pixmap como PNM crudo en `directory` y devuelve su ruta."""
+    path = os.path.join(directory, f"{name}.{'pgm' if pix.n == 1 else 'ppm'}")
+    pix.save(path)
+    return path
+
+
+def recognize_batch(tesseract_cmd: str, pixmaps: Iterable, lang: Optional[str] = None,
+                    config: str = DEFAULT_TESSERACT_CONFIG,
+                    timeout: Optional[float] = None,
+                    cancel: Optional[threading.Event] = None,
+                    page_timeout: Optional[float] = None) -> List[str]:
+    """
+    Reconoce varias páginas renderizadas con una sola ejecución de Tesseract.
+
+    Args:
+        tesseract_cmd: Ejecutable de Tesseract.
+        pixmaps: Pixmaps de PyMuPDF (gris o RGB, sin alfa). Se consumen de uno en
+            uno y se escriben a disco antes de pedir el siguiente, de modo que
+            nunca hay más de una página rasterizada en memoria.
+        lang, config, timeout, cancel, page_timeout: Ver `recognize_images`.
+
+    Returns:
+        Texto de cada página, en el mismo orden.
+
+    Raises:
+        Las mismas excepciones que `recognize_images`.
+    """
+    with tempfile.TemporaryDirectory(prefix="neurobit_ocr_") as tmp_dir:
+        paths = [save_image(pix, tmp_dir, f"{i:05d}") for i, pix in enumerate(pixmaps)]
+        # El proceso termina dentro del bloque: sus imágenes se borran después
+        return recognize_images(tesseract_cmd, paths, lang=lang, config=config,
+                                timeout=timeout, cancel=cancel, page_timeout=page_timeout)
+
+
+def recognize_images(tesseract_cmd: str, paths: Sequence[str], lang: Optional[str] = None,
+                     config: str = DEFAULT_TESSERACT_CONFIG,
+                     timeout: Optional[float] = None,
+                     cancel: Optional[threading.Event] = None,
+                     page_timeout: Optional[float] = None) -> List[str]:
+    """
+    Reconoce imágenes ya guardadas (ver `save_image`) con una sola ejecución de
+    Tesseract, en el orden de `paths`.
+
+    Tesseract vacía su salida al terminar cada página, así que el avance se sigue
+    mientras trabaja: `page_timeout` limita cada página por separado (desde que
+    terminó la anterior) y, si se agota, la excepción lleva el texto de las
+    páginas ya reconocidas.
+
+    Args:
+        tesseract_cmd: Ejecutable de Tesseract.
+        paths: Imágenes PNM de las páginas.
+        lang: Idioma de Tesseract (None = idioma por defecto).
+        config: Opciones adicionales de la línea de comandos.
+        timeout: Tiempo máximo de la ejecución completa, en segundos.
+        cancel: Evento que, al activarse, detiene Tesseract.
+        page_timeout: Tiempo máximo de cada página, en segundos.
+
+    Returns:
+        Texto de cada página, en el mismo orden.
+
+    Raises:
+        TesseractTimeout: Si se agota `timeout` o `page_timeout`.
+        TesseractBatchError: Si Tesseract falla, se cancela o el número de páginas
+            no cuadra.
+    """
+    if not paths:
+        return []
+    with tempfile.TemporaryDirectory(prefix="neurobit_ocr_") as tmp_dir:
+        list_path = os.path.join(tmp_dir, "pages.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(paths) + "\n")
+
+        args = [tesseract_cmd, list_path, 'stdout']
+        if lang:
+            args += ['-l', lang]
+        args += config.split()
+        try:
+            proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            raise TesseractBatchError(f"No se pudo ejecutar Tesseract: {e!r}") from e
+        stdout, stderr = _communicate(proc, timeout, cancel, page_timeout)
+
+    if proc.returncode != 0:
+        stderr = stderr.decode('utf-8', errors='replace').strip()
+        raise TesseractBatchError(f"Tesseract terminó con código {proc.returncode}: {stderr}")
+
+    pages = stdout.decode('utf-8', errors='replace').split(PAGE_SEPARATOR)
+    # Tesseract escribe el separador al final de cada página
+    if len(pages) < len(paths):
+        raise TesseractBatchError(
+            f"Tesseract devolvió {len(pages)} páginas para {len(paths)} imágenes"
+        )
+    return pages[:len(paths)]
+
+
+def _split_pages(stdout: bytes) -> List[str]:
+    """Texto de cada página completa de la salida (la última parte queda a medias)."""
+    return [page.decode('utf-8', errors='replace') for page in stdout.split(_SEPARATOR_BYTES)[:-1]]
+
+
+class _PipeReader(threading.Thread):
+    """Lee una tubería hasta el final, anotando cuándo llegó cada página completa."""
+
+    def __init__(self, pipe):
+        super().__init__(daemon=True)
+        self.pipe = pipe
+        self.chunks: List[bytes] = []
+        self.last_page_at = time.monotonic()
+        self.start()
+
+    def run(self) -> None:
+        while True:
+            chunk = self.pipe.read1(65536)
+            if not chunk:
+                break
+            self.chunks.append(chunk)
+            if _SEPARATOR_BYTES in chunk:
+                self.last_page_at = time.monotonic()
+
+    def data(self) -> bytes:
+        self.join()
+        return b"".join(self.chunks)
+
+
+def _communicate(proc: subprocess.Popen, timeout: Optional[float],
+                 cancel: Optional[threading.Event],
+                 page_timeout: Optional[float] = None) -> Tuple[bytes, bytes]:
+    """
+    Espera a `proc` respetando los tiempos máximos (de la ejecución y de cada
+    página) y la cancelación; si no, lo mata.
+    """
+    stdout, stderr = _PipeReader(proc.stdout), _PipeReader(proc.stderr)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        # El límite de la página en curso se mueve cada vez que termina una página
+        page_deadline = None if page_timeout is None else stdout.last_page_at + page_timeout
+        limits = [limit for limit in (deadline, page_deadline) if limit is not None]
+        wait = min(limits) - time.monotonic() if limits else None
+        if cancel is not None:
+            wait = CANCEL_POLL_SECONDS if wait is None else min(wait, CANCEL_POLL_SECONDS)
+        try:
+            proc.wait(timeout=None if wait is None else max(0.0, wait))
+            return stdout.data(), stderr.data()
+        except subprocess.TimeoutExpired:
+            pass
+        if cancel is not None and cancel.is_set():
+            _kill(proc, stdout, stderr)
+            raise TesseractBatchError("Reconocimiento cancelado")
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            _kill(proc, stdout, stderr)
+            raise TesseractTimeout(f"Tesseract superó el tiempo máximo de {timeout:.1f}s",
+                                   _split_pages(stdout.data()))
+        if page_timeout is not None and now >= stdout.last_page_at + page_timeout:
+            _kill(proc, stdout, stderr)
+            raise TesseractTimeout(f"Tesseract superó {page_timeout:.1f}s en una página",
+                                   _split_pages(stdout.data()), page_limit=True)
+
+
+def _kill(proc: subprocess.Popen, *readers: _PipeReader) -> None:
+    proc.kill()
+    proc.wait()
+    for reader in readers:
+        reader.join()
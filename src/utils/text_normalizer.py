@@ -0,0 +1,229 @@
+"""
+Motor de normalización de texto para documentos de licitación.
+
+Reúne en un solo lugar, con patrones precompilados, el filtrado de ruido
+institucional, la corrección de errores de OCR/extracción, la detección de
+estructura (secciones, subsecciones, ítems) y la limpieza final que usan los
+extractores de PDF. Todos los patrones se compilan una vez al importar el
+módulo y las correcciones independientes entre sí se aplican en una sola pasada.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Optional
+
+# Patrones específicos para documentos de licitación
+LICITACION_PATTERNS = {
+    'section_header': r'^(SECCI[OÓ]N|CAP[IÍ]TULO)\s+[IVXLCDM]+\s*[-:]?\s*(.*)$',
+    'subsection': r'^\d+\.\d+\.?\s*(.*)$',
+    'item': r'^\d+\.\d+\.\d+\.?\s*(.*)$'
+}
+
+# Patrones comunes en documentos de licitación ecuatoriana (líneas a descartar)
+NOISE_LINE_PATTERNS = [
+    # Patrones SERCOP
+    r'DIRECCI[OÓ]N:.*PLATAFORMA GUBERNAMENTAL.*QUITO-ECUADOR',
+    r'SERCOP.*SERVICIO NACIONAL DE CONTRATACI[OÓ]N P[UÚ]BLICA',
+    r'GOBIERNO.*ECUADOR',
+    r'C[OÓ]DIGO POSTAL:\s*\d{6}',
+
+    # Números de página
+    r'^\s*\d+\s*$',
+
+    # Ruido común
+    r'^\s*-\s*$',
+    r'^\s*\.+\s*$',
+    r'^\s*[_\-=]+\s*$'
+]
+
+# Texto UTF-8 decodificado como cp1252/latin-1
+MOJIBAKE_REPLACEMENTS = {
+    'Ã¡': 'á', 'Ã©': 'é', 'Ã\xad': 'í', 'Ã³': 'ó', 'Ãº': 'ú',
+    'Ã±': 'ñ', 'Ã\x91': 'Ñ', 'Â°': '°', 'â€“': '-', 'â€œ': '"',
+    'â€\x9d': '"', 'â€™': "'", 'â€¢': '-'
+}
+
+# Compilados por separado: una alternancia única impide que el motor busque el
+# prefijo literal de cada patrón y resulta más lenta
+_NOISE_SEARCHES = tuple(re.compile(p, re.IGNORECASE).search for p in NOISE_LINE_PATTERNS)
+
+# Correcciones de errores comunes en OCR de documentos técnicos
+_HYPHEN_JOIN_RE = re.compile(r'(\w)\s*-\s*(\w)')  # Unir palabras separadas incorrectamente
+_LIGATURES = (('ﬁ', 'fi'), ('ﬀ', 'ff'), ('ﬂ', 'fl'))
+_DIGIT_JOIN_RE = re.compile(r'(\d)\s+(\d)')  # Unir números separados
+# Siglas, decimales mal separados y palabras cortadas: usan clases de caracteres
+# disjuntas, así que una sola pasada equivale a aplicarlas una tras otra
+_TOKEN_JOIN_RE = re.compile(
+    r'\b([A-Z])\s+([A-Z])\b'
+    r'|\b(\d+)\s*(\.)\s*(\d+)\b'
+    r'|\b([a-z])\s+([a-z])\b'
+)
+_TOKEN_JOIN_REPL = r'\1\2\3\4\5\6\7'
+
+# Limpieza final
+_WHITESPACE_RE = re.compile(r'\s+')
+_CLEAN_HYPHEN_RE = re.compile(r'(\w)-\s+(\w)')  # Palabras con guiones
+_MOJIBAKE_RE = re.compile("|".join(re.escape(k) for k in MOJIBAKE_REPLACEMENTS))
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')  # Caracteres no imprimibles
+
+
+
+def _strip_marks_nfd(char: str) -> str:
+    """`char` en NFD sin sus marcas diacríticas (categoría Mn)."""
+    return "".join(c for c in unicodedata.normalize("NFD", char) if unicodedata.category(c) != "Mn")
+
+
+class _AccentTable(dict):
+    """
+    Carácter no ASCII -> carácter sin acentos. Se precalcula para Latin-1 y
+    Latin Extended-A (vocales acentuadas, ü, ñ) y las marcas combinantes; un
+    carácter fuera de la tabla se resuelve con NFD la primera vez que aparece
+    y el resultado queda en la tabla.
+    """
+
+    def __init__(self, keep: str = ""):
+        super().__init__()
+        self.keep = keep
+        for code in range(0x80, 0x180):
+            char = chr(code)
+            self[char] = char if char in keep else _strip_marks_nfd(char)
+        for code in range(0x300, 0x370):  # Marcas combinantes (texto ya descompuesto)
+            self[chr(code)] = ""
+
+    def __missing__(self, char: str) -> str:
+        value = char if char in self.keep else _strip_marks_nfd(char)
+        self[char] = value
+        return value
+
+    def replace(self, match: re.Match) -> str:
+        return self[match.group()]
+
+
+# Solo se reemplazan los caracteres no ASCII: en texto en español son pocos y
+# recorrerlos con una regex es más rápido que traducir todo el texto
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+_ACCENT_TABLE = _AccentTable()
+_ACCENT_TABLE_KEEP_ENIE = _AccentTable(keep="ñÑ")
+
+
+def strip_accents(text: str, keep_enie: bool = False) -> str:
+    """
+    Quita tildes y diéresis de `text` (á -> a, ü -> u). La ñ pasa a n salvo con
+    `keep_enie=True`. Equivale a NFD sin marcas diacríticas, sin descomponer el
+    texto completo.
+    """
+    if text.isascii():
+        return text
+    table = _ACCENT_TABLE_KEEP_ENIE if keep_enie else _ACCENT_TABLE
+    return _NON_ASCII_RE.sub(table.replace, text)
+
+
+def fold_text(text: str, keep_enie: bool = False) -> str:
+    """Forma de comparación de `text`: minúsculas y sin acentos (ver `strip_accents`)."""
+    return strip_accents(text.lower(), keep_enie)
+
+
+class LicitacionTextNormalizer:
+    """
+    Normalizador de texto de licitaciones con patrones precompilados.
+
+    Args:
+        structure_patterns (dict, optional): Patrones 'section_header',
+            'subsection' e 'item' para detectar la estructura del documento.
+    """
+
+    def __init__(self, structure_patterns: Optional[Dict[str, str]] = None):
+        patterns = structure_patterns or LICITACION_PATTERNS
+        # Una sola coincidencia por línea; el orden de la alternancia respeta la
+        # prioridad sección > subsección > ítem
+        self._structure_re = re.compile(
+            f"(?P<section>{patterns['section_header']})"
+            f"|(?P<subsection>{patterns['subsection']})"
+            f"|(?P<item>{patterns['item']})"
+        )
+        self._group_offsets = {
+            name: self._structure_re.groupindex[name]
+            for name in ('section', 'subsection', 'item')
+        }
+
+    def filter_noise(self, text: str) -> str:
+        """
+        Filtra contenido específico de documentos de licitación:
+        - Encabezados/pies de página institucionales
+        - Números de página
+        - Ruido común en estos documentos
+        """
+        filtered_lines = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            for search in _NOISE_SEARCHES:
+                if search(line):
+                    break
+            else:
+                filtered_lines.append(line)
+        return "\n".join(filtered_lines)
+
+    def correct(self, text: str) -> str:
+        """Corrige errores comunes de extracción/OCR en documentos técnicos."""
+        text = _HYPHEN_JOIN_RE.sub(r'\1-\2', text)
+        for ligature, replacement in _LIGATURES:
+            text = text.replace(ligature, replacement)
+        text = _DIGIT_JOIN_RE.sub(r'\1\2', text)
+        return _TOKEN_JOIN_RE.sub(_TOKEN_JOIN_REPL, text)
+
+    def mark_structure(self, text: str) -> str:
+        """Identifica secciones, subsecciones e ítems y descarta líneas vacías."""
+        match = self._structure_re.match
+        section = self._group_offsets['section']
+        subsection = self._group_offsets['subsection']
+        item = self._group_offsets['item']
+
+        processed_lines = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            m = match(line)
+            if m is None:
+                processed_lines.append(line)
+            elif m.start(section) != -1:
+                processed_lines.append(
+                    f"\nSECCIÓN {m.group(section + 1).strip()}: {m.group(section + 2).strip()}\n"
+                )
+            elif m.start(subsection) != -1:
+                processed_lines.append(f"\nSubsección: {m.group(subsection + 1).strip()}\n")
+            else:
+                processed_lines.append(f"• {m.group(item + 1).strip()}")
+        return "\n".join(processed_lines)
+
+    def process(self, text: str) -> str:
+        """
+        Procesa texto de licitaciones para:
+        - Identificar y marcar secciones
+        - Corregir errores comunes
+        - Estructurar el contenido
+        """
+        return self.mark_structure(self.correct(text))
+
+    @staticmethod
+    def clean(text: str) -> str:
+        """Limpia y normaliza el texto extraído con reglas específicas para licitaciones."""
+        # Normalización de espacios (deja un único espacio entre palabras, por lo
+        # que separar minúscula/mayúscula con un espacio ya no requiere otra pasada)
+        text = _WHITESPACE_RE.sub(' ', text).strip()
+
+        # Unir líneas que probablemente fueron separadas incorrectamente
+        text = _CLEAN_HYPHEN_RE.sub(r'\1-\2', text)
+
+        # Corrección de encodings comunes (antes de quitar los caracteres de
+        # control, que forman parte de algunas secuencias como 'Ã\x91')
+        text = _MOJIBAKE_RE.sub(lambda m: MOJIBAKE_REPLACEMENTS[m.group(0)], text)
+
+        # Eliminar caracteres no imprimibles pero preservar símbolos importantes
+        return _CONTROL_CHARS_RE.sub('', text)
+
+
+# Instancia compartida con los patrones por defecto
+DEFAULT_NORMALIZER = LicitacionTextNormalizer()
@@ -0,0 +1,166 @@
+"""
+Utilidades comunes de las pruebas.
+
+Los PDFs se generan en memoria con PyMuPDF. `OfflineExtractor` sustituye el
+reconocimiento de Tesseract por un texto fijo por página: permite probar las
+decisiones de OCR, los presupuestos de tiempo y el almacén de páginas sin
+depender del ejecutable. `fake_tesseract` simula el ejecutable para probar
+el reconocimiento por lotes de verdad.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+try:
+    import fitz
+
+    from src.utils.pdf_extractor import PDFTextExtractor
+except ImportError:  # Sin PyMuPDF: solo se ejecutan las pruebas que no abren PDFs
+    fitz = None
+    PDFTextExtractor = object
+
+PARAGRAPH = (
+    "La entidad contratante convoca a las personas naturales o jurídicas a presentar "
+    "sus ofertas para la ejecución de la obra descrita en el presente pliego. El plazo "
+    "de ejecución es de 180 días contados desde la notificación del anticipo."
+)
+
+
+# Lee la lista de imágenes y escribe una página por imagen, como `tesseract lista stdout`.
+# FAKE_TESSERACT_DELAY retrasa el arranque; las imágenes de FAKE_TESSERACT_SLOW (nombres
+# sin extensión) tardan FAKE_TESSERACT_SLOW_DELAY segundos; FAKE_TESSERACT_LOG anota
+# cada imagen al empezar a reconocerla.
+FAKE_TESSERACT = """\
+import os, sys, time
+if sys.argv[1] == '--list-langs':
+    print('List of available languages in "/usr/share/tessdata/" (2):')
+    print('eng')
+    print('spa')
+    sys.exit(0)
+time.sleep(float(os.environ.get('FAKE_TESSERACT_DELAY', '0')))
+with open(sys.argv[1], encoding='utf-8') as f:
+    images = [line.strip() for line in f if line.strip()]
+lang = sys.argv[sys.argv.index('-l') + 1] if '-l' in sys.argv else 'eng'
+slow = os.environ.get('FAKE_TESSERACT_SLOW', '').split(',')
+for image in images:
+    name = os.path.basename(image)
+    if os.environ.get('FAKE_TESSERACT_LOG'):
+        with open(os.environ['FAKE_TESSERACT_LOG'], 'a', encoding='utf-8') as log:
+            log.write(name + '\\n')
+    if os.path.splitext(name)[0] in slow:
+        time.sleep(float(os.environ.get('FAKE_TESSERACT_SLOW_DELAY', '5')))
+    sys.stdout.write(f'{lang}:{name}\\f')
+    sys.stdout.flush()
+"""
+
+
+class OfflineExtractor(PDFTextExtractor):
+    """Extractor de pruebas: no busca Tesseract y su OCR devuelve 'OCR PAGINA n'."""
+
+    # Segundos que tarda el "reconocimiento" de cada página
+    ocr_delay = 0.0
+
+    def _setup_ocr_engine(self, tesseract_path: Optional[str] = None) -> None:
+        self.ocr_calls = []
+
+    def _ocr_pages(self, session, page_numbers, deadline=None, cancel=None):
+        return [self._ocr_page(session, page_num, deadline, cancel) for page_num in page_numbers]
+
+    def _ocr_image(self, pix, page_num: int, timeout: Optional[float] = None) -> str:
+        self.ocr_calls.append(page_num + 1)
+        if self.ocr_delay:
+            if timeout is not None and timeout < self.ocr_delay:
+                time.sleep(max(timeout, 0))
+                raise TimeoutError(f"OCR de prueba superó {timeout:.2f}s")
+            time.sleep(self.ocr_delay)
+        return f"OCR PAGINA {page_num + 1}"
+
+
+def _draw_table(page, top: float, rows: int = 4, cols: int = 3) -> None:
+    """Tabla con bordes, detectable por las estrategias de líneas."""
+    left, width, height = 72.0, 120.0, 18.0
+    for r in range(rows):
+        for c in range(cols):
+            cell = fitz.Rect(left + c * width, top + r * height,
+                             left + (c + 1) * width, top + (r + 1) * height)
+            page.draw_rect(cell, color=(0, 0, 0), width=0.6)
+            page.insert_text((cell.x0 + 3, cell.y1 - 5), f"F{r}C{c}", fontsize=8)
+
+
+def build_pdf(n_pages: int, scanned: Iterable[int] = (), tables: Iterable[int] = (),
+              blank: Iterable[int] = (), label: str = "") -> bytes:
+    """
+    PDF de `n_pages` páginas (números base 1 en `scanned`, `tables` y `blank`):
+    texto digital, páginas escaneadas (solo imagen), con tabla o vacías.
+    `label` se añade al texto de cada página para distinguir revisiones.
+    """
+    scanned, tables, blank = set(scanned), set(tables), set(blank)
+    doc = fitz.open()
+    for number in range(1, n_pages + 1):
+        page = doc.new_page(width=595, height=842)
+        if number in blank:
+            continue
+        page.insert_textbox(fitz.Rect(72, 72, 523, 300),
+                            f"PÁGINA {number} {label}\n{PARAGRAPH}", fontsize=11)
+        if number in tables:
+            _draw_table(page, 340)
+        if number in scanned:
+            # Sustituir la página por su imagen, como un escaneo
+            pix = page.get_pixmap(dpi=100, colorspace=fitz.csGRAY)
+            doc.delete_page(number - 1)
+            image_page = doc.new_page(pno=number - 1, width=595, height=842)
+            image_page.insert_image(image_page.rect, pixmap=pix)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def offline_extractor():
+    """Fábrica de `OfflineExtractor` sin almacén de páginas por defecto."""
+    if fitz is None:
+        pytest.skip("requiere PyMuPDF")
+
+    def make(**options) -> OfflineExtractor:
+        return OfflineExtractor(**options)
+    return make
+
+
+@pytest.fixture
+def fake_tesseract(tmp_path):
+    """Ruta de un `tesseract` simulado (ver FAKE_TESSERACT)."""
+    if os.name == "nt":
+        pytest.skip("usa scripts de shell como ejecutable")
+    script = tmp_path / "fake_tesseract.py"
+    script.write_text(FAKE_TESSERACT, encoding="utf-8")
+    command = tmp_path / "tesseract"
+    command.write_text(f"#!/bin/sh\nexec {sys.executable} {script} \"$@\"\n", encoding="utf-8")
+    command.chmod(0o755)
+    return str(command)
+
+
+@pytest.fixture
+def make_pdf():
+    """Constructor de PDFs de prueba (ver `build_pdf`)."""
+    if fitz is None:
+        pytest.skip("requiere PyMuPDF")
+    return build_pdf
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Cachés compartidas del proceso en una carpeta temporal por prueba."""
+    from src.utils import extraction_cache
+
+    monkeypatch.setenv("PDF_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("PDF_PAGE_CACHE_DIR", str(tmp_path / "pages"))
+    monkeypatch.setattr(extraction_cache, "_default_cache", None)
+    monkeypatch.setattr(extraction_cache, "_default_page_store", None)
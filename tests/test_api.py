@@ -0,0 +1,122 @@
+"""Rutas de extracción de la API (src.main) con TestClient."""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("fitz")
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.utils.pdf_extractor import TRIAGE_HEAD_PAGES, TRIAGE_SAMPLE_PAGES  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from src.utils import pdf_analisis, pdf_extractor
+
+    # src.main importa el análisis comparativo, ajeno a estas rutas
+    monkeypatch.setattr(pdf_analisis, "analyze_contract_documents",
+                        lambda **kwargs: "", raising=False)
+    # Los PDFs de prueba son digitales: basta con no exigir el ejecutable de Tesseract
+    monkeypatch.setattr(pdf_extractor, "resolve_tesseract_cmd",
+                        lambda tesseract_path=None: "tesseract")
+    from src.main import app
+
+    # Sin `with`: no se ejecuta el precalentamiento de motores OCR del arranque
+    return TestClient(app)
+
+
+def _upload(data: bytes, content_type: str = "application/pdf"):
+    return {"file": ("pliego.pdf", data, content_type)}
+
+
+def test_extract_returns_text_tables_and_metadata(client, make_pdf):
+    response = client.post("/api/v1/extract_pdf", files=_upload(make_pdf(3, tables=[2])))
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert "PÁGINA 1" in body['text'] and "PÁGINA 3" in body['text']
+    assert [table['page'] for table in body['tables']] == [2]
+    assert body['metadata']['partial'] is False
+
+
+def test_extract_honours_page_selection(client, make_pdf):
+    response = client.post("/api/v1/extract_pdf", files=_upload(make_pdf(4)),
+                           data={"pages": "2-3", "extract_tables": "false"})
+
+    assert response.status_code == 200, response.text
+    text = response.json()['text']
+    assert "PÁGINA 2" in text and "PÁGINA 3" in text
+    assert "PÁGINA 1" not in text and "PÁGINA 4" not in text
+
+
+def test_extract_rejects_bad_requests(client, make_pdf):
+    assert client.post("/api/v1/extract_pdf", files=_upload(b"hola", "text/plain")).status_code == 400
+    assert client.post("/api/v1/extract_pdf", files=_upload(make_pdf(1)),
+                       data={"pages": "tres"}).status_code == 400
+
+
+def _events(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_stream_sends_one_event_per_selected_page(client, make_pdf):
+    response = client.post("/api/v1/extract_pdf/stream", files=_upload(make_pdf(5, tables=[3])),
+                           data={"pages": "2-4"})
+
+    assert response.status_code == 200
+    events = _events(response)
+    assert [event['type'] for event in events] == ["page", "page", "page", "done"]
+    assert [event['page'] for event in events[:-1]] == [2, 3, 4]
+    assert events[-1]['pages'] == 3 and events[-1]['tables'] == 1
+
+
+def test_stream_triage_samples_pages_without_tables(client, make_pdf):
+    response = client.post("/api/v1/extract_pdf/stream", files=_upload(make_pdf(20, tables=[1])),
+                           data={"triage": "true"})
+
+    events = _events(response)
+    assert events[-1]['type'] == "done"
+    assert events[-1]['pages'] == TRIAGE_SAMPLE_PAGES
+    assert events[-1]['tables'] == 0
+    assert [event['page'] for event in events[:TRIAGE_HEAD_PAGES]] == list(range(1, TRIAGE_HEAD_PAGES + 1))
+
+
+def test_uploads_over_the_limit_are_rejected(client, make_pdf, monkeypatch):
+    from src import main
+
+    monkeypatch.setattr(main, "UPLOAD_MAX_BYTES", 100)
+    assert client.post("/api/v1/extract_pdf", files=_upload(make_pdf(1))).status_code == 413
+    assert client.post("/api/v1/extract_pdf/stream", files=_upload(make_pdf(1))).status_code == 413
+
+
+def test_large_uploads_are_extracted_from_a_file_on_disk(client, make_pdf, monkeypatch, tmp_path):
+    from src import main
+
+    monkeypatch.setattr(main, "UPLOAD_MEMORY_MAX_BYTES", 0)
+    monkeypatch.setattr(main.tempfile, "tempdir", str(tmp_path))
+    sources = []
+    extract = main.extract_text_from_pdf
+    monkeypatch.setattr(main, "extract_text_from_pdf",
+                        lambda **kwargs: sources.append(kwargs['pdf_path']) or extract(**kwargs))
+
+    response = client.post("/api/v1/extract_pdf", files=_upload(make_pdf(2)),
+                           data={"extract_tables": "false"})
+    assert response.status_code == 200, response.text
+    assert "PÁGINA 2" in response.json()['text']
+    assert isinstance(sources[0], str) and sources[0].startswith(str(tmp_path))
+
+    events = _events(client.post("/api/v1/extract_pdf/stream", files=_upload(make_pdf(2))))
+    assert [event['type'] for event in events] == ["page", "page", "done"]
+    # Las copias en disco se borran al terminar cada petición
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("neurobit_upload_")]
+
+
+def test_starlette_spooling_is_left_at_its_default(client):
+    from starlette.formparsers import MultiPartParser
+
+    assert MultiPartParser.spool_max_size == 1024 * 1024
@@ -0,0 +1,47 @@
+"""Prueba de humo del benchmark por etapas (benchmarks/bench_extraction.py)."""
+
+import importlib.util
+import json
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip("fitz")
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location(
+        "bench_extraction", ROOT / "benchmarks" / "bench_extraction.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_synthetic_pdf_has_tables_and_scanned_pages(bench):
+    import fitz
+
+    with fitz.open(stream=bench.make_synthetic_pdf(20), filetype="pdf") as doc:
+        assert doc.page_count == 20
+        assert sum(1 for page in doc if page.get_images()) == 2
+
+
+def test_every_stage_is_reported(bench, offline_extractor):
+    report = bench.bench_document("synthetic-12p", bench.make_synthetic_pdf(12),
+                                  offline_extractor(), None, ocr_pages=2, repeat=1)
+
+    assert set(report['stages']) == {
+        'metadata', 'fitz_text', 'ocr', 'tables', 'normalization', 'table_formatting'
+    }
+    assert not [name for name, stage in report['stages'].items() if 'error' in stage]
+    assert 'error' not in report['total']
+    # Tablas en las páginas 1, 4, 7 y 10; la 10 es escaneada
+    assert report['pages'] == 12 and report['tables'] == 3
+    json.dumps(report)
+
+
+def test_missing_ocr_engine_is_reported_not_raised(bench, offline_extractor):
+    report = bench.bench_document("sin-ocr", bench.make_synthetic_pdf(3), offline_extractor(),
+                                  "TesseractNotFoundError()", ocr_pages=1, repeat=1)
+    assert report['stages']['ocr'] == {'error': "TesseractNotFoundError()"}
@@ -0,0 +1,49 @@
+"""Clasificación de documentos por lotes con posiciones (classify_documents)."""
+
+from src.classifier.rule_based import (KeywordClassifier, classify_documents, iter_classify_documents,
+                                       iter_document_segments)
+
+CLASSIFIER = KeywordClassifier({
+    "CONDICIONES_ECONOMICAS": ["presupuesto", "pago"],
+    "PLAZOS_Y_ENTREGABLES": ["cronograma"],
+})
+DOCUMENT = "  El presupuesto es de USD 1.500,00. Revise el cronograma!\nSin categoría aquí.  "
+
+
+def test_spans_point_into_the_original_text():
+    segments = list(iter_document_segments(DOCUMENT, CLASSIFIER))
+
+    assert [segment["id"] for segment in segments] == [1, 2, 3]
+    for segment in segments:
+        start, end = segment["span"]
+        assert DOCUMENT[start:end] == segment["texto"]
+    assert [segment["categoria"] for segment in segments] == [
+        "CONDICIONES_ECONOMICAS", "PLAZOS_Y_ENTREGABLES", "OTRO"
+    ]
+
+
+def test_batch_counts_per_document_and_in_total():
+    result = classify_documents({"pliego": DOCUMENT, "oferta": "Pago contra entrega."}, CLASSIFIER)
+
+    assert [doc["document_id"] for doc in result["documents"]] == ["pliego", "oferta"]
+    assert len(result["documents"][0]["segments"]) == 3
+    assert result["documents"][1]["counts"] == {
+        "CONDICIONES_ECONOMICAS": 1, "PLAZOS_Y_ENTREGABLES": 0, "OTRO": 0
+    }
+    assert result["counts"] == {"CONDICIONES_ECONOMICAS": 2, "PLAZOS_Y_ENTREGABLES": 1, "OTRO": 1}
+
+
+def test_stream_events_come_in_order_and_ids_restart_per_document():
+    events = list(iter_classify_documents([DOCUMENT, "", None], CLASSIFIER))
+
+    assert [event["type"] for event in events] == (
+        ["segment"] * 3 + ["document"] + ["document"] + ["document"] + ["done"]
+    )
+    assert [event["document_id"] for event in events if event["type"] == "document"] == ["0", "1", "2"]
+    assert events[-1]["documents"] == 3 and events[-1]["segments"] == 3
+
+
+def test_a_single_text_is_one_document():
+    result = classify_documents("Pago anticipado.", CLASSIFIER)
+    assert [doc["document_id"] for doc in result["documents"]] == ["0"]
+    assert result["documents"][0]["segments"][0]["span"] == [0, 16]
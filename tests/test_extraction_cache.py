@@ -0,0 +1,122 @@
+"""Caché en disco de resultados de extracción."""
+
+import os
+import time
+
+from src.utils import extraction_cache
+from src.utils.extraction_cache import ExtractionCache, cached_extraction
+
+
+def _result(text: str, **metadata):
+    return {'text': text, 'tables': [], 'metadata': metadata}
+
+
+def test_key_depends_on_content_options_and_version(monkeypatch):
+    key = ExtractionCache.make_key(b"%PDF-1", use_ocr=False, pages=None)
+    assert key == ExtractionCache.make_key(bytearray(b"%PDF-1"), pages=None, use_ocr=False)
+    assert key != ExtractionCache.make_key(b"%PDF-2", use_ocr=False, pages=None)
+    assert key != ExtractionCache.make_key(b"%PDF-1", use_ocr=True, pages=None)
+
+    monkeypatch.setattr(extraction_cache, "CACHE_VERSION", extraction_cache.CACHE_VERSION + 1)
+    assert key != ExtractionCache.make_key(b"%PDF-1", use_ocr=False, pages=None)
+
+
+def test_key_of_a_path_matches_its_content(tmp_path):
+    path = tmp_path / "pliego.pdf"
+    path.write_bytes(b"%PDF-" + b"x" * (3 * 1024 * 1024))
+    assert ExtractionCache.make_key(path, use_ocr=False) == ExtractionCache.make_key(
+        path.read_bytes(), use_ocr=False)
+
+
+def test_round_trip_and_corrupt_entries(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    cache.put("ab" * 32, _result("hola"))
+    assert cache.get("ab" * 32) == _result("hola")
+    assert cache.get("cd" * 32) is None
+
+    path = cache._path("ab" * 32)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{no es json")
+    assert cache.get("ab" * 32) is None
+    assert not os.path.exists(path)
+
+
+def test_eviction_keeps_recently_used_entries_within_limit(tmp_path):
+    entry = _result("x" * 1000)
+    cache = ExtractionCache(str(tmp_path), max_bytes=3500)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, entry)
+        # mtime distinto por entrada aunque el sistema de archivos tenga poca resolución
+        os.utime(cache._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+    assert cache.get(keys[0]) is not None  # la más antigua pasa a ser la más reciente
+
+    cache.put("99" * 32, entry)
+
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) is not None for key in (keys[0], keys[2], "99" * 32))
+    assert sum(size for _, size, _ in cache._entries()) <= cache.max_bytes
+
+
+def test_cached_extraction_hits_and_skips_partial_results(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return _result("texto")
+
+    first = cached_extraction(b"%PDF", {'use_ocr': False}, extract, cache)
+    second = cached_extraction(b"%PDF", {'use_ocr': False}, extract, cache)
+    assert len(calls) == 1
+    assert (first['metadata']['cache']['hit'], second['metadata']['cache']['hit']) == (False, True)
+    assert second['text'] == "texto"
+
+    partial = lambda: _result("a medias", partial=True)  # noqa: E731
+    cached_extraction(b"%PDF-parcial", {}, partial, cache)
+    assert cached_extraction(b"%PDF-parcial", {}, partial, cache)['metadata']['cache']['hit'] is False
+
+
+def test_hits_do_not_report_the_timings_of_the_original_extraction(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    slow_stage = {'calls': 1, 'wall_s': 12.0, 'cpu_s': 11.5, 'peak_alloc_kb': None}
+
+    def extract():
+        return _result("texto",
+                       timings={'total': dict(slow_stage), 'stages': {'ocr': slow_stage}, 'pages': []},
+                       page_ocr=[{'page': 1, 'ocr': True, 'seconds': 12.0}])
+
+    miss = cached_extraction(b"%PDF", {}, extract, cache)
+    hit = cached_extraction(b"%PDF", {}, extract, cache)
+
+    assert miss['metadata']['timings']['stages'] == {'ocr': slow_stage}
+    assert set(hit['metadata']['timings']['stages']) == {'cache'}
+    assert hit['metadata']['timings']['total']['wall_s'] < 1
+    assert hit['metadata']['timings']['pages'] == []
+    assert hit['metadata']['page_ocr'] == [{'page': 1, 'ocr': True, 'seconds': 0.0}]
+
+
+def test_directory_is_scanned_only_when_the_limit_is_exceeded(tmp_path, monkeypatch):
+    cache = ExtractionCache(str(tmp_path), max_bytes=5000)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for i in range(4):
+        cache.put_many({f"{i:02d}" * 32: _result("x" * 1000)})
+    assert len(scans) == 1  # tamaño inicial de la carpeta
+
+    cache.put(f"{4:02d}" * 32, _result("x" * 1000))  # supera el límite
+    assert len(scans) == 2
+    assert cache._total_bytes == sum(size for _, size, _ in entries())
+    assert cache._total_bytes <= cache.max_bytes * extraction_cache.EVICT_TARGET
+
+    cache.put("ff" * 32, _result("y"))  # queda margen: no se vuelve a recorrer
+    assert len(scans) == 2
+
+
+def test_overwriting_an_entry_does_not_inflate_the_total(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    cache.put("ab" * 32, _result("x" * 1000))
+    cache.put("ab" * 32, _result("x" * 10))
+    assert cache._total_bytes == os.path.getsize(cache._path("ab" * 32))
@@ -0,0 +1,67 @@
+"""Mediciones por etapa y por página (instrumentation)."""
+
+import time
+import tracemalloc
+
+from src.utils.instrumentation import ExtractionTimings, measure, memory_tracing, share
+
+
+def test_measure_records_wall_and_cpu_time():
+    with measure() as stats:
+        time.sleep(0.05)
+    assert stats['wall_s'] >= 0.05
+    assert 0 <= stats['cpu_s'] < stats['wall_s']
+    assert stats['peak_alloc_kb'] is None
+
+
+def test_memory_peak_is_traced_only_when_requested():
+    assert not tracemalloc.is_tracing()
+    with memory_tracing(True):
+        with measure(trace_memory=True) as stats:
+            block = bytearray(2 * 1024 * 1024)
+        del block
+    assert not tracemalloc.is_tracing()
+    assert stats['peak_alloc_kb'] >= 2048
+
+
+def test_stages_accumulate_and_pages_keep_their_own_timings():
+    events = []
+    timings = ExtractionTimings(hook=events.append)
+    timings.add('metadata', {'wall_s': 0.1, 'cpu_s': 0.1, 'peak_alloc_kb': None})
+    timings.add_page(1, {'ocr': {'wall_s': 1.0, 'cpu_s': 0.2, 'peak_alloc_kb': 10.0}})
+    timings.add_page(2, {'ocr': {'wall_s': 2.0, 'cpu_s': 0.3, 'peak_alloc_kb': 30.0}})
+
+    summary = timings.as_dict({'wall_s': 3.5, 'cpu_s': 0.7})
+    assert summary['stages']['ocr'] == {'calls': 2, 'wall_s': 3.0, 'cpu_s': 0.5, 'peak_alloc_kb': 30.0}
+    assert summary['total'] == {'wall_s': 3.5, 'cpu_s': 0.7, 'peak_alloc_kb': 30.0}
+    assert [page['page'] for page in summary['pages']] == [1, 2]
+    assert [(event['stage'], event['page']) for event in events] == [
+        ('metadata', None), ('ocr', 1), ('ocr', 2)
+    ]
+
+
+def test_failing_hook_does_not_stop_the_extraction(capsys):
+    def hook(event):
+        raise RuntimeError("log caído")
+
+    timings = ExtractionTimings(hook=hook)
+    timings.add('clean', {'wall_s': 0.01, 'cpu_s': 0.01, 'peak_alloc_kb': None})
+    assert timings.stages['clean']['calls'] == 1
+    assert "TIMING WARN" in capsys.readouterr().out
+
+
+def test_batch_measurement_is_shared_between_pages():
+    assert share({'wall_s': 3.0, 'cpu_s': 1.5, 'peak_alloc_kb': 12.0}, 3) == {
+        'wall_s': 1.0, 'cpu_s': 0.5, 'peak_alloc_kb': 12.0
+    }
+
+
+def test_extraction_reports_timings_per_page(offline_extractor, make_pdf):
+    events = []
+    result = offline_extractor(timing_hook=events.append).extract_text(make_pdf(3, scanned=[2], tables=[3]))
+
+    timings = result['metadata']['timings']
+    assert [page['page'] for page in timings['pages']] == [1, 2, 3]
+    assert 'ocr' in timings['pages'][1] and 'ocr' not in timings['pages'][0]
+    assert timings['stages']['fitz_text']['calls'] == 3
+    assert {event['page'] for event in events if event['page'] is not None} == {1, 2, 3}
@@ -0,0 +1,54 @@
+"""Extracción página por página (PDFTextExtractor.iter_pages)."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("fitz")
+
+from src.utils.pdf_extractor import ExtractionCancelled  # noqa: E402
+
+
+def test_pages_arrive_in_order_with_their_tables_and_ocr(offline_extractor, make_pdf):
+    pages = list(offline_extractor().iter_pages(make_pdf(4, scanned=[3], tables=[2])))
+
+    assert [page['page'] for page in pages] == [1, 2, 3, 4]
+    assert {page['total_pages'] for page in pages} == {4}
+    assert [page['ocr'] for page in pages] == [False, False, True, False]
+    assert "OCR PAGINA 3" in pages[2]['text']
+    assert [len(page['tables']) for page in pages] == [0, 1, 0, 0]
+    assert "TABLA 1 (Página 2)" in pages[1]['text']
+    assert {'fitz_text', 'normalization', 'clean'} <= set(pages[0]['timings'])
+
+
+def test_pages_are_extracted_on_demand(offline_extractor, make_pdf):
+    extractor = offline_extractor()
+    page_iter = extractor.iter_pages(make_pdf(3, scanned=[3]))
+
+    assert next(page_iter)['page'] == 1
+    assert extractor.ocr_calls == []
+    page_iter.close()
+
+
+def test_first_page_does_not_wait_for_the_ocr_batch(offline_extractor, make_pdf, monkeypatch):
+    extractor = offline_extractor(ocr_batch_size=8)
+    read_pages = []
+    fitz_page = extractor._fitz_page
+    monkeypatch.setattr(extractor, "_fitz_page",
+                        lambda session, page_num: read_pages.append(page_num + 1) or fitz_page(session, page_num))
+    page_iter = extractor.iter_pages(make_pdf(4, scanned=[1, 2, 3, 4]))
+
+    assert next(page_iter)['page'] == 1
+    assert read_pages == [1] and extractor.ocr_calls == [1]
+    assert next(page_iter)['page'] == 2
+    assert read_pages == [1, 2] and extractor.ocr_calls == [1, 2]
+    page_iter.close()
+
+
+def test_cancel_stops_before_the_next_page(offline_extractor, make_pdf):
+    cancel = threading.Event()
+    page_iter = offline_extractor().iter_pages(make_pdf(3), cancel=cancel)
+    next(page_iter)
+    cancel.set()
+    with pytest.raises(ExtractionCancelled):
+        next(page_iter)
@@ -0,0 +1,33 @@
+"""Los backends pesados se cargan en su primer uso, no al importar."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+HEAVY_MODULES = ("easyocr", "torch", "pandas", "sklearn", "joblib", "pdfplumber", "pytesseract", "PIL")
+
+
+def _loaded_after_import(module: str):
+    probe = (
+        f"import json, sys; import {module}; "
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))"
+    )
+    proc = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True,
+                          text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", [
+    "src.utils.pdf_extractor",
+    "src.classifier.ml_based",
+    "src.classifier.rule_based",
+])
+def test_importing_does_not_load_heavy_backends(module):
+    if module == "src.utils.pdf_extractor":
+        pytest.importorskip("fitz")
+    assert _loaded_after_import(module) == []
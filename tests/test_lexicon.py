@@ -0,0 +1,93 @@
+"""Léxico de reglas en archivo (load_lexicon, LexiconWatcher y get_categories)."""
+
+import json
+import os
+
+import pytest
+
+from src.classifier import rule_based
+from src.classifier.rule_based import DEFAULT_LEXICON_PATH, LexiconWatcher, get_categories, load_lexicon
+
+
+def _write(path, categories, version=1, **extra):
+    path.write_text(json.dumps({"version": version, "categories": categories, **extra}), encoding="utf-8")
+    # Distinto mtime aunque se escriba dos veces en el mismo instante
+    stamp = path.stat().st_mtime_ns + version * 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def shared_watcher(monkeypatch):
+    """Watcher compartido del proceso creado de nuevo en cada prueba."""
+    monkeypatch.delenv("RULE_LEXICON_PATH", raising=False)
+    monkeypatch.setattr(rule_based, "_lexicon_watcher", None)
+
+
+def test_categories_come_from_the_lexicon_file(shared_watcher):
+    data = json.loads(DEFAULT_LEXICON_PATH.read_text(encoding="utf-8"))
+    categories = get_categories()
+
+    assert categories == data["categories"]
+    categories["CONDICIONES_LEGALES"].append("otra")
+    assert get_categories() == data["categories"]
+    assert rule_based.get_classifier().version == data["version"]
+
+
+def test_watcher_recompiles_only_when_the_file_changes(tmp_path):
+    path = tmp_path / "lexicon.json"
+    _write(path, {"ECO": ["pago"]})
+    watcher = LexiconWatcher(path, check_interval=0)
+
+    first = watcher.get()
+    assert watcher.get() is first and watcher.loads == 1
+    assert first.classify("pago") == "ECO"
+
+    _write(path, {"ECO": ["pago"], "PLAZO": ["cronograma"]}, version=2)
+    second = watcher.get()
+    assert second is not first and watcher.loads == 2
+    assert second.version == 2 and second.classify("el cronograma") == "PLAZO"
+
+
+def test_invalid_file_keeps_the_current_classifier(tmp_path, capsys):
+    path = tmp_path / "lexicon.json"
+    _write(path, {"ECO": ["pago"]})
+    watcher = LexiconWatcher(path, check_interval=0)
+    current = watcher.get()
+
+    path.write_text("{ roto", encoding="utf-8")
+    assert watcher.get() is current
+    assert watcher.get() is current
+    assert capsys.readouterr().out.count("[LEXICON WARN]") == 1
+
+    path.unlink()
+    assert watcher.get() is current and watcher.loads == 1
+
+
+def test_first_load_failure_is_raised(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LexiconWatcher(tmp_path / "no-existe.json").get()
+
+
+@pytest.mark.parametrize("data", [
+    [],
+    {"categories": {"A": ["x"]}},
+    {"version": 1, "categories": {}},
+    {"version": 1, "categories": {"OTRO": ["x"]}},
+    {"version": 1, "categories": {"A": "x"}},
+    {"version": 1, "categories": {"A": ["x"]}, "priority": "A"},
+])
+def test_invalid_lexicons_are_rejected(tmp_path, data):
+    path = tmp_path / "lexicon.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_lexicon(path)
+
+
+def test_yaml_lexicon(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "lexicon.yaml"
+    path.write_text("version: 3\npriority: [B, A]\ncategories:\n  A: [pago]\n  B: [plazo]\n", encoding="utf-8")
+
+    classifier = load_lexicon(path)
+    assert classifier.version == 3 and classifier.keywords == {"A": ["pago"], "B": ["plazo"]}
+    assert classifier.classify("pago y plazo") == "B"
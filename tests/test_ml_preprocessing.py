@@ -0,0 +1,68 @@
+"""Normalización sin acentos y versión de la limpieza guardada en los modelos ML."""
+
+import unicodedata
+
+import pytest
+
+from src.classifier import ml_based
+from src.classifier.ml_based import ModelVersionError, PREPROCESSING_VERSION, clean_text
+from src.utils.text_normalizer import fold_text, strip_accents
+
+from conftest import ROOT
+
+
+def _nfd_fold(text):
+    """Referencia: NFD completo sin marcas diacríticas."""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    return "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+
+
+@pytest.mark.parametrize("text", [
+    "Garantía ÚNICA de cumplimiento",
+    "pingüino, Ñandú y CAÑÓN",
+    "Ça été, naïve Æsir; øre",
+    "ǅemal ẞtraße é",  # fuera de la tabla precalculada y texto ya descompuesto
+    "solo ascii 1.234,56",
+])
+def test_folding_matches_full_nfd(text):
+    assert fold_text(text) == _nfd_fold(text)
+
+
+def test_enie_can_be_kept():
+    assert strip_accents("Año, CAÑÓN y pingüino", keep_enie=True) == "Año, CAÑON y pinguino"
+    assert fold_text("Año, CAÑÓN", keep_enie=True) == "año, cañon"
+    assert strip_accents("Año") == "Ano"
+
+
+def test_clean_text_folds_accents_and_keeps_enie():
+    assert clean_text("Año 2024: Garantía ÚNICA, pingüino https://x.ec @juan") == "año garantia unica pinguino"
+    assert clean_text(None) == ""
+
+
+@pytest.fixture
+def trained_model(tmp_path):
+    pytest.importorskip("sklearn")
+    pytest.importorskip("joblib")
+    model_path = tmp_path / "modelo.joblib"
+    ml_based.train_from_csv(ROOT / "data" / "training.csv", model_path=model_path, test_size=0.3)
+    return model_path
+
+
+def test_saved_model_records_the_preprocessing_version(trained_model):
+    bundle = ml_based.MLTextClassifier(model_path=trained_model).load()
+    assert bundle.metadata["preprocessing_version"] == PREPROCESSING_VERSION
+
+
+@pytest.mark.parametrize("version", [None, PREPROCESSING_VERSION - 1])
+def test_models_from_another_preprocessing_are_refused(trained_model, version):
+    import joblib
+
+    payload = joblib.load(trained_model)
+    if version is None:  # Modelo guardado antes de versionar la limpieza
+        del payload["metadata"]["preprocessing_version"]
+    else:
+        payload["metadata"]["preprocessing_version"] = version
+    joblib.dump(payload, trained_model)
+
+    with pytest.raises(ModelVersionError, match=r"v1 .* v2"):
+        ml_based.load_model(trained_model)
@@ -0,0 +1,94 @@
+"""Presupuestos de tiempo del OCR por página y por documento."""
+
+import time
+
+import pytest
+
+
+def _timeouts(result):
+    return {entry['page']: entry['budget'] for entry in result['metadata']['ocr_timeouts']}
+
+
+def test_slow_pages_are_skipped_by_the_page_budget(offline_extractor, make_pdf):
+    extractor = offline_extractor(ocr_page_timeout=0.05)
+    extractor.ocr_delay = 0.5
+    result = extractor.extract_text(make_pdf(3, scanned=[1, 3]), extract_tables=False)
+
+    assert _timeouts(result) == {1: 'pagina', 3: 'pagina'}
+    assert result['metadata']['partial'] is True
+    assert "OCR PAGINA" not in result['text']
+    assert "PÁGINA 2" in result['text']
+
+
+def test_document_budget_stops_ocr_once_exhausted(offline_extractor, make_pdf):
+    extractor = offline_extractor(document_timeout=1.0)
+    extractor.ocr_delay = 0.6
+    result = extractor.extract_text(make_pdf(4, scanned=[1, 2, 3, 4]), extract_tables=False)
+
+    assert "OCR PAGINA 1" in result['text']
+    assert _timeouts(result) == {2: 'documento', 3: 'documento', 4: 'documento'}
+    # Con el presupuesto ya agotado, las últimas páginas ni se intentan
+    assert 4 not in extractor.ocr_calls
+
+
+def test_budgets_are_unlimited_by_default(offline_extractor, make_pdf):
+    extractor = offline_extractor()
+    extractor.ocr_delay = 0.05
+    result = extractor.extract_text(make_pdf(2, scanned=[1, 2]), extract_tables=False)
+
+    assert result['metadata']['ocr_timeouts'] == []
+    assert result['metadata']['partial'] is False
+    assert extractor._ocr_budget(10, None) == (None, None)
+
+
+def test_tightest_budget_wins(offline_extractor):
+    extractor = offline_extractor(ocr_page_timeout=2)
+    assert extractor._ocr_budget(3, None) == (6, 'pagina')
+    timeout, budget = extractor._ocr_budget(3, deadline=time.time() + 1)
+    assert budget == 'documento' and 0 < timeout <= 1
+
+
+@pytest.fixture
+def tesseract_extractor(fake_tesseract, monkeypatch, tmp_path):
+    """Fábrica de PDFTextExtractor que reconoce por lotes con el Tesseract simulado."""
+    from src.utils import pdf_extractor
+
+    # El ejecutable es global del proceso: se restaura al terminar la prueba
+    monkeypatch.setattr(pdf_extractor, "_tesseract_cmd", pdf_extractor._tesseract_cmd)
+    monkeypatch.setenv("FAKE_TESSERACT_LOG", str(tmp_path / "recognized.log"))
+
+    def make(**options):
+        return pdf_extractor.PDFTextExtractor(tesseract_path=fake_tesseract, **options)
+    return make
+
+
+def _recognized(tmp_path):
+    """Imágenes que el Tesseract simulado empezó a reconocer, en orden."""
+    log = tmp_path / "recognized.log"
+    return log.read_text(encoding="utf-8").split() if log.exists() else []
+
+
+def test_slow_page_is_isolated_within_its_batch(tesseract_extractor, make_pdf, monkeypatch, tmp_path):
+    monkeypatch.setenv("FAKE_TESSERACT_SLOW", "00002")
+    extractor = tesseract_extractor(ocr_page_timeout=0.5)
+    start = time.monotonic()
+    result = extractor.extract_text(make_pdf(4, scanned=[1, 2, 3, 4]), extract_tables=False)
+
+    assert time.monotonic() - start < 4
+    assert _timeouts(result) == {2: 'pagina'}
+    # Cada página se reconoce una sola vez: las siguientes a la lenta, en otra ejecución
+    assert _recognized(tmp_path) == ["00001.pgm", "00002.pgm", "00003.pgm", "00004.pgm"]
+    for page in (1, 3, 4):
+        assert f"spa:0000{page}.pgm" in result['text']
+
+
+def test_document_budget_bounds_the_batch(tesseract_extractor, make_pdf, monkeypatch, tmp_path):
+    monkeypatch.setenv("FAKE_TESSERACT_SLOW", "00002")
+    extractor = tesseract_extractor(ocr_page_timeout=30, document_timeout=1.5)
+    start = time.monotonic()
+    result = extractor.extract_text(make_pdf(4, scanned=[1, 2, 3, 4]), extract_tables=False)
+
+    assert time.monotonic() - start < 4
+    assert "spa:00001.pgm" in result['text']
+    assert _timeouts(result) == {2: 'documento', 3: 'documento', 4: 'documento'}
+    assert _recognized(tmp_path) == ["00001.pgm", "00002.pgm"]
@@ -0,0 +1,41 @@
+"""Decisión de OCR página por página."""
+
+
+def _decisions(result):
+    return {page['page']: (page['ocr'], page['reason']) for page in result['metadata']['page_ocr']}
+
+
+def test_only_pages_without_text_layer_are_recognized(offline_extractor, make_pdf):
+    extractor = offline_extractor()
+    result = extractor.extract_text(make_pdf(4, scanned=[2], blank=[4]), extract_tables=False)
+
+    assert _decisions(result) == {
+        1: (False, 'texto_suficiente'),
+        2: (True, 'sin_texto'),
+        3: (False, 'texto_suficiente'),
+        4: (False, 'sin_imagenes'),
+    }
+    assert extractor.ocr_calls == [2]
+    assert "OCR PAGINA 2" in result['text']
+    assert "OCR PAGINA 1" not in result['text']
+
+
+def test_use_ocr_forces_every_page(offline_extractor, make_pdf):
+    extractor = offline_extractor()
+    result = extractor.extract_text(make_pdf(3), use_ocr=True, extract_tables=False)
+
+    assert set(_decisions(result).values()) == {(True, 'forzado')}
+    assert extractor.ocr_calls == [1, 2, 3]
+
+
+def test_unreadable_text_layer_needs_ocr(offline_extractor):
+    extractor = offline_extractor(ocr_min_chars=10)
+    page = {'chars': 50, 'garbage_ratio': 0.6, 'has_images': False}
+    assert extractor._needs_ocr(page) == (True, 'texto_ilegible')
+    assert extractor._needs_ocr(dict(page, garbage_ratio=0.0)) == (False, 'texto_suficiente')
+
+
+def test_min_chars_threshold_decides_short_pages(offline_extractor):
+    page = {'chars': 40, 'garbage_ratio': 0.0, 'has_images': True}
+    assert offline_extractor(ocr_min_chars=100)._needs_ocr(page) == (True, 'sin_texto')
+    assert offline_extractor(ocr_min_chars=30)._needs_ocr(page) == (False, 'texto_suficiente')
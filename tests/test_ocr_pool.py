@@ -0,0 +1,77 @@
+"""Pool de motores OCR compartido (OCREnginePool)."""
+
+import itertools
+
+import pytest
+
+from src.utils import ocr_pool
+from src.utils.ocr_pool import OCREnginePool, get_ocr_pool
+
+
+def _counting_pool(size: int) -> OCREnginePool:
+    counter = itertools.count(1)
+    return OCREnginePool(lambda: f"motor-{next(counter)}", size=size)
+
+
+def test_engines_are_created_lazily_and_reused_most_recent_first():
+    pool = _counting_pool(3)
+    assert pool.created == 0
+
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert pool.created == 2
+
+    with pool.checkout() as engine:
+        assert engine == second
+    assert pool.created == 2
+
+
+def test_size_bounds_concurrent_checkouts():
+    pool = _counting_pool(1)
+    engine = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+    pool.release(engine)
+    assert pool.acquire(timeout=0.01) == engine
+
+
+def test_discarded_engines_are_replaced_on_demand():
+    pool = _counting_pool(1)
+    pool.discard(pool.acquire())
+    assert pool.created == 0
+    assert pool.acquire(timeout=0.01) == "motor-2"
+
+
+def test_failed_factory_frees_its_slot():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("modelo no disponible")
+        return "motor"
+
+    pool = OCREnginePool(factory, size=1)
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+    assert pool.created == 0
+    assert pool.acquire(timeout=0.01) == "motor"
+
+
+def test_warm_creates_up_to_the_pool_size():
+    pool = _counting_pool(2)
+    assert pool.warm(5) == 2
+    assert pool.warm() == 2
+    assert {pool.acquire(), pool.acquire()} == {"motor-1", "motor-2"}
+
+
+def test_shared_pools_are_keyed_and_sized_from_env(monkeypatch):
+    monkeypatch.setattr(ocr_pool, "_pools", {})
+    monkeypatch.setenv("OCR_POOL_SIZE", "3")
+
+    pool = get_ocr_pool(("easyocr", "es"), object)
+    assert pool.size == 3
+    assert get_ocr_pool(("easyocr", "es"), object, size=1) is pool
+    assert get_ocr_pool(("easyocr", "en"), object) is not pool
@@ -0,0 +1,63 @@
+"""Resolución adaptativa, enderezado y binarización para OCR (ocr_preprocess)."""
+
+import math
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+np = pytest.importorskip("numpy")
+
+from src.utils import ocr_preprocess as pre  # noqa: E402
+from src.utils.pdf_document import PDFDocument, pixmap_to_array  # noqa: E402
+
+
+def test_otsu_splits_ink_from_paper():
+    gray = np.array([[30] * 50 + [220] * 150], dtype=np.uint8)
+    assert 30 <= pre.otsu_threshold(gray) < 220
+    assert pre.otsu_threshold(np.zeros((0, 0), dtype=np.uint8)) == 128
+
+
+@pytest.mark.parametrize("line_px, expected", [
+    (None, pre.MAX_OCR_DPI),
+    (30, 150),      # a 100 dpi ya mide lo suficiente: mínimo
+    (14, 225),      # 30 * 100 / 14 = 214 -> múltiplo de 25 superior
+    (4, pre.MAX_OCR_DPI),
+])
+def test_choose_dpi_targets_line_height_within_bounds(line_px, expected):
+    assert pre.choose_dpi(line_px) == expected
+
+
+def test_line_height_is_the_median_text_band():
+    profile = np.zeros(200, dtype=np.int64)
+    for top, height in ((10, 8), (40, 10), (70, 10), (100, 12), (130, 10)):
+        profile[top:top + height] = 50
+    assert pre.estimate_line_height(profile, page_height=200) == 10.0
+    assert pre.estimate_line_height(profile[:60], page_height=200) is None
+
+
+def test_skew_of_tilted_lines_is_recovered():
+    ys, xs = [], []
+    slope = math.tan(math.radians(2.0))
+    for base in range(40, 400, 40):
+        for x in range(0, 600, 2):
+            for dy in range(4):
+                ys.append(base + dy + x * slope)
+                xs.append(x)
+    skew = pre.estimate_skew(np.round(ys).astype(np.int64), np.array(xs))
+    assert skew == pytest.approx(2.0, abs=pre.SKEW_STEP_DEGREES)
+
+
+def test_probe_of_a_text_page_gives_a_line_height(make_pdf):
+    with PDFDocument(make_pdf(1)) as session:
+        probe = session.render_page(0, dpi=pre.PROBE_DPI, grayscale=True)
+    line_px, skew = pre.analyze_probe(probe)
+    assert line_px is not None and skew == 0.0
+    assert pre.MIN_OCR_DPI <= pre.choose_dpi(line_px) <= pre.MAX_OCR_DPI
+
+
+def test_binarize_returns_black_and_white_gray(make_pdf):
+    with PDFDocument(make_pdf(1)) as session:
+        rgb = session.render_page(0, dpi=50)
+    bw = pre.binarize(rgb)
+    assert (bw.n, bw.width, bw.height) == (1, rgb.width, rgb.height)
+    assert set(np.unique(pixmap_to_array(bw))) <= {0, 255}
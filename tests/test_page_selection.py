@@ -0,0 +1,52 @@
+"""Selección de páginas y modo triage."""
+
+import pytest
+
+from src.utils.pdf_extractor import (TRIAGE_HEAD_PAGES, TRIAGE_SAMPLE_PAGES, parse_page_ranges,
+                                     select_pages, triage_sample)
+
+
+@pytest.mark.parametrize("pages, expected", [
+    (None, None),
+    ("  ", None),
+    ([], None),
+    ("1-5, 8,10-", [(1, 5), (8, 8), (10, None)]),
+    ([3, 1], [(3, 3), (1, 1)]),
+])
+def test_page_ranges_are_parsed(pages, expected):
+    assert parse_page_ranges(pages) == expected
+
+
+@pytest.mark.parametrize("pages", ["0", "5-2", "uno", "1,,2", [0]])
+def test_invalid_page_ranges_are_rejected(pages):
+    with pytest.raises(ValueError):
+        parse_page_ranges(pages)
+
+
+def test_selection_is_zero_based_sorted_and_clipped():
+    assert select_pages(10, "8-,2,1-3") == [0, 1, 2, 7, 8, 9]
+    assert select_pages(4, "3-9,20") == [2, 3]
+    assert select_pages(3) == [0, 1, 2]
+
+
+def test_triage_keeps_the_head_and_spreads_the_rest():
+    sample = triage_sample(range(100))
+    assert len(sample) == TRIAGE_SAMPLE_PAGES
+    assert sample[:TRIAGE_HEAD_PAGES] == list(range(TRIAGE_HEAD_PAGES))
+    assert sample[-1] == 99 and sample == sorted(set(sample))
+    assert triage_sample(range(7)) == list(range(7))
+
+
+def test_triage_extraction_reads_only_the_text_layer(offline_extractor, make_pdf):
+    extractor = offline_extractor()
+    result = extractor.extract_text(make_pdf(20, scanned=[2], tables=[3]), triage=True)
+
+    assert len(result['metadata']['page_ocr']) == TRIAGE_SAMPLE_PAGES
+    assert extractor.ocr_calls == []
+    assert result['tables'] == []
+
+
+def test_extraction_honours_the_selection(offline_extractor, make_pdf):
+    result = offline_extractor().extract_text(make_pdf(5, tables=[4]), pages="2,4-")
+    assert [page['page'] for page in result['metadata']['page_ocr']] == [2, 4, 5]
+    assert [table['page'] for table in result['tables']] == [4]
@@ -0,0 +1,69 @@
+"""Reutilización de páginas entre revisiones de un pliego (page_store)."""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from src.utils.extraction_cache import ExtractionCache  # noqa: E402
+
+
+def _stored_pages(store: ExtractionCache) -> int:
+    return sum(1 for _ in store._entries())
+
+
+def _with_addendum(data: bytes) -> bytes:
+    """Nueva revisión: una página de adenda al principio y el resto sin cambios."""
+    doc = fitz.open(stream=data, filetype="pdf")
+    page = doc.new_page(pno=0, width=595, height=842)
+    page.insert_text((72, 72), "ADENDA 1: se modifica el plazo de entrega", fontsize=11)
+    data = doc.tobytes(garbage=3)
+    doc.close()
+    return data
+
+
+def _hits(result):
+    return [page['page'] for page in result['metadata']['page_cache']['pages'] if page['hit']]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ExtractionCache(str(tmp_path / "paginas"))
+
+
+def test_unchanged_pages_are_reused_in_a_new_revision(offline_extractor, make_pdf, store):
+    first = make_pdf(4, scanned=[2], tables=[3])
+    offline_extractor(page_store=store).extract_text(first)
+
+    extractor = offline_extractor(page_store=store)
+    result = extractor.extract_text(_with_addendum(first))
+
+    assert extractor.ocr_calls == []
+    assert _hits(result) == [3, 4]
+    assert [table['page'] for table in result['tables']] == [4]
+    assert "OCR PAGINA 2" in result['text']
+
+
+def test_changed_pages_are_extracted_again(offline_extractor, make_pdf, store):
+    offline_extractor(page_store=store).extract_text(make_pdf(2, scanned=[2], label="v1"))
+
+    extractor = offline_extractor(page_store=store)
+    result = extractor.extract_text(make_pdf(2, scanned=[2], label="v2"))
+
+    assert _hits(result) == []
+    assert extractor.ocr_calls == [2]
+
+
+def test_only_ocr_and_table_pages_are_persisted(offline_extractor, make_pdf, store):
+    offline_extractor(page_store=store).extract_text(make_pdf(6, scanned=[2], tables=[5]))
+    assert _stored_pages(store) == 2
+
+    # Sin prefiltro, pdfplumber recorre cada página: todas son caras de rehacer
+    offline_extractor(page_store=store, table_prefilter=False).extract_text(make_pdf(3))
+    assert _stored_pages(store) == 2 + 3
+
+
+def test_pages_that_ran_out_of_time_are_not_persisted(offline_extractor, make_pdf, store):
+    extractor = offline_extractor(page_store=store, ocr_page_timeout=0.05)
+    extractor.ocr_delay = 0.5
+    extractor.extract_text(make_pdf(2, scanned=[1]), extract_tables=False)
+    assert _stored_pages(store) == 0
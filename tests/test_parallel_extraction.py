@@ -0,0 +1,66 @@
+"""Extracción paralela por bloques de páginas (PDFTextExtractor con workers > 1)."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utils import pdf_extractor
+
+
+def _comparable(result):
+    """Resultado sin las partes que dependen del tiempo o del proceso."""
+    metadata = result['metadata']
+    return {
+        'text': result['text'],
+        'tables': result['tables'],
+        'pages_extracted': metadata['pages_extracted'],
+        'page_ocr': [{k: v for k, v in page.items() if k != 'seconds'} for page in metadata['page_ocr']],
+        'table_pages_skipped': metadata['table_pages_skipped'],
+    }
+
+
+def test_parallel_output_matches_serial(offline_extractor, make_pdf):
+    data = make_pdf(10, scanned=[4], tables=[2, 7])
+    serial = offline_extractor().extract_text(data)
+    parallel = offline_extractor(workers=2, min_pages_per_shard=2).extract_text(data)
+
+    assert _comparable(parallel) == _comparable(serial)
+    assert [page['page'] for page in parallel['metadata']['timings']['pages']] == list(range(1, 11))
+    assert "OCR PAGINA 4" in parallel['text']
+
+
+def test_shards_are_contiguous_and_cover_every_page(offline_extractor):
+    extractor = offline_extractor(workers=3, min_pages_per_shard=2)
+    pages = list(range(23))
+    shards = extractor._page_shards(pages)
+
+    assert [page for shard in shards for page in shard] == pages
+    assert len(shards) <= extractor.workers * 4
+    assert all(len(shard) >= extractor.min_pages_per_shard for shard in shards)
+
+
+def test_small_documents_stay_in_process(offline_extractor):
+    extractor = offline_extractor(workers=4, min_pages_per_shard=4)
+    assert extractor._page_pool(7) is None
+    assert offline_extractor(workers=1)._page_pool(100) is None
+
+
+def test_workers_receive_the_pdf_once_and_shards_only_pages(offline_extractor, make_pdf, monkeypatch):
+    data = make_pdf(12)
+    calls = {'initargs': [], 'submits': []}
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, *args, initargs=(), **kwargs):
+            calls['initargs'].append(initargs)
+            super().__init__(*args, initargs=initargs, **kwargs)
+
+        def submit(self, fn, *args, **kwargs):
+            calls['submits'].append(args)
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(pdf_extractor, 'ProcessPoolExecutor', RecordingPool)
+    result = offline_extractor(workers=2, min_pages_per_shard=2).extract_text(data)
+
+    assert result['metadata']['pages_extracted'] == list(range(1, 13))
+    assert [args[0] for args in calls['initargs']] == [data]
+    assert len(calls['submits']) > 1
+    assert not any(isinstance(arg, (bytes, bytearray, memoryview))
+                   for args in calls['submits'] for arg in args)
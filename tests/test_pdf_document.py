@@ -0,0 +1,96 @@
+"""Sesión de documento compartida (PDFDocument) y entrega de pixmaps al OCR."""
+
+import io
+
+import pytest
+
+pytest.importorskip("fitz")
+np = pytest.importorskip("numpy")
+
+from src.utils import pdf_extractor  # noqa: E402
+from src.utils.pdf_document import (  # noqa: E402
+    PDFDocument, pixmap_to_array, pixmap_to_image, read_pdf_source,
+)
+
+
+def test_session_opens_pdfplumber_lazily_and_once(make_pdf):
+    with PDFDocument(make_pdf(2, tables=[1])) as session:
+        assert session._plumber is None
+        first = session.plumber_page(0)
+        assert session.plumber_page(1).pdf is first.pdf
+    assert session._plumber is None
+
+
+def test_metadata_is_a_copy(make_pdf):
+    with PDFDocument(make_pdf(3)) as session:
+        session.metadata['pages'] = 99
+        assert session.metadata['pages'] == 3
+
+
+def test_extraction_opens_the_document_once(offline_extractor, make_pdf, monkeypatch):
+    opened = []
+
+    class CountingDocument(PDFDocument):
+        def __init__(self, source):
+            opened.append(source)
+            super().__init__(source)
+
+    monkeypatch.setattr(pdf_extractor, "PDFDocument", CountingDocument)
+    offline_extractor().extract_text(make_pdf(3, scanned=[2], tables=[3]))
+    assert len(opened) == 1
+
+
+def test_pixmap_views_share_the_pixmap_buffer(make_pdf):
+    with PDFDocument(make_pdf(1)) as session:
+        gray = session.render_page(0, dpi=50, grayscale=True)
+        rgb = session.render_page(0, dpi=50)
+
+    array = pixmap_to_array(gray)
+    assert array.shape == (gray.height, gray.width)
+    assert np.shares_memory(array, np.frombuffer(gray.samples_mv, dtype=np.uint8))
+    assert array.tobytes() == gray.samples
+
+    assert pixmap_to_array(rgb).shape == (rgb.height, rgb.width, 3)
+    image = pixmap_to_image(rgb)
+    assert image.mode == 'RGB' and image.size == (rgb.width, rgb.height)
+    assert image.tobytes() == rgb.samples
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+def test_in_memory_sources_read_like_files(tmp_path, make_pdf, wrap):
+    data = make_pdf(1)
+    path = tmp_path / "pliego.pdf"
+    path.write_bytes(data)
+
+    assert read_pdf_source(path) == read_pdf_source(str(path)) == data
+    assert read_pdf_source(wrap(data)) == data
+    with PDFDocument(wrap(data)) as session:
+        assert session.path is None and session.source == data
+
+
+def test_missing_path_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_pdf_source(tmp_path / "no_existe.pdf")
+
+
+def test_uploads_extract_like_paths(tmp_path, offline_extractor, make_pdf):
+    data = make_pdf(2, tables=[2])
+    path = tmp_path / "pliego.pdf"
+    path.write_bytes(data)
+
+    from_stream = offline_extractor().extract_text(io.BytesIO(data))
+    from_path = offline_extractor().extract_text(str(path))
+    assert from_stream['text'] == from_path['text']
+    assert from_stream['tables'] == from_path['tables']
+
+
+def test_paths_are_opened_without_loading_the_file(tmp_path, make_pdf):
+    path = tmp_path / "pliego.pdf"
+    path.write_bytes(make_pdf(2, tables=[2]))
+
+    with PDFDocument(path) as session:
+        assert session.data is None and session.source == str(path)
+        assert session.page_count == 2
+        assert session.plumber_page(1).find_tables()
+    with pytest.raises(FileNotFoundError):
+        PDFDocument(tmp_path / "no_existe.pdf")
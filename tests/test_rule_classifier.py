@@ -0,0 +1,48 @@
+"""Clasificador por palabras clave con índice de palabras (KeywordClassifier)."""
+
+import pytest
+
+from src.classifier.rule_based import (KeywordClassifier, _build_keyword_patterns, _normalize,
+                                       get_categories)
+
+SAMPLES = [
+    "El contratista deberá cumplir con todas las normas y leyes vigentes.",
+    "Los precios unitarios y el presupuesto incluyen el anticipo; pagos contra factura.",
+    "Se exige póliza de seguro y GARANTÍA DE CUMPLIMIENTO, además de una garantía   de calidad.",
+    "La entrega parcial del cronograma y la fecha de entrega final son hitos; entregables: tres.",
+    "Texto sin palabras del léxico, con números 1.234,56 y correo soporte@obra.ec",
+    "plazo-entrega/obra: técnicos, especificaciones, materiales; alcances.",
+]
+
+
+def _regex_scores(categories, text):
+    """Recuento de referencia: un `findall` por keyword, como antes del índice."""
+    norm = _normalize(text)
+    return {cat: sum(len(pat.findall(norm)) for pat in pats)
+            for cat, pats in _build_keyword_patterns(categories).items()}
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_word_index_counts_match_the_regex_patterns(text):
+    categories = get_categories()
+    assert KeywordClassifier(categories).scores(text) == _regex_scores(categories, text)
+
+
+def test_keywords_with_symbols_keep_their_regex():
+    categories = {"A": ["c++", "s.a.", "norma iso"], "B": ["iso"]}
+    text = "Se usa C++ y la norma ISO 9001 de la S.A.; normas iso."
+    assert KeywordClassifier(categories).scores(text) == _regex_scores(categories, text)
+
+
+def test_plurals_accents_and_phrases_are_matched():
+    classifier = KeywordClassifier({"ECO": ["precio", "pago"], "GAR": ["garantía de calidad"]})
+    assert classifier.scores("PRECIOS, precioes y Pagos") == {"ECO": 3, "GAR": 0}
+    assert classifier.scores("la garantia de calidad; garantía  de calidad") == {"ECO": 0, "GAR": 1}
+
+
+def test_ties_are_broken_by_priority_and_no_match_is_otro():
+    classifier = KeywordClassifier({"A": ["pago"], "B": ["plazo"]}, priority=("B", "A"))
+    assert classifier.classify("pago y plazo") == "B"
+    assert classifier.classify("pago, pago y plazo") == "A"
+    assert classifier.classify("nada que ver") == "OTRO"
+    assert KeywordClassifier({"A": ["pago"], "B": ["plazo"]}, priority=()).classify("pago plazo") == "A"
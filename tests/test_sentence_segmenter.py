@@ -0,0 +1,36 @@
+"""Segmentación de oraciones en una sola pasada (iter_sentence_spans)."""
+
+import pytest
+
+from src.classifier.rule_based import classify_paragraph, iter_sentence_spans
+
+
+def _sentences(text):
+    return [text[start:end] for start, end in iter_sentence_spans(text)]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Primera oración. Segunda oración? Tercera!", ["Primera oración.", "Segunda oración?", "Tercera!"]),
+    ("Firma el Ing. Pérez y la Dra. Ruiz. Fin.", ["Firma el Ing. Pérez y la Dra. Ruiz.", "Fin."]),
+    ("Oferta de Obras S.A.S. con RUC. Adjunta.", ["Oferta de Obras S.A.S. con RUC.", "Adjunta."]),
+    ("Empresa de U.S.A. contratada. Listo.", ["Empresa de U.S.A. contratada.", "Listo."]),
+    ("Ver www.compraspublicas.gob.ec. y https://sercop.gob.ec/a.b. Luego.",
+     ["Ver www.compraspublicas.gob.ec. y https://sercop.gob.ec/a.b. Luego."]),
+    ("Escriba a soporte@obra.ec. Gracias.", ["Escriba a soporte@obra.ec.", "Gracias."]),
+    ("El monto es 3.50 USD y 1.234,56. Fin", ["El monto es 3.50 USD y 1.234,56.", "Fin"]),
+    ("Título sin punto\nCuerpo del texto.\r\n\r\nOtro", ["Título sin punto", "Cuerpo del texto.", "Otro"]),
+])
+def test_sentence_boundaries(text, expected):
+    assert _sentences(text) == expected
+
+
+def test_spans_exclude_surrounding_whitespace():
+    text = "  Hola.   Adiós.  \n\n  "
+    assert list(iter_sentence_spans(text)) == [(2, 7), (10, 16)]
+    assert list(iter_sentence_spans("   \n ")) == []
+
+
+def test_paragraph_classification_uses_the_segmenter():
+    result = classify_paragraph("El presupuesto es alto. Ver www.ejemplo.com. Fin")
+    assert [item["texto"] for item in result] == ["El presupuesto es alto.", "Ver www.ejemplo.com. Fin"]
+    assert classify_paragraph(None) == []
@@ -0,0 +1,34 @@
+"""Motor de tablas seleccionable (pdfplumber o find_tables de PyMuPDF)."""
+
+import pytest
+
+
+def test_both_backends_find_the_ruled_table(offline_extractor, make_pdf):
+    data = make_pdf(3, tables=[2])
+    plumber = offline_extractor().extract_text(data)['tables']
+    pymupdf = offline_extractor(table_backend='pymupdf').extract_text(data)['tables']
+
+    assert [table['page'] for table in pymupdf] == [table['page'] for table in plumber] == [2]
+    assert pymupdf[0]['table'] == plumber[0]['table']
+    assert pymupdf[0]['table'][0] == ["F0C0", "F0C1", "F0C2"]
+
+
+def test_pdfplumber_settings_are_translated_for_find_tables(offline_extractor):
+    extractor = offline_extractor(table_backend='pymupdf', table_settings={
+        "vertical_strategy": "lines",
+        "horizontal_strategy": "text",
+        "snap_tolerance": 4,
+        "keep_blank_chars": True,
+        "explicit_vertical_lines": [100, 200],
+    })
+    assert extractor._pymupdf_table_settings() == {
+        "vertical_strategy": "lines",
+        "horizontal_strategy": "text",
+        "snap_tolerance": 4,
+        "vertical_lines": [100, 200],
+    }
+
+
+def test_unknown_backend_is_rejected(offline_extractor):
+    with pytest.raises(ValueError):
+        offline_extractor(table_backend='camelot')
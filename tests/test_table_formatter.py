@@ -0,0 +1,40 @@
+"""Formateo de tablas sin pandas (format_tables)."""
+
+import pytest
+
+from src.utils.table_formatter import format_tables
+
+RAGGED = [{'page': 3, 'table': [["Ítem", "Cantidad", "Precio"], ["Cemento", None], ["Arena|fina", "2", "10.5"]]}]
+
+
+def _row(*cells):
+    return " | ".join(f"{cell:<30}" for cell in cells) + "\n"
+
+
+def test_text_format_keeps_previous_pandas_rendering():
+    # pandas (object dtype) rellenaba las filas cortas con None y str(None) == "None"
+    assert format_tables(RAGGED) == (
+        "\n\nTABLA 1 (Página 3):\n"
+        + _row("Ítem", "Cantidad", "Precio")
+        + _row("Cemento", "None", "None")
+        + _row("Arena|fina", "2", "10.5")
+    )
+
+
+def test_tsv_and_markdown_leave_missing_cells_empty():
+    tsv = format_tables(RAGGED, table_format='tsv')
+    assert tsv.splitlines()[3:] == ["Ítem\tCantidad\tPrecio", "Cemento\t\t", "Arena|fina\t2\t10.5"]
+
+    markdown = format_tables(RAGGED, table_format='markdown').splitlines()
+    assert markdown[3:] == [
+        "| Ítem | Cantidad | Precio |",
+        "| --- | --- | --- |",
+        "| Cemento |  |  |",
+        "| Arena\\|fina | 2 | 10.5 |",
+    ]
+
+
+def test_empty_tables_keep_their_header_and_unknown_formats_fail():
+    assert format_tables([{'page': 1, 'table': []}]) == "\n\nTABLA 1 (Página 1):\n"
+    with pytest.raises(ValueError):
+        format_tables(RAGGED, table_format='html')
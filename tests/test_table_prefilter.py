@@ -0,0 +1,45 @@
+"""Prefiltro de tablas por líneas dibujadas (PDFTextExtractor._may_have_tables)."""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from src.utils.pdf_document import PDFDocument  # noqa: E402
+
+
+def _framed_page_pdf() -> bytes:
+    """Una página con texto dentro de un único recuadro (no es una tabla)."""
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.draw_rect(fitz.Rect(72, 72, 523, 200), color=(0, 0, 0), width=0.6)
+    page.insert_text((80, 100), "Aviso importante", fontsize=11)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_only_pages_with_rulings_reach_pdfplumber(offline_extractor, make_pdf):
+    extractor = offline_extractor()
+    with PDFDocument(make_pdf(2, tables=[2])) as session:
+        assert [extractor._may_have_tables(session, n) for n in range(2)] == [False, True]
+    with PDFDocument(_framed_page_pdf()) as session:
+        assert extractor._may_have_tables(session, 0) is False
+
+
+def test_prefilter_skips_pages_without_losing_tables(offline_extractor, make_pdf):
+    data = make_pdf(4, tables=[1, 3])
+    filtered = offline_extractor().extract_text(data)
+    unfiltered = offline_extractor(table_prefilter=False).extract_text(data)
+
+    assert filtered['tables'] == unfiltered['tables']
+    assert [table['page'] for table in filtered['tables']] == [1, 3]
+    assert filtered['metadata']['table_pages_skipped'] == 2
+    assert unfiltered['metadata']['table_pages_skipped'] == 0
+
+
+@pytest.mark.parametrize("settings", [
+    {"vertical_strategy": "text", "horizontal_strategy": "lines"},
+    {"vertical_strategy": "lines", "horizontal_strategy": "lines", "explicit_vertical_lines": [100]},
+])
+def test_prefilter_is_disabled_when_tables_need_no_rulings(offline_extractor, settings):
+    assert offline_extractor(table_settings=settings).table_prefilter is False
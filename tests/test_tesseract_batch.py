@@ -0,0 +1,95 @@
+"""Reconocimiento por lotes (tesseract_batch) con un Tesseract simulado."""
+
+import os
+import threading
+import time
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="usa scripts de shell como ejecutable")
+
+from src.utils import tesseract_batch  # noqa: E402
+from src.utils.tesseract_batch import TesseractBatchError, TesseractTimeout, recognize_batch  # noqa: E402
+
+
+def _pixmaps(*channels):
+    for n in channels:
+        space = fitz.csGRAY if n == 1 else fitz.csRGB
+        pix = fitz.Pixmap(space, fitz.IRect(0, 0, 8, 8), False)
+        pix.clear_with(255)
+        yield pix
+
+
+def test_one_run_returns_each_page_in_order(fake_tesseract):
+    pages = recognize_batch(fake_tesseract, _pixmaps(1, 3, 1), lang='spa')
+    assert pages == ["spa:00000.pgm", "spa:00001.ppm", "spa:00002.pgm"]
+    assert recognize_batch(fake_tesseract, []) == []
+
+
+def test_language_is_chosen_once_from_installed_data(fake_tesseract):
+    tesseract_batch.tesseract_languages.cache_clear()
+    tesseract_batch.select_language.cache_clear()
+    try:
+        assert tesseract_batch.tesseract_languages(fake_tesseract) == {"eng", "spa"}
+        assert tesseract_batch.select_language(fake_tesseract) == "spa"
+        assert tesseract_batch.select_language(fake_tesseract, "deu") is None
+    finally:
+        tesseract_batch.tesseract_languages.cache_clear()
+        tesseract_batch.select_language.cache_clear()
+
+
+def _script(tmp_path, name: str, body: str) -> str:
+    path = tmp_path / name
+    path.write_text(f"#!/bin/sh\n{body}\n", encoding="utf-8")
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_failures_and_short_output_raise(tmp_path):
+    failing = _script(tmp_path, "failing", "echo 'sin datos' >&2\nexit 1")
+    with pytest.raises(TesseractBatchError, match="código 1"):
+        recognize_batch(failing, _pixmaps(1))
+
+    silent = _script(tmp_path, "silent", "exit 0")
+    with pytest.raises(TesseractBatchError, match="1 páginas para 2"):
+        recognize_batch(silent, _pixmaps(1, 1))
+
+    with pytest.raises(TesseractBatchError):
+        recognize_batch(str(tmp_path / "no_existe"), _pixmaps(1))
+
+
+def test_timeout_kills_the_run(fake_tesseract, monkeypatch):
+    monkeypatch.setenv("FAKE_TESSERACT_DELAY", "5")
+    start = time.monotonic()
+    with pytest.raises(TesseractTimeout):
+        recognize_batch(fake_tesseract, _pixmaps(1), timeout=0.3)
+    assert time.monotonic() - start < 3
+
+
+def test_page_timeout_keeps_the_pages_already_recognized(fake_tesseract, monkeypatch):
+    monkeypatch.setenv("FAKE_TESSERACT_SLOW", "00001")
+    start = time.monotonic()
+    with pytest.raises(TesseractTimeout) as info:
+        recognize_batch(fake_tesseract, _pixmaps(1, 1, 1), lang='spa', page_timeout=0.5)
+
+    assert time.monotonic() - start < 3
+    assert info.value.page_limit is True
+    assert info.value.pages == ["spa:00000.pgm"]
+
+
+def test_cancel_stops_the_run(fake_tesseract, monkeypatch):
+    monkeypatch.setenv("FAKE_TESSERACT_DELAY", "5")
+    monkeypatch.setattr(tesseract_batch, "CANCEL_POLL_SECONDS", 0.05)
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    start = time.monotonic()
+    with pytest.raises(TesseractBatchError, match="cancelado"):
+        recognize_batch(fake_tesseract, _pixmaps(1), cancel=cancel)
+    assert time.monotonic() - start < 3
+
+
+def test_images_are_removed_after_the_run(fake_tesseract, monkeypatch, tmp_path):
+    monkeypatch.setattr(tesseract_batch.tempfile, "tempdir", str(tmp_path))
+    recognize_batch(fake_tesseract, _pixmaps(1, 1))
+    assert not [p for p in os.listdir(tmp_path) if p.startswith("neurobit_ocr_")]
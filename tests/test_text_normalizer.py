@@ -0,0 +1,73 @@
+"""Motor de normalización de texto compartido (LicitacionTextNormalizer)."""
+
+import re
+
+import pytest
+
+from src.utils.text_normalizer import LICITACION_PATTERNS, LicitacionTextNormalizer
+
+# Correcciones aplicadas una tras otra, como hacía el extractor antes del motor
+_SEQUENTIAL_CORRECTIONS = {
+    r'(\w)\s*-\s*(\w)': r'\1-\2',
+    r'ﬁ': 'fi',
+    r'ﬀ': 'ff',
+    r'ﬂ': 'fl',
+    r'(\d)\s+(\d)': r'\1\2',
+    r'\b([A-Z])\s+([A-Z])\b': r'\1\2',
+    r'\b(\d+)\s*\.\s*(\d+)\b': r'\1.\2',
+    r'\b([a-z])\s+([a-z])\b': r'\1\2',
+}
+
+
+def _sequential_correct(text: str) -> str:
+    for pattern, replacement in _SEQUENTIAL_CORRECTIONS.items():
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+@pytest.fixture
+def normalizer():
+    return LicitacionTextNormalizer()
+
+
+def test_noise_lines_are_dropped(normalizer):
+    text = (
+        "SERCOP SERVICIO NACIONAL DE CONTRATACIÓN PÚBLICA\n"
+        "  12 \n"
+        "Objeto del contrato\n"
+        "---\n"
+        "Código postal: 170507"
+    )
+    assert normalizer.filter_noise(text) == "Objeto del contrato"
+
+
+@pytest.mark.parametrize("text", [
+    "U S A valor 3 . 50 con ﬁrma y 1 000",
+    "pre - cio a b c de 12 . 5 y ﬂujo ﬀ",
+    "X Y Z 1 2 3 . 4 5 o p-q",
+])
+def test_single_pass_correction_matches_sequential_rules(normalizer, text):
+    assert normalizer.correct(text) == _sequential_correct(text)
+
+
+def test_correction_joins_split_tokens(normalizer):
+    assert normalizer.correct("U S A valor 3 . 50 con ﬁrma y 1 000") == "US A valor 3.50 con firma y 1000"
+
+
+def test_structure_is_marked_by_priority(normalizer):
+    marked = normalizer.mark_structure("CAPÍTULO IV - PLAZOS\n\n2.1 Alcance\nTexto normal")
+    assert marked.split("\n") == [
+        "", "SECCIÓN CAPÍTULO: PLAZOS", "",
+        "", "Subsección: Alcance", "",
+        "Texto normal",
+    ]
+
+
+def test_custom_structure_patterns_are_honoured():
+    normalizer = LicitacionTextNormalizer(dict(LICITACION_PATTERNS, item=r'^-\s*(.*)$', subsection=r'^$^'))
+    assert normalizer.mark_structure("- entregar planos") == "• entregar planos"
+
+
+def test_clean_repairs_mojibake_and_drops_control_chars():
+    text = "Compañ\x07Ã\xada  con   CÃ³digo y pre-  cio"
+    assert LicitacionTextNormalizer.clean(text) == "Compañía con Código y pre-cio"